@@ -163,6 +163,17 @@ class Indexed_PriorityQueue_Min:
         # Remove key
         self.keys[index] = None
         return index
+    
+    # Removes every index from the priority queue.
+    # Takes time proportional to the number of indices on the priority queue (not max_nodes), so one priority queue can be
+    # reused by many short searches (for example the witness searches in contraction_hierarchy.py).
+    def clear(self):
+        for i in range(1, self.node_count+1):
+            index = self.pq[i]
+            self.qp[index] = None
+            self.keys[index] = None
+            self.pq[i] = None
+        self.node_count = 0
 
 
     
@@ -32,7 +32,10 @@
 import sys
 import random
 
-def _partition(a,lo,hi):
+from tracing.tracer import Print_Tracer
+
+# tracer (see tracing/tracer.py) receives an event for every partition and exchange. None means no tracing.
+def _partition(a,lo,hi,tracer=None):
     #Initialize pointer i
     i = lo
     #Initialize pointer j
@@ -40,8 +43,8 @@ def _partition(a,lo,hi):
     
     # Determine the paritioning element, v, (in this case we always choose a[lo] (this is an arbitrary choice b/c we have already shuffled the array)
     v = a[lo]
-    print('Bounds of subarray being partitioned from lo to hi:', lo, 'to ', hi)
-    print('Partitioning element:', v)
+    if tracer is not None:
+        tracer.partition(a, lo, hi, v)
     
     while True:
         i = i+1
@@ -61,41 +64,39 @@ def _partition(a,lo,hi):
         if i < j:
         # a[i] and a[j] are on the wrong sides of the final index of the partitioning element. swap a[i] and a[j] so that they will be on the correct side of the final position of the partitioning element   
             exch(a,i,j)
-            print('Exchanged: a[',i,'] with a[',j,'].')
+            if tracer is not None:
+                tracer.exchange(a, i, j)
     
     # The while loop above has been broken b/c i and j have crossed (see if statement). Swap the partitioning element with a[j] so that all of the elements to the left of the final index position of the partitioning element are less than the partitioning element and so that all of the elements to the right of the final index position of the partitioning element are greater than the partioning element.     
-    print('Exchanged the partitioning element', v, 'at index:',lo, 'with a[j]', a[j], 'at index:',j)
     exch(a,lo,j)
-    
-    print('Final index position:', j, 'for the partitioning element:', v)
-    print(a)
-    print('Returned j value:', j)
-    print('\n')
+    if tracer is not None:
+        tracer.partition_done(a, lo, j, v)
     # Return the final index position of the partitioning element
     return j
             
 
 
-def _sort(a,lo,hi):
+def _sort(a,lo,hi,tracer=None):
     if hi <= lo: 
-        print('_sort returned without partitioning b/c hi <= lo:',hi,'<=',lo,'\n')
+        if tracer is not None:
+            tracer.sort_skipped(lo, hi)
         return
-    j = _partition(a,lo,hi)
-    _sort(a,lo,j-1)
-    _sort(a,j+1,hi)
+    j = _partition(a,lo,hi,tracer)
+    _sort(a,lo,j-1,tracer)
+    _sort(a,j+1,hi,tracer)
 
 
 
 
-def sort(a):
+def sort(a, tracer=None):
     N = len(a)
     lo = 0
     hi = N-1
     random.seed(1)
     random.shuffle(a)
-    print('Shuffled array with seed(1):',a)
-    print('\n')
-    _sort(a,lo,hi)
+    if tracer is not None:
+        tracer.shuffled(a)
+    _sort(a,lo,hi,tracer)
     
         
 def less(v, w):
@@ -119,7 +120,7 @@ def isSorted(a):
 def main():
     # Array of strings
     a = sys.stdin.readline().split(" ")
-    sort(a)
+    sort(a, tracer=Print_Tracer())
     print(a)
     assert isSorted(a)
     show(a)
@@ -0,0 +1,217 @@
+"""
+Title: bulk_loader.py
+Author: Ryan Borchardt
+
+Loads the graph files (tinyG.txt, tinyDG.txt, tinyEWG.txt, mediumEWG.txt, 10000EWG.txt, tinyEWD.txt etc.) in bulk using NumPy.
+
+The constructors of Graph_Array_AdjacencyLists, Digraph, Edge_Weighted_Graph and Edge_Weighted_Digraph parse the file one line at a time:
+    strip().split() and int()/float() for every line, then one call to addEdge() for every edge.
+For 10000EWG.txt, this means ~60,000 iterations of the slowest part of the Python interpreter (string handling and method calls).
+
+This module instead:
+    1. Reads the whole file in one pass and converts all of the numbers at once into a NumPy array (np.fromstring() runs in C).
+    2. Splits that array into int arrays (from vertex, towards vertex) and a float array (weight) for the edges.
+    3. Builds the graph in bulk from these arrays:
+        For the CSR graphs (graph_csr.py etc.), the offsets/targets/weights arrays are built with a vectorized counting sort (np.bincount, np.cumsum, np.argsort).
+        For the linked-list graphs, the edges are added with addEdge() from Python lists (no more string parsing for each line)
+        while the garbage collector is paused.
+
+The file format is the same: the first line is V, the second line is E and each of the other lines is an edge (v w or v w weight).
+The delimiter is optional (the default is whitespace), same as the constructors of the graph classes.
+
+The order of the edges in every adjacency list is the same as when the graph is built by its constructor (LIFO order of Bag_LinkedList).
+
+Time complexity: Proportional to V + E*lg(E) (the stable sort), but almost all of the work is done in C instead of in Python.
+Space complexity: Proportional to V + E
+
+Example:
+python bulk_loader.py edge_weighted_graphs/10000EWG.txt ' ' ewg
+python bulk_loader.py edge_weighted_digraphs/mediumEWD.txt ' ' ewd
+python bulk_loader.py undirected_graphs/mediumG.txt ' ' graph
+python bulk_loader.py directed_graphs/tinyDG.txt ' ' digraph
+"""
+
+import gc
+import sys
+import time
+from array import array
+
+import numpy as np
+
+from chapter_4.undirected_graphs.graph_array_adjacencylists import Graph_Array_AdjacencyLists
+from chapter_4.undirected_graphs.graph_csr import Graph_CSR
+from chapter_4.directed_graphs.digraph import Digraph
+from chapter_4.directed_graphs.digraph_csr import Digraph_CSR
+from chapter_4.edge_weighted_graphs.edge import Edge
+from chapter_4.edge_weighted_graphs.edge_weighted_graph import Edge_Weighted_Graph
+from chapter_4.edge_weighted_graphs.edge_weighted_graph_csr import Edge_Weighted_Graph_CSR
+from chapter_4.edge_weighted_digraphs.directed_edge import Directed_Edge
+from chapter_4.edge_weighted_digraphs.edge_weighted_digraph import Edge_Weighted_Digraph
+from chapter_4.edge_weighted_digraphs.edge_weighted_digraph_csr import Edge_Weighted_Digraph_CSR
+
+
+# Reads a graph file in one pass.
+# Returns (V, from_array, towards_array, weight_array) where the arrays are NumPy arrays (weight_array is None if weighted is False)
+def read_edge_arrays(filename, delimiter=None, weighted=False):
+    file_object = open(filename, 'r')
+    text = file_object.read()
+    file_object.close()
+
+    # np.fromstring() separates the numbers by whitespace (spaces, tabs and newlines), so any other delimiter is replaced by a space first.
+    if delimiter is not None and delimiter.strip() != '':
+        text = text.replace(delimiter, ' ')
+    values = np.fromstring(text, dtype=np.float64, sep=' ')
+
+    V = int(values[0])
+    # values[1] is the number of edges listed in the file. Like Edge_Weighted_Graph, E is determined from the edges that are actually there.
+    columns = 3 if weighted else 2
+    edge_values = values[2:]
+    edge_values = edge_values[:len(edge_values) - len(edge_values) % columns].reshape(-1, columns)
+
+    from_array = edge_values[:, 0].astype(np.int32)
+    towards_array = edge_values[:, 1].astype(np.int32)
+    if weighted:
+        weight_array = edge_values[:, 2].copy()
+    else:
+        weight_array = None
+    return V, from_array, towards_array, weight_array
+
+
+# Vectorized version of build_csr_arrays() in graph_csr.py/digraph_csr.py etc.
+# source_array[i] -> target_array[i] is the i-th entry added to the adjacency list of source_array[i] (in the order of addition).
+# Returns the offsets, targets and weights as typed arrays (array module) in the LIFO order of Bag_LinkedList.
+def csr_arrays(V, source_array, target_array, weight_array=None):
+    # Reverse the order of addition, then a stable sort by source vertex keeps the reversed order within each adjacency range
+    source_array = source_array[::-1]
+    order = np.argsort(source_array, kind='stable')
+
+    counts = np.bincount(source_array, minlength=V)
+    offsets = np.zeros(V+1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+
+    offsets_array = array('q')
+    offsets_array.frombytes(offsets.tobytes())
+    targets_array = array('i')
+    targets_array.frombytes(target_array[::-1][order].astype(np.int32).tobytes())
+    if weight_array is None:
+        return offsets_array, targets_array
+
+    weights_array = array('d')
+    weights_array.frombytes(weight_array[::-1][order].astype(np.float64).tobytes())
+    return offsets_array, targets_array, weights_array
+
+
+# Each undirected edge v-w adds w to the list of v and then v to the list of w (see Graph_Array_AdjacencyLists.addEdge())
+def _undirected_entries(from_array, towards_array, weight_array=None):
+    source_array = np.stack([from_array, towards_array], axis=1).ravel()
+    target_array = np.stack([towards_array, from_array], axis=1).ravel()
+    if weight_array is None:
+        return source_array, target_array, None
+    return source_array, target_array, np.repeat(weight_array, 2)
+
+
+def load_graph_csr(filename, delimiter=None):
+    V, from_array, towards_array, _ = read_edge_arrays(filename, delimiter)
+    source_array, target_array, _ = _undirected_entries(from_array, towards_array)
+    offsets, targets = csr_arrays(V, source_array, target_array)
+    return Graph_CSR(offsets=offsets, targets=targets)
+
+def load_digraph_csr(filename, delimiter=None):
+    V, from_array, towards_array, _ = read_edge_arrays(filename, delimiter)
+    offsets, targets = csr_arrays(V, from_array, towards_array)
+    return Digraph_CSR(offsets=offsets, targets=targets)
+
+def load_edge_weighted_graph_csr(filename, delimiter=None):
+    V, from_array, towards_array, weight_array = read_edge_arrays(filename, delimiter, weighted=True)
+    source_array, target_array, entry_weights = _undirected_entries(from_array, towards_array, weight_array)
+    offsets, targets, weights = csr_arrays(V, source_array, target_array, entry_weights)
+    return Edge_Weighted_Graph_CSR(offsets=offsets, targets=targets, weights=weights)
+
+def load_edge_weighted_digraph_csr(filename, delimiter=None):
+    V, from_array, towards_array, weight_array = read_edge_arrays(filename, delimiter, weighted=True)
+    offsets, targets, weights = csr_arrays(V, from_array, towards_array, weight_array)
+    return Edge_Weighted_Digraph_CSR(offsets=offsets, targets=targets, weights=weights)
+
+
+# The linked-list graphs still need one _Node object per edge endpoint, but the numbers are already parsed.
+# tolist() converts the whole NumPy array into Python ints/floats at once.
+# Python's cyclic garbage collector is paused while the edges are added:
+    # creating hundreds of thousands of _Node and Edge objects triggers many collections that scan the growing graph (none of which can be garbage yet),
+    # which for large graphs costs more than creating the objects themselves.
+def _bulk_add(add_function, *columns):
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for args in zip(*columns):
+            add_function(*args)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+def load_graph(filename, delimiter=None):
+    V, from_array, towards_array, _ = read_edge_arrays(filename, delimiter)
+    graph = Graph_Array_AdjacencyLists(V=V)
+    _bulk_add(graph.addEdge, from_array.tolist(), towards_array.tolist())
+    return graph
+
+def load_digraph(filename, delimiter=None):
+    V, from_array, towards_array, _ = read_edge_arrays(filename, delimiter)
+    digraph = Digraph(V=V)
+    _bulk_add(digraph.addEdge, from_array.tolist(), towards_array.tolist())
+    return digraph
+
+def load_edge_weighted_graph(filename, delimiter=None):
+    V, from_array, towards_array, weight_array = read_edge_arrays(filename, delimiter, weighted=True)
+    ewg = Edge_Weighted_Graph(V=V)
+    _bulk_add(lambda v, w, weight: ewg.addEdge(Edge(v, w, weight)), from_array.tolist(), towards_array.tolist(), weight_array.tolist())
+    return ewg
+
+def load_edge_weighted_digraph(filename, delimiter=None):
+    V, from_array, towards_array, weight_array = read_edge_arrays(filename, delimiter, weighted=True)
+    ewdg = Edge_Weighted_Digraph(V=V)
+    _bulk_add(lambda v, w, weight: ewdg.addEdge(Directed_Edge(v, w, weight)), from_array.tolist(), towards_array.tolist(), weight_array.tolist())
+    return ewdg
+
+
+# kind: (constructor of the original class, bulk loader for the original class, bulk loader for the CSR class)
+LOADERS = {
+    'graph': (Graph_Array_AdjacencyLists, load_graph, load_graph_csr),
+    'digraph': (Digraph, load_digraph, load_digraph_csr),
+    'ewg': (Edge_Weighted_Graph, load_edge_weighted_graph, load_edge_weighted_graph_csr),
+    'ewd': (Edge_Weighted_Digraph, load_edge_weighted_digraph, load_edge_weighted_digraph_csr),
+}
+
+
+def main():
+    filename = sys.argv[1]
+    delimiter = sys.argv[2]
+    kind = sys.argv[3]
+    constructor, bulk_loader, bulk_csr_loader = LOADERS[kind]
+
+    start = time.perf_counter()
+    graph = constructor(filename=filename, delimiter=delimiter)
+    constructor_time = time.perf_counter() - start
+
+    gc.collect()
+    start = time.perf_counter()
+    bulk_graph = bulk_loader(filename, delimiter)
+    bulk_time = time.perf_counter() - start
+
+    gc.collect()
+    start = time.perf_counter()
+    csr_graph = bulk_csr_loader(filename, delimiter)
+    csr_time = time.perf_counter() - start
+
+    print(graph.V(), 'vertices,', graph.E(), 'edges.')
+    print('Line-by-line constructor:       ', round(constructor_time, 4), 'seconds')
+    print('Bulk loader (same class):       ', round(bulk_time, 4), 'seconds', '(' + str(round(constructor_time/bulk_time, 1)) + 'x)')
+    print('Bulk loader (CSR class):        ', round(csr_time, 4), 'seconds', '(' + str(round(constructor_time/csr_time, 1)) + 'x)')
+
+    same = True
+    for v in range(graph.V()):
+        same = same and [str(i) for i in graph.adjacent(v)] == [str(i) for i in bulk_graph.adjacent(v)]
+    print('Bulk loaded graph has the same adjacency lists:', same)
+    print('CSR graph has the same number of edges:', csr_graph.E() == graph.E())
+
+
+if __name__=="__main__": main()
@@ -0,0 +1,149 @@
+# Title: digraph_csr.py
+# Author: Ryan Borchardt
+
+# The implementation for the CSR digraph is very similar to the implementation for the (undirected graph) Graph_CSR (see graph_csr.py).
+# The digraph is frozen (read-only) and stored as two typed arrays instead of an array of Bag_LinkedList objects:
+    # 1. self.offsets (length V+1): the vertices that v points towards are stored in self.targets[self.offsets[v]:self.offsets[v+1]]
+    # 2. self.targets (length E): the packed array of the vertices pointed towards (each directed edge v->w appears once, in v's range)
+
+# The order of each range is the same order that Bag_LinkedList would iterate through the vertices (LIFO), so Directed_DFS, Directed_Cycle,
+# Directed_DFS_Orderings, SCC etc. visit the vertices in exactly the same order as they do for Digraph.
+# The same holds for reverse(): the reversed CSR digraph has the same order as Digraph.reverse().
+
+# Constructing the digraph:
+    # Time complexity: Proportional to V + E
+    # Space complexity: Proportional to V + E
+        # 8 bytes per vertex (offsets) and 4 bytes per edge (targets) instead of a Bag_LinkedList object per vertex and a _Node object per edge.
+
+# Example:
+# python digraph_csr.py tinyDG.txt ' '
+
+
+import sys
+from array import array
+
+from chapter_4.directed_graphs.digraph import Digraph
+
+
+# Builds the offsets and targets arrays from a list of directed edges (v->w for each v, w in zip(from_list, towards_list))
+# Each range is filled from its end towards its beginning so that the order matches the LIFO order of Bag_LinkedList.
+def build_csr_arrays(V, from_list, towards_list):
+    outdegree = [0]*V
+    for v in from_list:
+        outdegree[v] += 1
+
+    offsets = array('q', [0])*(V+1)
+    for v in range(V):
+        offsets[v+1] = offsets[v] + outdegree[v]
+
+    targets = array('i', [0])*offsets[V]
+    next_position = offsets[1:]
+    for i in range(len(from_list)):
+        v = from_list[i]
+        next_position[v] -= 1
+        targets[next_position[v]] = towards_list[i]
+    return offsets, targets
+
+
+class Digraph_CSR:
+    def __init__(self, digraph=None, filename=None, delimiter=None, offsets=None, targets=None):
+        if digraph is not None:
+            self._V = digraph.V()
+            self.offsets = array('q', [0])
+            self.targets = array('i')
+            for v in range(self._V):
+                self.targets.extend(digraph.adjacent(v))
+                self.offsets.append(len(self.targets))
+        elif filename is not None:
+            file_object = open(filename, 'r')
+            self._V = int(file_object.readline())
+            # consuming the line that contains the # of edges (E is determined from the number of edge lines)
+            file_object.readline()
+
+            from_list = []
+            towards_list = []
+            for line_string in file_object:
+                # The default delimiter (whitespace) is used, same as Digraph (tinyDG.txt separates the vertices with more than one space)
+                line_list = line_string.split()
+                if len(line_list) < 2:
+                    continue
+                from_list.append(int(line_list[0]))
+                towards_list.append(int(line_list[1]))
+            file_object.close()
+
+            self.offsets, self.targets = build_csr_arrays(self._V, from_list, towards_list)
+        else:
+            self.offsets = offsets
+            self.targets = targets
+            self._V = len(offsets) - 1
+        self._E = len(self.targets)
+        self.adj = Digraph_CSR._Adjacency(self)
+
+    # Allows for digraph.adj[v] (same as Digraph)
+    class _Adjacency:
+        def __init__(self, digraph):
+            self.digraph = digraph
+
+        def __getitem__(self, v):
+            return self.digraph.adjacent(v)
+
+        def __len__(self):
+            return self.digraph.V()
+
+    def V(self):
+        return self._V
+
+    def E(self):
+        return self._E
+
+    def adjacent(self, v):
+        return self.targets[self.offsets[v]:self.offsets[v+1]]
+
+    def outdegree(self, v):
+        return self.offsets[v+1] - self.offsets[v]
+
+    # Returns a CSR digraph where the edges are all reversed (takes V + E time).
+    # Digraph.reverse() adds the reversed edges in the order: from_vert ascending, then the order of each adjacency list.
+    # Bag_LinkedList iterates in reverse order of addition, so the reversed ranges are filled front to back while going through the edges in the opposite order.
+    def reverse(self):
+        indegree = [0]*self._V
+        for w in self.targets:
+            indegree[w] += 1
+
+        offsets = array('q', [0])*(self._V+1)
+        for v in range(self._V):
+            offsets[v+1] = offsets[v] + indegree[v]
+
+        targets = array('i', [0])*self._E
+        next_position = offsets[:-1]
+        for from_vert in range(self._V-1, -1, -1):
+            for i in range(self.offsets[from_vert+1]-1, self.offsets[from_vert]-1, -1):
+                toward_vert = self.targets[i]
+                targets[next_position[toward_vert]] = from_vert
+                next_position[toward_vert] += 1
+        return Digraph_CSR(offsets=offsets, targets=targets)
+
+    def __str__(self):
+        string = ''
+        for i in range(self._V):
+            string = string + "Vertex " + str(i) + " points towards: "
+            for vertex in self.adjacent(i):
+                string = string + str(vertex) + ", "
+            string = string + "\n"
+        return string
+
+
+def main():
+    digraph_csr = Digraph_CSR(filename=sys.argv[1], delimiter=sys.argv[2])
+    print('CSR digraph:')
+    print(digraph_csr)
+
+    print('Reversed CSR digraph:')
+    print(digraph_csr.reverse())
+
+    # Building the CSR digraph from an existing Digraph object gives the same adjacency ranges (and the same reverse)
+    digraph = Digraph(filename=sys.argv[1], delimiter=sys.argv[2])
+    print('Same as Digraph:', str(Digraph_CSR(digraph=digraph)) == str(digraph))
+    print('Same reverse as Digraph:', str(digraph_csr.reverse()) == str(digraph.reverse()))
+
+if __name__=="__main__": main()
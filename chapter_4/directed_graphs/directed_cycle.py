@@ -1,7 +1,10 @@
 # Title: directed_cycle.py
 # Author: Ryan Borchardt
 
-# The implementation uses a recursive implementation of depth first search.
+# The implementation uses the iterative depth first search engine (see graph_traversal.py), Directed_Cycle is a visitor:
+    # tree_edge(v, vertex): stores v as the previous vertex on the path to vertex (paths_array)
+    # back_edge(v, vertex): vertex is still on the stack, so a cycle has been found. The cycle stack is built and the search is stopped.
+# The cycle that is found is the same as in the recursive version (the vertices are searched in the same order).
 
 # This class extends the functionality of directed graphs to be able to:
 # 1. Determine if a cycle exists in the digraph.
@@ -19,12 +22,14 @@
 import sys
 from chapter_4.directed_graphs.digraph import Digraph
 from chapter_1.stack.stack_resizingarray import Stack_ResizingArray
+from chapter_4.graph_traversal import Graph_Visitor, Graph_Traversal
 
-class Directed_Cycle:
+class Directed_Cycle(Graph_Visitor):
     def __init__(self, digraph):
+        self._traversal = Graph_Traversal(digraph, self)
         # This is used to keep track of whether a vertex has been encountered or not.
         # This way dfs() will only run at most once for each vertex
-        self.marked_array = [False]*digraph.V()
+        self.marked_array = self._traversal.marked_array
         
         # This array is used to build the cycle_stack
         # For a given index
@@ -38,40 +43,34 @@ class Directed_Cycle:
         # This array keeps track of whether a vertex is still on the call stack.
         # If we encounter a vertex that is still on the call stack, then we know a cycle exists (similar to how if the end of the string re-encounters the string in the Tremaux maze)
         # The value at a given index is turned to True while it is on the call stack and turned to False when dfs finishes (and it is no longer on the call stack)
-        self.onStack = [False]*digraph.V()
+        # (The traversal keeps this array up to date)
+        self.onStack = self._traversal.on_stack_array
         
         for i in range(digraph.V()):
+            # If a cycle has already been detected (and consequently cycle_stack has been built), there is nothing left to search.
+            if self.hasCycle(): break
             # This way dfs goes through all vertices even if in different components.
             if not self.marked_array[i]:
                 self.dfs(i, digraph)
         
     def dfs(self,v, digraph):
-        self.onStack[v] = True
-        self.marked_array[v] = True
-        for vertex in digraph.adjacent(v):
-            # 1.
-            # If a cycle has already been detected (and consequently cycle_stack has been built),
-            # Then no more calls to dfs() will be added to the call stack and those remaining are quickly finished w/ this return statement.
-            if self.hasCycle(): return
-            
-            # 2.
-            # If a vertex has already been encountered, then we don't need to re-search through its neighbors.
-            # We only search through the neighbors of a vertex once.
-            elif not self.marked_array[vertex]:
-                self.paths_array[vertex] = v
-                self.dfs(vertex, digraph)
-            
-            # 3.
-            # If this is a true, a cycle has been detected and we can build the cycle stack to show the cycle.
-            elif self.onStack[vertex]:
-                self.cycle_stack.push(vertex)
-                x = v
-                while x != vertex:
-                    self.cycle_stack.push(x)
-                    x = self.paths_array[x]
-                self.cycle_stack.push(vertex)
-        
-        self.onStack[v] = False
+        self._traversal.dfs(v)
+    
+    # If a vertex has already been encountered, then we don't need to re-search through its neighbors.
+    # We only search through the neighbors of a vertex once.
+    def tree_edge(self, v, vertex):
+        self.paths_array[vertex] = v
+    
+    # vertex is still on the stack: a cycle has been detected and we can build the cycle stack to show the cycle.
+    # Then the search is stopped (no more vertices are searched).
+    def back_edge(self, v, vertex):
+        self.cycle_stack.push(vertex)
+        x = v
+        while x != vertex:
+            self.cycle_stack.push(x)
+            x = self.paths_array[x]
+        self.cycle_stack.push(vertex)
+        self._traversal.stop()
     
     
         
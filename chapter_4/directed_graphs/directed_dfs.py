@@ -1,7 +1,9 @@
 # Title: directed_dfs.py
 # Author: Ryan Borchardt
 
-# The implementation uses a recursive implementation of depth first search.
+# The implementation uses the iterative depth first search engine (see graph_traversal.py), Directed_DFS is a visitor:
+# a vertex is marked when an edge points towards it (tree_edge, back_edge or cross_edge),
+# so a source vertex is only marked if it can be reached from a source vertex (as in the recursive version).
 
 # This class extends the functionality of directed graphs to be able to:
 # 1. Determine if a directed path from a source vertex to a given target vertex exists (single-source reachability)
@@ -13,22 +15,30 @@
 
 import sys
 from chapter_4.directed_graphs.digraph import Digraph
+from chapter_4.graph_traversal import Graph_Visitor, Graph_Traversal
 
-class Directed_DFS:
+class Directed_DFS(Graph_Visitor):
     def __init__(self, digraph, *args):
         self.marked_array = [False]*digraph.V()
+        self._traversal = Graph_Traversal(digraph, self)
         
         for s in args:
             if not self.marked_array[s]:
                 self.dfs(s,digraph)
         
+    # The search only starts from v if v hasn't been searched from yet (the traversal has its own marked array that includes the sources)
     def dfs(self,v,digraph):
+        self._traversal.dfs(v)
     
-        for points_towards in digraph.adjacent(v):
-            if not self.marked_array[points_towards]:
-                self.marked_array[points_towards] = True
-                self.dfs(points_towards,digraph)
-        
+    # The events of the depth first search: points_towards can be reached from v
+    def tree_edge(self, v, points_towards):
+        self.marked_array[points_towards] = True
+    
+    def back_edge(self, v, points_towards):
+        self.marked_array[points_towards] = True
+    
+    def cross_edge(self, v, points_towards):
+        self.marked_array[points_towards] = True
     
     
     def marked(self, v):
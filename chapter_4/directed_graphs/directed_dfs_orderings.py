@@ -3,6 +3,9 @@
 
 # sorts the vertices of the directed graph in the following orders:
 
+# The orderings are built by a visitor of the iterative depth first search engine (see graph_traversal.py):
+# pre_visit is the start of a dfs() call and post_visit is the end of a dfs() call (same orders as the recursive version).
+
 # 1. Preorder: The order of the dfs() calls
 # 2. Postorder: The order in which the dfs() calls finish.
 # 3. Reverse postorder: This is the topological order of the digraph (order that allows for all directed edges to point from a vertex already earlier in the order).
@@ -19,11 +22,13 @@ import sys
 from chapter_4.directed_graphs.digraph import Digraph
 from chapter_1.stack.stack_resizingarray import Stack_ResizingArray
 from chapter_1.queue.queue_linkedlist import Queue_LinkedList
+from chapter_4.graph_traversal import Graph_Visitor, Graph_Traversal
 
 
-class Directed_DFS_Orderings:
+class Directed_DFS_Orderings(Graph_Visitor):
     def __init__(self, digraph):
-        self.marked_array = [False]*digraph.V()
+        self._traversal = Graph_Traversal(digraph, self)
+        self.marked_array = self._traversal.marked_array
         
         self.pre_order = Queue_LinkedList()
         self.post_order = Queue_LinkedList()
@@ -35,11 +40,12 @@ class Directed_DFS_Orderings:
         
         
     def dfs(self,v, digraph):
+        self._traversal.dfs(v)
+    
+    def pre_visit(self, v):
         self.pre_order.enqueue(v)
-        self.marked_array[v] = True
-        for j  in digraph.adjacent(v):
-            if not self.marked_array[j]:
-                self.dfs(j, digraph)
+    
+    def post_visit(self, v):
         self.post_order.enqueue(v)
         self.reverse_post_order.push(v)
     
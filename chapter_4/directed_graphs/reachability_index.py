@@ -0,0 +1,169 @@
+# Title: reachability_index.py
+# Author: Ryan Borchardt
+
+# All-pairs reachability (same API as transitive_closure.py: reachable(v, w)) without V depth first searches.
+# Same as Transitive_Closure, reachable(v, v) is True only if v is on a cycle
+# (its strong component has more than one vertex, or v has a self-loop).
+
+# Transitive_Closure stores one Directed_DFS object (a marked array of length V) per vertex and runs V depth first searches.
+# This index is built in three steps:
+    # 1. The strong components are found with SCC_Tarjan (scc_tarjan.py). Every vertex of a strong component reaches the same vertices,
+    #    so reachability only has to be stored per component.
+    #    cyclic[c] is True if component c has more than one vertex or a self-loop: then every vertex of c reaches every vertex of c (itself included).
+    # 2. The condensation DAG: one vertex per strong component and an edge c->d if some edge v->w goes from component c to component d.
+    #    SCC_Tarjan gives the ids in reverse topological order, so every edge c->d of the condensation has d < c.
+    # 3. The components are labeled in increasing id order (reverse topological order), so the labels of the successors of c are done before c:
+    #    a. labeling='bitset': reach[c] is a row of C bits (C = number of components) in a NumPy array of uint64 words.
+    #       reach[c] = the bit of c OR reach[d] for every successor d of c (one vectorized OR of C/64 words per condensation edge).
+    #       reachable(v, w) tests one bit: O(1). Memory: C^2/8 bytes.
+    #    b. labeling='interval' (for large DAGs where C^2 bits don't fit): the components are numbered in postorder of a DFS of the condensation.
+    #       The descendants of c in the DFS tree have the postorder numbers [first[c], post[c]].
+    #       intervals[c] = that interval merged with the intervals of every successor d of c (sorted, overlapping and adjacent intervals joined).
+    #       reachable(v, w) is a binary search for post[id(w)] in the intervals of id(v): O(lg(number of intervals)).
+    #       DAGs that are close to a forest need very few intervals per component.
+
+# Time complexity:
+    # Constructor: Proportional to V + E + (condensation edges)*C/64 (bitset) or + the total number of intervals merged (interval)
+    # reachable(): constant (bitset) or lg(number of intervals of a component) (interval)
+# Space complexity: Proportional to V + C^2/64 words (bitset) or V + the total number of intervals (interval)
+
+# Example:
+# python reachability_index.py tinyDG.txt ' '
+# python reachability_index.py tinyDG.txt ' ' interval
+
+import sys
+import time
+from bisect import bisect_right
+
+import numpy as np
+
+from chapter_4.directed_graphs.digraph import Digraph
+from chapter_4.directed_graphs.scc_tarjan import SCC_Tarjan
+from chapter_4.directed_graphs.transitive_closure import Transitive_Closure
+
+
+class Reachability_Index:
+    def __init__(self, digraph, labeling='bitset'):
+        self.labeling = labeling
+        self.scc = SCC_Tarjan(digraph)
+        C = self.scc.count()
+        id_array = self.scc.id_array
+
+        # The condensation DAG (the successors of each component, without duplicates)
+        self.successors = [set() for _ in range(C)]
+        self.cyclic = [size > 1 for size in self.scc.sizes()]
+        for v in range(digraph.V()):
+            c = id_array[v]
+            for w in digraph.adjacent(v):
+                d = id_array[w]
+                if d != c:
+                    self.successors[c].add(d)
+                elif w == v:
+                    self.cyclic[c] = True
+
+        if labeling == 'bitset':
+            self._build_bitsets(C)
+        elif labeling == 'interval':
+            self._build_intervals(C)
+        else:
+            raise Exception("labeling must be 'bitset' or 'interval'")
+
+    def _build_bitsets(self, C):
+        words = (C + 63)//64
+        self.reach = np.zeros((C, words), dtype=np.uint64)
+        for c in range(C):
+            row = self.reach[c]
+            row[c >> 6] |= np.uint64(1 << (c & 63))
+            for d in self.successors[c]:
+                row |= self.reach[d]
+
+    def _build_intervals(self, C):
+        # Iterative DFS of the condensation: post[c] is the postorder number of c, first[c] the smallest postorder number in its DFS subtree
+        self.post = [-1]*C
+        first = [0]*C
+        next_post = 0
+        visited = [False]*C
+        for root in range(C-1, -1, -1):
+            if visited[root]:
+                continue
+            visited[root] = True
+            first[root] = next_post
+            call_stack = [(root, iter(self.successors[root]))]
+            while len(call_stack) > 0:
+                c, neighbours = call_stack[-1]
+                d = next(neighbours, None)
+                while d is not None:
+                    if not visited[d]:
+                        visited[d] = True
+                        first[d] = next_post
+                        call_stack.append((d, iter(self.successors[d])))
+                        break
+                    d = next(neighbours, None)
+                else:
+                    call_stack.pop()
+                    self.post[c] = next_post
+                    next_post += 1
+
+        # intervals[c] is a sorted list of disjoint (start, end) postorder intervals, starts[c] the list of their starts (for bisect)
+        self.intervals = [None]*C
+        self.starts = [None]*C
+        for c in range(C):
+            candidates = [(first[c], self.post[c])]
+            for d in self.successors[c]:
+                candidates.extend(self.intervals[d])
+            candidates.sort()
+            merged = [candidates[0]]
+            for start, end in candidates[1:]:
+                if start <= merged[-1][1] + 1:
+                    if end > merged[-1][1]:
+                        merged[-1] = (merged[-1][0], end)
+                else:
+                    merged.append((start, end))
+            self.intervals[c] = merged
+            self.starts[c] = [start for start, end in merged]
+
+    # Is there a directed path (of at least one edge) from v to w?
+    def reachable(self, v, w):
+        c = self.scc.id_array[v]
+        d = self.scc.id_array[w]
+        if c == d:
+            return self.cyclic[c]
+        if self.labeling == 'bitset':
+            return bool((int(self.reach[c, d >> 6]) >> (d & 63)) & 1)
+        x = self.post[d]
+        i = bisect_right(self.starts[c], x) - 1
+        return i >= 0 and x <= self.intervals[c][i][1]
+
+    # Number of strong components (vertices of the condensation DAG)
+    def count(self):
+        return self.scc.count()
+
+    # Number of intervals stored (interval labeling only)
+    def num_intervals(self):
+        return sum(len(intervals) for intervals in self.intervals)
+
+
+
+def main():
+    digraph = Digraph(filename=sys.argv[1], delimiter=sys.argv[2])
+    labeling = 'bitset'
+    if len(sys.argv) > 3:
+        labeling = sys.argv[3]
+
+    start = time.perf_counter()
+    index = Reachability_Index(digraph, labeling)
+    print('Reachability index (' + labeling + '):', round(time.perf_counter() - start, 6), 'seconds')
+    start = time.perf_counter()
+    tc = Transitive_Closure(digraph)
+    print('Transitive closure (V depth first searches):', round(time.perf_counter() - start, 6), 'seconds')
+
+    print(index.reachable(6,1))
+    print(index.reachable(8,4))
+    print(index.reachable(4,12))
+    for v in range(digraph.V()):
+        for w in range(digraph.V()):
+            if index.reachable(v, w) != tc.reachable(v, w):
+                print('Different from the transitive closure for', v, w)
+
+
+if __name__=="__main__": main()
@@ -12,6 +12,9 @@
     # 2. Compute the reverse post order of this reversed digraph (V + E time)
     # 3. Run dfs() in vertex order in reverse post order on the original digraph, incrementing the count each time dfs() is called from the constructor (V + E time) 
 
+# Both depth first searches are done by the iterative depth first search engine (see graph_traversal.py):
+# SCC is a visitor that gives each vertex the current count as its id when it is marked (pre_visit).
+
 # Space complexity: proprotional to V + E
 
 # Example:
@@ -23,12 +26,14 @@ import sys
 
 from chapter_4.directed_graphs.digraph import Digraph
 from chapter_4.directed_graphs.directed_dfs_orderings import Directed_DFS_Orderings
+from chapter_4.graph_traversal import Graph_Visitor, Graph_Traversal
 
 
-class SCC:
+class SCC(Graph_Visitor):
     def __init__(self, digraph):
 
-        self.marked_array = [False]*digraph.V()
+        self._traversal = Graph_Traversal(digraph, self)
+        self.marked_array = self._traversal.marked_array
         self.id_array = [None]*digraph.V()
         self.count_val = 0
         
@@ -42,14 +47,10 @@ class SCC:
                 self.count_val+= 1
         
     def dfs(self, v, digraph):
-        self.marked_array[v] = True
+        self._traversal.dfs(v)
+    
+    def pre_visit(self, v):
         self.id_array[v] = self.count_val
-        
-        points_towards = digraph.adjacent(v)
-        
-        for vertex in points_towards:
-            if not self.marked_array[vertex]:
-                self.dfs(vertex, digraph)
 
         
     def stronglyConnected(self, v, w):
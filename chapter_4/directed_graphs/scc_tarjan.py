@@ -0,0 +1,125 @@
+# Title: scc_tarjan.py
+# Author: Ryan Borchardt
+
+# Identifies the strongly connected components in a directed graph (same API as scc_kosaraju.py: stronglyConnected(), count(), id())
+
+# This implementation uses Tarjan's algorithm, which finds the strong components with one depth first search of the digraph:
+    # 1. index[v] is the order in which v was first visited, low[v] is the smallest index of a vertex that can be reached from v
+    #    through the DFS tree below v and at most one edge back to a vertex that is still on the component stack.
+    # 2. Every visited vertex is pushed onto the component stack and stays on it until its strong component is complete.
+    # 3. When the DFS is finished with v and low[v] == index[v], v is the first visited vertex of its strong component:
+    #    the vertices above v on the component stack (and v) are popped and are given the next id.
+# Kosaraju's algorithm (scc_kosaraju.py) builds the reverse digraph and does two recursive depth first searches.
+# Here there is no reverse digraph and the DFS is iterative: the call stack is an explicit list of (vertex, iterator over its adjacency list),
+# so a long path doesn't hit Python's recursion limit (digraphs with 10^6 vertices are fine).
+
+# As with Kosaraju's algorithm, the first strong component that is found is a sink (of the DAG of strong components),
+# the ids are in reverse topological order of the strong components.
+
+# Time complexity: Proportional to V + E (one visit per vertex and one look at each edge)
+# Space complexity: Proportional to V (index, low and id arrays, the component stack and the call stack)
+
+# Example:
+# python scc_tarjan.py tinyDG.txt ' '
+# python scc_tarjan.py tinyDG_other.txt ' '
+# python scc_tarjan.py tinyDAG.txt ' '
+
+import sys
+
+from chapter_4.directed_graphs.digraph import Digraph
+
+
+class SCC_Tarjan:
+    def __init__(self, digraph):
+        V = digraph.V()
+        # -1: not visited yet
+        index = [-1]*V
+        low = [0]*V
+        self.id_array = [-1]*V
+        id_array = self.id_array
+        # size_array[c] is the number of vertices in the strong component with id c
+        self.size_array = []
+        self.count_val = 0
+
+        component_stack = []
+        next_index = 0
+        for s in range(V):
+            if index[s] != -1:
+                continue
+            index[s] = next_index
+            low[s] = next_index
+            next_index += 1
+            component_stack.append(s)
+            call_stack = [(s, iter(digraph.adjacent(s)))]
+
+            while len(call_stack) > 0:
+                v, neighbours = call_stack[-1]
+                w = next(neighbours, None)
+                while w is not None:
+                    if index[w] == -1:
+                        # Tree edge: visit w (the iterator of v continues from here once w is done)
+                        index[w] = next_index
+                        low[w] = next_index
+                        next_index += 1
+                        component_stack.append(w)
+                        call_stack.append((w, iter(digraph.adjacent(w))))
+                        break
+                    # w is visited but has no id yet, so it is still on the component stack
+                    elif id_array[w] == -1 and index[w] < low[v]:
+                        low[v] = index[w]
+                    w = next(neighbours, None)
+                else:
+                    # Every edge from v has been looked at
+                    call_stack.pop()
+                    if len(call_stack) > 0:
+                        u = call_stack[-1][0]
+                        if low[v] < low[u]:
+                            low[u] = low[v]
+                    if low[v] == index[v]:
+                        size = 0
+                        while True:
+                            w = component_stack.pop()
+                            id_array[w] = self.count_val
+                            size += 1
+                            if w == v:
+                                break
+                        self.size_array.append(size)
+                        self.count_val += 1
+
+    def stronglyConnected(self, v, w):
+        return self.id_array[v] == self.id_array[w]
+
+    def count(self):
+        return self.count_val
+
+    def id(self, v):
+        return self.id_array[v]
+
+    # Returns the number of vertices in the strong component of v
+    def size(self, v):
+        return self.size_array[self.id_array[v]]
+
+    # Returns a list of the sizes of the strong components (indexed by id)
+    def sizes(self):
+        return self.size_array
+
+
+
+def main():
+    digraph = Digraph(filename=sys.argv[1], delimiter=sys.argv[2])
+    scc = SCC_Tarjan(digraph)
+
+    print(scc.id_array)
+
+    print(scc.stronglyConnected(0,5))
+    print(scc.stronglyConnected(0,8))
+
+    print(scc.count())
+    print(scc.sizes())
+
+    print(scc.id(0))
+    print(scc.id(5))
+    print(scc.id(8))
+
+
+if __name__=="__main__": main()
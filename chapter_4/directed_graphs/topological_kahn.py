@@ -0,0 +1,105 @@
+# Title: topological_kahn.py
+# Author: Ryan Borchardt
+
+# sorts the vertices in a DAG in topological order with Kahn's algorithm (queue-based, no recursion)
+
+# topological.py and topological_ewd.py go through the digraph twice: Directed_Cycle (or Directed_Weighted_Cycle) to check for a cycle,
+# then Directed_DFS_Orderings for the reverse postorder. Both are recursive DFS, so a long path in a large digraph goes very deep on the call stack.
+# This implementation goes through the digraph once:
+    # 1. indegree[v] is the number of edges pointing towards v (one pass over the adjacency lists)
+    # 2. The vertices with an indegree of 0 are the first level.
+    #    The edges coming from the vertices of a level are removed (indegree[w] -= 1), and the vertices whose indegree reaches 0 are the next level.
+    # 3. If some vertices never reach an indegree of 0, they are on (or after) a cycle and the digraph is not a DAG.
+
+# levels() returns the levels as lists of vertices: every vertex in a level only depends on vertices in earlier levels,
+# so the vertices of a level can be run in parallel (they are an antichain). The topological order is the levels one after another.
+
+# Works for Digraph, Digraph_CSR, Edge_Weighted_Digraph and Edge_Weighted_Digraph_CSR
+# (the adjacency lists of the edge-weighted digraphs hold Directed_Edge objects instead of vertices).
+
+# Topologically sort a DAG with:
+    # Time complexity: Proportional to V + E
+    # Space complexity: Proportional to V (the indegree array, the levels)
+
+# Example:
+# python topological_kahn.py tinyDAG.txt ' '
+# python topological_kahn.py tinyDG.txt ' '
+
+import sys
+
+from chapter_4.directed_graphs.digraph import Digraph
+
+
+# The adjacency lists of edge-weighted digraphs hold Directed_Edge objects, the ones of digraphs hold vertices (ints)
+def is_edge_weighted(digraph):
+    for v in range(digraph.V()):
+        for item in digraph.adjacent(v):
+            return not isinstance(item, int)
+    return False
+
+
+class Topological_Kahn:
+    def __init__(self, digraph):
+        V = digraph.V()
+        self.weighted = is_edge_weighted(digraph)
+
+        indegree = [0]*V
+        for v in range(V):
+            for w in self._towards(digraph, v):
+                indegree[w] += 1
+
+        self._levels = []
+        level = [v for v in range(V) if indegree[v] == 0]
+        num_sorted = 0
+        while len(level) > 0:
+            self._levels.append(level)
+            num_sorted += len(level)
+            next_level = []
+            for v in level:
+                for w in self._towards(digraph, v):
+                    indegree[w] -= 1
+                    if indegree[w] == 0:
+                        next_level.append(w)
+            level = next_level
+
+        self._hasCycle = num_sorted < V
+
+    def _towards(self, digraph, v):
+        if self.weighted:
+            return [edge.towards_vert() for edge in digraph.adjacent(v)]
+        return digraph.adjacent(v)
+
+    # Returns the vertices in topological order (None if the digraph has a cycle)
+    def order(self):
+        if self._hasCycle:
+            return None
+        return [v for level in self._levels for v in level]
+
+    # Returns the levels as a list of lists of vertices (None if the digraph has a cycle)
+    def levels(self):
+        if self._hasCycle:
+            return None
+        return self._levels
+
+    def isDag(self):
+        return not self._hasCycle
+
+    def hasCycle(self):
+        return self._hasCycle
+
+
+
+def main():
+    digraph = Digraph(filename=sys.argv[1], delimiter=sys.argv[2])
+    topological_sort = Topological_Kahn(digraph)
+
+    print('Is DAG?', topological_sort.isDag())
+
+    print('Topological Order:')
+    print(topological_sort.order())
+
+    print('Levels:')
+    print(topological_sort.levels())
+
+
+if __name__=="__main__": main()
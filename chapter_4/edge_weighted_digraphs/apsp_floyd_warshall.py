@@ -8,49 +8,148 @@ Determines the all-paths shortest paths for an edge-weighted digraph (ie determi
 
 Idea: incrementally considering (and building if shorter) all intermediate paths between nodes u and v
 
+A predecessor matrix is kept next to the distance matrix: pred[u][v] is the vertex right before v on the shortest path from u to v found so far.
+When the path i->k->j replaces the path i->j, the vertex right before j is the vertex right before j on the path from k to j (pred[k][j]).
+path(u, v) follows the predecessor matrix back from v to u and returns the directed edges of the path.
+
+A negative cycle exists if (and only if) dist_matrix[v][v] < 0 for some vertex v after the algorithm (a path from v back to v with a negative length).
+
+Vectorized (NumPy) mode: AP_Shortest_Paths(ewdg, vectorized=True)
+    For a given k, the two inner loops (over i and over j) are the same as one NumPy operation on the whole matrix:
+        candidates = dist[:, k, None] + dist[None, k, :]   (the length of i->k->j for every i and j)
+        dist = minimum(dist, candidates)
+    So the V^2 inner iterations run in C instead of in the Python interpreter (roughly 100x faster for V in the low thousands).
+    dtype selects the type of the distance matrix: 'float64' (default) or 'float32' (half of the memory, but only ~7 significant digits).
+    The predecessor matrix is an int32 matrix.
+
 # Time complexity: O(V^3)
 # Space complexity: O(V^2)
 
 Example:
 python apsp_floyd_warshall.py tinyEWDn.txt ' '
+python apsp_floyd_warshall.py tinyEWDn.txt ' ' vectorized
+python apsp_floyd_warshall.py mediumEWD.txt ' ' vectorized float32
+python apsp_floyd_warshall.py tinyEWDnc.txt ' ' vectorized
 """
 
 
 import sys
+import time
+
+import numpy as np
+
+from chapter_1.stack.stack_resizingarray import Stack_ResizingArray
 from chapter_4.edge_weighted_digraphs.directed_edge import Directed_Edge
 from chapter_4.edge_weighted_digraphs.edge_weighted_digraph import Edge_Weighted_Digraph
 
 
 
 class AP_Shortest_Paths:
-    def __init__(self, ewdg):
+    def __init__(self, ewdg, vectorized=False, dtype='float64'):
         V=ewdg.V()
+        # The lightest edge from u to v (used to turn the predecessor matrix back into directed edges)
+        self._edge = {}
+        for edge in ewdg.edges():
+            key = (edge.from_vert(), edge.towards_vert())
+            if key not in self._edge or edge.weight() < self._edge[key].weight():
+                self._edge[key] = edge
+        
+        if vectorized:
+            self._floyd_warshall_vectorized(V, dtype)
+            return
+        
         self.dist_matrix = [[float('inf')]*V for _ in range(V)]
+        self.pred = [[-1]*V for _ in range(V)]
         
         for i in range(V):
             self.dist_matrix[i][i]=0 # shortest distance from any vertex to itself is 0 (assuming no negative cycles)
         
-        for edge in ewdg.edges():
-            self.dist_matrix[edge.from_vert()][edge.towards_vert()] = edge.weight()
+        for (u, v), edge in self._edge.items():
+            if edge.weight() < self.dist_matrix[u][v]:
+                self.dist_matrix[u][v] = edge.weight()
+                self.pred[u][v] = u
             
         for k in range(V):
             for i in range(V):
                 for j in range(V):
                     if self.dist_matrix[i][k] + self.dist_matrix[k][j] < self.dist_matrix[i][j]: # if going from i->k->j is shorter than going from i->j, update that distance:
                         self.dist_matrix[i][j] = self.dist_matrix[i][k] + self.dist_matrix[k][j]
+                        self.pred[i][j] = self.pred[k][j]
+        
+        self._negative_cycle = any(self.dist_matrix[v][v] < 0 for v in range(V))
+    
+    def _floyd_warshall_vectorized(self, V, dtype):
+        dist = np.full((V, V), np.inf, dtype=dtype)
+        pred = np.full((V, V), -1, dtype=np.int32)
+        np.fill_diagonal(dist, 0)
+        for (u, v), edge in self._edge.items():
+            if edge.weight() < dist[u, v]:
+                dist[u, v] = edge.weight()
+                pred[u, v] = u
+        
+        candidates = np.empty((V, V), dtype=dtype)
+        improved = np.empty((V, V), dtype=bool)
+        for k in range(V):
+            # length of i->k->j for every i and j
+            np.add(dist[:, k, None], dist[None, k, :], out=candidates)
+            np.less(candidates, dist, out=improved)
+            np.copyto(dist, candidates, where=improved)
+            # row k of pred broadcasts to every row i
+            np.copyto(pred, np.broadcast_to(pred[k], (V, V)), where=improved)
+        
+        self.dist_matrix = dist
+        self.pred = pred
+        self._negative_cycle = bool((np.diagonal(dist) < 0).any())
             
     
     def shortest_path(self,u,v):
-        return self.dist_matrix[u][v]
+        return float(self.dist_matrix[u][v])
+    
+    def hasNegativeCycle(self):
+        return self._negative_cycle
+    
+    def hasPath(self, u, v):
+        return self.dist_matrix[u][v] != float('inf')
+    
+    # Returns stack of directed edges from u to v (the first edge of the path is on top of the stack)
+    def path(self, u, v):
+        if self._negative_cycle:
+            raise Exception("A negative cycle exists. Shortest paths could not be found.")
+        if self.hasPath(u, v) == False:
+            return None
+        if u == v:
+            return "No edges required to reach source vertex from source vertex"
+        path_stack = Stack_ResizingArray()
+        while v != u:
+            previous = int(self.pred[u][v])
+            path_stack.push(self._edge[(previous, v)])
+            v = previous
+        return path_stack
 
 
 
 def main():
     
     ewdg = Edge_Weighted_Digraph(filename=sys.argv[1], delimiter=sys.argv[2])
-    apsp = AP_Shortest_Paths(ewdg)
+    if len(sys.argv) == 3:
+        apsp = AP_Shortest_Paths(ewdg)
+        print(apsp.shortest_path(0,5))
+        print(apsp.shortest_path(1,2))
+        return
+    
+    dtype = 'float64'
+    if len(sys.argv) > 4:
+        dtype = sys.argv[4]
+    start = time.perf_counter()
+    apsp = AP_Shortest_Paths(ewdg, vectorized=True, dtype=dtype)
+    print('Vectorized Floyd-Warshall (' + dtype + '):', round(time.perf_counter() - start, 4), 'seconds')
+    if apsp.hasNegativeCycle():
+        print('A negative cycle exists. Shortest paths could not be found.')
+        return
     print(apsp.shortest_path(0,5))
     print(apsp.shortest_path(1,2))
+    print('Shortest path from 0 to 5:')
+    print(apsp.path(0,5))
         
 
 
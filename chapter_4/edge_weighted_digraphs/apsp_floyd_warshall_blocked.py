@@ -0,0 +1,194 @@
+"""
+Title: apsp_floyd_warshall_blocked.py
+Author: Ryan Borchardt
+
+Blocked (tiled) Floyd-Warshall for all-paths shortest paths when V is large (V ~ 20,000: the V by V matrix of float64 is 3.2 GB).
+Same API as apsp_floyd_warshall.py (shortest_path(u, v)).
+
+The distance matrix is a numpy.memmap (a NumPy array backed by a file on disk), so it can be larger than the memory of the machine:
+the operating system keeps the parts of the file that are being used in memory and writes the rest back to disk.
+
+The matrix is split into B by B tiles (the last row/column of tiles is smaller if V is not a multiple of B).
+Floyd-Warshall considers the intermediate vertices k one at a time. The blocked version considers a whole block of B intermediate vertices
+(the vertices of tile row/column kb) at a time, in three phases:
+    Phase 1: the diagonal tile (kb, kb) runs Floyd-Warshall on its own (every k in the block).
+    Phase 2: the tiles in row kb and column kb are updated with the finished diagonal tile:
+                row tile (kb, j):     T = min(T, D[:, k] + T[k, :]) for every k in the block
+                column tile (i, kb):  T = min(T, T[:, k] + D[k, :]) for every k in the block
+    Phase 3: every other tile (i, j) only depends on column tile (i, kb) and row tile (kb, j) (which are finished):
+                T = min(T, C[:, k] + R[k, :]) for every k in the block (a "min-plus" matrix product)
+             These tiles are independent of each other, so each row of tiles i is a separate task for a pool of processes.
+             Every worker process maps the same file, so the tiles written by one process are seen by all of the others.
+Each phase works on a few B by B tiles at a time, so the data being used fits in the CPU cache (and in memory when the matrix doesn't).
+
+A negative cycle exists if (and only if) a value on the diagonal is negative after the algorithm.
+
+Time complexity: O(V^3) (the same number of operations as Floyd-Warshall), divided between the processes in phase 3
+Space complexity: O(V^2) on disk, O(B^2) per process in memory (plus whatever the operating system caches)
+
+Example:
+python apsp_floyd_warshall_blocked.py tinyEWDn.txt ' ' 3
+python apsp_floyd_warshall_blocked.py mediumEWD.txt ' ' 64
+python apsp_floyd_warshall_blocked.py mediumEWD.txt ' ' 64 4
+"""
+
+
+import sys
+import os
+import time
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from chapter_4.edge_weighted_digraphs.edge_weighted_digraph import Edge_Weighted_Digraph
+
+
+
+# Floyd-Warshall on the tile T using the intermediate vertices of the block: T = min(T, left[:, k] + right[k, :]) for every k
+# For phase 1, left and right are T itself. For phase 2, one of them is the diagonal tile. For phase 3, they are the column and row tiles.
+def _update_tile(T, left, right):
+    for k in range(left.shape[1]):
+        np.minimum(T, left[:, k, None] + right[None, k, :], out=T)
+
+
+# The memory-mapped matrix of a worker process (set once by the initializer of the pool)
+_worker_matrix = None
+
+def _init_worker(filename, V, dtype):
+    global _worker_matrix
+    _worker_matrix = np.memmap(filename, dtype=dtype, mode='r+', shape=(V, V))
+
+# Phase 3 for the row of tiles i (every tile (i, j) except the ones in tile row/column kb)
+def _phase_3_row(args, matrix=None):
+    i_start, i_end, kb_start, kb_end, block_size = args
+    if matrix is None:
+        matrix = _worker_matrix
+    V = matrix.shape[0]
+    column_tile = np.array(matrix[i_start:i_end, kb_start:kb_end])
+    for j_start in range(0, V, block_size):
+        if j_start == kb_start:
+            continue
+        j_end = min(V, j_start + block_size)
+        row_tile = np.array(matrix[kb_start:kb_end, j_start:j_end])
+        tile = np.array(matrix[i_start:i_end, j_start:j_end])
+        _update_tile(tile, column_tile, row_tile)
+        matrix[i_start:i_end, j_start:j_end] = tile
+
+
+class AP_Shortest_Paths:
+    # block_size: B (the tiles are B by B)
+    # filename: file that backs the distance matrix (None: a temporary file that is deleted when this object is deleted)
+    # processes: number of worker processes for phase 3 (None: one per CPU, 1: run in this process without a pool)
+    def __init__(self, ewdg, block_size=256, filename=None, processes=None, dtype='float64'):
+        V = ewdg.V()
+        self._temporary_filename = None
+        if filename is None:
+            file_descriptor, filename = tempfile.mkstemp(suffix='.apsp')
+            os.close(file_descriptor)
+            self._temporary_filename = filename
+        self.filename = filename
+        self.dist_matrix = np.memmap(filename, dtype=dtype, mode='w+', shape=(V, V))
+
+        # Initial distances, one block of rows at a time (never the whole matrix in memory)
+        for i_start in range(0, V, block_size):
+            i_end = min(V, i_start + block_size)
+            self.dist_matrix[i_start:i_end] = np.inf
+            for i in range(i_start, i_end):
+                self.dist_matrix[i, i] = 0
+        from_list = []
+        towards_list = []
+        weight_list = []
+        for edge in ewdg.edges():
+            from_list.append(edge.from_vert())
+            towards_list.append(edge.towards_vert())
+            weight_list.append(edge.weight())
+        # The lightest of parallel edges (and a self-loop only if it is negative)
+        np.minimum.at(self.dist_matrix, (np.array(from_list, dtype=np.int64), np.array(towards_list, dtype=np.int64)), np.array(weight_list, dtype=dtype))
+
+        if processes is None:
+            processes = os.cpu_count() or 1
+        executor = None
+        if processes > 1:
+            self.dist_matrix.flush()
+            executor = ProcessPoolExecutor(max_workers=processes, initializer=_init_worker, initargs=(filename, V, dtype))
+
+        try:
+            for kb_start in range(0, V, block_size):
+                kb_end = min(V, kb_start + block_size)
+                self._phases_1_and_2(V, kb_start, kb_end, block_size)
+
+                tasks = [(i_start, min(V, i_start + block_size), kb_start, kb_end, block_size) for i_start in range(0, V, block_size) if i_start != kb_start]
+                if executor is None:
+                    for task in tasks:
+                        _phase_3_row(task, self.dist_matrix)
+                else:
+                    # list() waits for every task of this block before the next block starts
+                    list(executor.map(_phase_3_row, tasks))
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        self.dist_matrix.flush()
+
+        self._negative_cycle = False
+        for i_start in range(0, V, block_size):
+            i_end = min(V, i_start + block_size)
+            diagonal = np.diagonal(self.dist_matrix[i_start:i_end, i_start:i_end])
+            if (diagonal < 0).any():
+                self._negative_cycle = True
+
+    def _phases_1_and_2(self, V, kb_start, kb_end, block_size):
+        matrix = self.dist_matrix
+        # Phase 1: the diagonal tile
+        diagonal_tile = np.array(matrix[kb_start:kb_end, kb_start:kb_end])
+        _update_tile(diagonal_tile, diagonal_tile, diagonal_tile)
+        matrix[kb_start:kb_end, kb_start:kb_end] = diagonal_tile
+
+        # Phase 2: the tiles in row kb and column kb
+        for start in range(0, V, block_size):
+            if start == kb_start:
+                continue
+            end = min(V, start + block_size)
+            row_tile = np.array(matrix[kb_start:kb_end, start:end])
+            _update_tile(row_tile, diagonal_tile, row_tile)
+            matrix[kb_start:kb_end, start:end] = row_tile
+
+            column_tile = np.array(matrix[start:end, kb_start:kb_end])
+            _update_tile(column_tile, column_tile, diagonal_tile)
+            matrix[start:end, kb_start:kb_end] = column_tile
+
+    def shortest_path(self, u, v):
+        return float(self.dist_matrix[u][v])
+
+    def hasNegativeCycle(self):
+        return self._negative_cycle
+
+    def __del__(self):
+        if self._temporary_filename is not None:
+            self.dist_matrix = None
+            try:
+                os.remove(self._temporary_filename)
+            except OSError:
+                pass
+
+
+
+def main():
+    ewdg = Edge_Weighted_Digraph(filename=sys.argv[1], delimiter=sys.argv[2])
+    block_size = int(sys.argv[3])
+    processes = None
+    if len(sys.argv) > 4:
+        processes = int(sys.argv[4])
+
+    start = time.perf_counter()
+    apsp = AP_Shortest_Paths(ewdg, block_size=block_size, processes=processes)
+    elapsed = time.perf_counter() - start
+    if apsp.hasNegativeCycle():
+        print('A negative cycle exists. Shortest paths could not be found.')
+        return
+    print(apsp.shortest_path(0,5))
+    print(apsp.shortest_path(1,2))
+    print('Blocked Floyd-Warshall (B = ' + str(block_size) + '):', round(elapsed, 4), 'seconds')
+
+
+if __name__== "__main__": main()
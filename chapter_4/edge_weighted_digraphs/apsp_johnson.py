@@ -0,0 +1,155 @@
+"""
+Title: apsp_johnson.py
+Author: Ryan Borchardt
+
+Determines the all-paths shortest paths for an edge-weighted digraph with Johnson's algorithm.
+Same API as apsp_floyd_warshall.py (shortest_path(u, v)), but for sparse digraphs this is much faster than the V^3 triple loop of Floyd-Warshall.
+
+Idea: run Dijkstra's algorithm from every vertex. Dijkstra's algorithm requires non-negative weights, so the edges are reweighted first:
+    1. A virtual source vertex (vertex V) with an edge of weight 0 to every vertex is added, and Bellman-Ford (sp_bellmanford.py) is run from it.
+       h[v] = the length of the shortest path from the virtual source to v (h[v] <= 0).
+       If Bellman-Ford finds a negative cycle, shortest paths don't exist (hasNegativeCycle() and negativeCycle() return it).
+    2. Every edge u->v gets the new weight: weight + h[u] - h[v]
+       This is >= 0 for every edge (b/c h[v] <= h[u] + weight is true for the shortest path distances h).
+       Every path from s to t has its length changed by the same amount (h[s] - h[t]), so the shortest paths are the same paths.
+    3. Dijkstra's algorithm (sp_dijkstra.py) is run from every vertex s on the reweighted digraph, and the distances are converted back:
+       dist(s, t) = reweighted dist(s, t) - h[s] + h[t]
+
+The V runs of Dijkstra's algorithm are independent, so they are spread over a pool of processes (concurrent.futures.ProcessPoolExecutor).
+The reweighted digraph is sent to each worker process once (as the CSR arrays of edge_weighted_digraph_csr.py, which are small and quick to pickle)
+by the initializer of the pool, and is only read by the workers. Each task runs Dijkstra's algorithm from a chunk of source vertices and returns their rows.
+
+The distances are stored in a V by V NumPy array of float64 (8 bytes per entry, instead of a list of lists of Python float objects).
+
+Time complexity: Proportional to E*V (Bellman-Ford, worst case) + V*(E*lg(V) + V*lg(V)) (V runs of Dijkstra), divided between the processes
+Space complexity: Proportional to V^2 (the distance matrix)
+
+Example:
+python apsp_johnson.py tinyEWDn.txt ' '
+python apsp_johnson.py tinyEWDnc.txt ' '
+python apsp_johnson.py mediumEWD.txt ' ' 4
+"""
+
+
+import sys
+import time
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from chapter_4.edge_weighted_digraphs.directed_edge import Directed_Edge
+from chapter_4.edge_weighted_digraphs.edge_weighted_digraph import Edge_Weighted_Digraph
+from chapter_4.edge_weighted_digraphs.edge_weighted_digraph_csr import Edge_Weighted_Digraph_CSR, build_csr_arrays
+from chapter_4.edge_weighted_digraphs.sp_bellmanford import Shortest_Paths as Shortest_Paths_BellmanFord
+from chapter_4.edge_weighted_digraphs.sp_dijkstra import Shortest_Paths as Shortest_Paths_Dijkstra
+
+
+
+# The reweighted digraph of a worker process (set once by the initializer of the pool)
+_worker_ewdg = None
+
+def _init_worker(offsets, targets, weights):
+    global _worker_ewdg
+    _worker_ewdg = Edge_Weighted_Digraph_CSR(offsets=offsets, targets=targets, weights=weights)
+
+# Runs Dijkstra's algorithm from every vertex in sources on the reweighted digraph.
+# Returns a list of (source vertex, reweighted distances from the source as an array of doubles)
+def _dijkstra_rows(sources, ewdg=None):
+    if ewdg is None:
+        ewdg = _worker_ewdg
+    rows = []
+    for s in sources:
+        sp = Shortest_Paths_Dijkstra(ewdg, s)
+        rows.append((s, array('d', [sp.distTo(v) for v in range(ewdg.V())])))
+    return rows
+
+
+class AP_Shortest_Paths:
+    # processes: number of worker processes (None: one per CPU, 1: run in this process without a pool)
+    def __init__(self, ewdg, processes=None):
+        V = ewdg.V()
+        self.cycle = None
+        self.dist_matrix = None
+
+        # 1. Bellman-Ford from a virtual source vertex V
+        augmented_ewdg = Edge_Weighted_Digraph(V=V+1)
+        for edge in ewdg.edges():
+            augmented_ewdg.addEdge(edge)
+        for v in range(V):
+            augmented_ewdg.addEdge(Directed_Edge(V, v, 0.0))
+        bellman_ford = Shortest_Paths_BellmanFord(augmented_ewdg, V)
+        if bellman_ford.hasNegativeCycle():
+            self.cycle = bellman_ford.negativeCycle()
+            return
+        h = [bellman_ford.distTo(v) for v in range(V)]
+
+        # 2. Reweighted digraph (CSR arrays). Rounding errors can make a reweighted edge very slightly negative, so it is rounded up to 0.
+        from_list = []
+        towards_list = []
+        weight_list = []
+        for v in range(V):
+            for edge in ewdg.adjacent(v):
+                w = edge.towards_vert()
+                from_list.append(v)
+                towards_list.append(w)
+                weight_list.append(max(0.0, edge.weight() + h[v] - h[w]))
+        offsets, targets, weights = build_csr_arrays(V, from_list, towards_list, weight_list)
+
+        # 3. Dijkstra's algorithm from every vertex
+        self.dist_matrix = np.empty((V, V), dtype=np.float64)
+        h_array = np.array(h, dtype=np.float64)
+        if processes is None:
+            processes = os.cpu_count() or 1
+
+        if processes == 1:
+            rows = _dijkstra_rows(range(V), Edge_Weighted_Digraph_CSR(offsets=offsets, targets=targets, weights=weights))
+            self._store_rows(rows, h_array)
+        else:
+            # A few chunks per process so that the processes finish at about the same time
+            chunk_size = max(1, V // (processes*4))
+            chunks = [range(start, min(V, start + chunk_size)) for start in range(0, V, chunk_size)]
+            with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker, initargs=(offsets, targets, weights)) as executor:
+                for rows in executor.map(_dijkstra_rows, chunks):
+                    self._store_rows(rows, h_array)
+
+    # Converts the reweighted distances back to the original weights: dist(s, t) = reweighted dist(s, t) - h[s] + h[t]
+    def _store_rows(self, rows, h_array):
+        for s, row in rows:
+            self.dist_matrix[s] = np.frombuffer(row, dtype=np.float64) - h_array[s] + h_array
+
+    def hasNegativeCycle(self):
+        return self.cycle is not None
+
+    def negativeCycle(self):
+        return self.cycle
+
+    def shortest_path(self, u, v):
+        if self.cycle is not None:
+            raise Exception("A negative cycle exists. Shortest paths could not be found.")
+        return float(self.dist_matrix[u][v])
+
+
+def main():
+    ewdg = Edge_Weighted_Digraph(filename=sys.argv[1], delimiter=sys.argv[2])
+    processes = None
+    if len(sys.argv) > 3:
+        processes = int(sys.argv[3])
+
+    start = time.perf_counter()
+    apsp = AP_Shortest_Paths(ewdg, processes)
+    elapsed = time.perf_counter() - start
+
+    if apsp.hasNegativeCycle():
+        print("A negative cycle exists.")
+        print("Shortest paths could not be found.")
+        print("Negative cycle: ")
+        print(apsp.negativeCycle())
+        return
+    print(apsp.shortest_path(0,5))
+    print(apsp.shortest_path(1,2))
+    print('All pairs computed in', round(elapsed, 3), 'seconds')
+
+
+if __name__== "__main__": main()
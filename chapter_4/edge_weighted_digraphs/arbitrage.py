@@ -6,6 +6,9 @@ This algorithm uses an edge_weighted_digraph and a negative cycle detection (in
 
 It doesn't guarantee to find the best arbitrage opportunity, just a arbitrage opportunity that is profitable.
 
+The negative cycle detection uses the queue-based Bellman-Ford of sp_bellmanford_spfa.py, which checks the edgeTo pointers for a cycle
+every V relaxations, so an arbitrage opportunity is usually found long before V passes are finished.
+
 To find the best arbitrage opportunity, could implement an algorithm that takes ln() of each exchange rate and DOESN'T negate it as the edge weights in an edge weighted digraph.
     Would then be reduced to a longest cycle path problem. 
 
@@ -15,11 +18,9 @@ To find the best arbitrage opportunity, could implement an algorithm that takes
 
 import sys
 import math
-# Added Algorithms's parent directory to sys.path
-sys.path.append('C:/Users/borch/Desktop/Work/github_repository_main/')
-from algorithms_python.chapter_4.edge_weighted_digraphs.directed_edge import Directed_Edge
-from algorithms_python.chapter_4.edge_weighted_digraphs.edge_weighted_digraph import Edge_Weighted_Digraph
-from algorithms_python.chapter_4.edge_weighted_digraphs.sp_bellmanford import Shortest_Paths
+from chapter_4.edge_weighted_digraphs.directed_edge import Directed_Edge
+from chapter_4.edge_weighted_digraphs.edge_weighted_digraph import Edge_Weighted_Digraph
+from chapter_4.edge_weighted_digraphs.sp_bellmanford_spfa import Shortest_Paths
 
 
 
@@ -0,0 +1,202 @@
+"""
+Title: arbitrage_best.py
+Author: Ryan Borchardt
+
+Finds every arbitrage opportunity (profitable cycle of exchanges) with at most k exchanges and ranks them by profit.
+arbitrage.py (and arbitrage_incremental.py) only find an arbitrage opportunity, not the best one.
+
+As in arbitrage.py, the weight of the edge v->w is -ln(rate from v to w), so a profitable cycle is a negative cycle
+and the gain of a cycle (the product of its rates) is exp(-weight of the cycle). The weights are stored in a V x V NumPy matrix W (inf: no edge).
+
+1. Min-mean cycle (Karp):
+   D[h][v] = the weight of the lightest walk with exactly h edges that ends at v (starting anywhere), for h = 0..V (a (V+1) x V table,
+   each row is one vectorized step: D[h] = min over u of D[h-1][u] + W[u][v]).
+   mu = min over v of max over h of (D[V][v] - D[h][v])/(V - h) is the smallest mean edge weight of any cycle.
+   If mu >= 0 there is no arbitrage opportunity and nothing else is done.
+   Otherwise a cycle with L edges has a weight of at least L*mu, so no cycle with at most k edges gains more than exp(-k*mu).
+   When only the top best cycles are wanted, the search stops as soon as the worst of the top cycles found gains at least that much.
+
+2. Canonical rotation:
+   A cycle can be started at any of its vertices. Only the rotation that starts at its smallest vertex s is searched for
+   (the other vertices on the cycle are all larger than s), so every cycle is found exactly once and no duplicates have to be removed.
+
+3. Bounded-length Bellman-Ford tables:
+   For each start vertex s, B[r][x] = the weight of the lightest walk from x back to s with at most r edges (using only vertices >= s),
+   a (k+1) x V table where each row is one vectorized step: B[r][x] = min(B[r-1][x], min over y of W[x][y] + B[r-1][y]).
+
+4. Depth-first search from s:
+   A path s->...->x with h edges and a weight of path_weight can only be part of a profitable cycle (with at most k edges) if
+   path_weight + B[k-h][x] < 0, so every other path is pruned (with top, the bound is the weight of the worst of the top cycles found so far).
+   The next vertices y of a path are found with one vectorized test over the row W[x].
+
+Assumes the rates don't change during the search (see arbitrage_incremental.py for rates that change).
+
+Time complexity: Proportional to V^3 (Karp) + k*V^3 (the B tables) + the number of paths that are not pruned (usually few)
+Space complexity: Proportional to V^2 + k*V
+
+Example:
+python arbitrage_best.py rates.txt ' ' 3
+python arbitrage_best.py rates.txt ' ' 5 2
+
+"""
+
+import sys
+import math
+
+import numpy as np
+
+from chapter_1.stack.stack_resizingarray import Stack_ResizingArray
+from chapter_2.priority_queue.priorityqueue_min_binaryheap import PriorityQueue_Min_BinaryHeap
+from chapter_4.edge_weighted_digraphs.directed_edge import Directed_Edge
+from chapter_4.edge_weighted_digraphs.arbitrage import build_ewdag
+from chapter_4.edge_weighted_digraphs.arbitrage_incremental import print_arbitrage
+
+
+
+# Returns the V x V matrix of edge weights of an edge-weighted digraph (inf where there is no edge, the lightest of parallel edges)
+def weight_matrix(ewdg):
+    W = np.full((ewdg.V(), ewdg.V()), np.inf)
+    for edge in ewdg.edges():
+        v = edge.from_vert()
+        w = edge.towards_vert()
+        W[v, w] = min(W[v, w], edge.weight())
+    return W
+
+
+# Karp's minimum mean cycle weight of the digraph with weight matrix W (inf if the digraph has no cycle)
+def min_mean_cycle(W):
+    V = W.shape[0]
+    D = np.empty((V+1, V))
+    D[0] = 0
+    for h in range(1, V+1):
+        D[h] = np.min(D[h-1][:, None] + W, axis=0)
+    with np.errstate(invalid='ignore'):
+        # (D[V][v] - D[h][v])/(V - h), -inf where D[h][v] is inf, nan where D[V][v] is inf (those vertices are skipped)
+        means = (D[V][None, :] - D[:V]) / (V - np.arange(V))[:, None]
+        means[np.isinf(D[:V])] = -np.inf
+        worst = np.max(means, axis=0)
+    worst = worst[np.isfinite(D[V])]
+    if len(worst) == 0:
+        return float('inf')
+    return float(np.min(worst))
+
+
+class Best_Arbitrage:
+    def __init__(self, ewdg, k, top=None, tolerance=1e-12):
+        self.k = k
+        self.top = top
+        self.tolerance = tolerance
+        self.W = weight_matrix(ewdg)
+        V = ewdg.V()
+
+        # Holds (gain, cycle as a tuple of vertices). With top, only the best top cycles are kept (the worst one is the minimum).
+        self._pq = PriorityQueue_Min_BinaryHeap()
+        # A cycle must weigh less than this to be kept
+        self._threshold = -tolerance
+
+        self._mu = min_mean_cycle(self.W)
+        if self._mu >= -tolerance:
+            self._cycles = []
+            return
+        max_gain = math.exp(-k*self._mu)
+
+        for s in range(V):
+            if top is not None and self._pq.size() == top and self._pq.min()[0] >= max_gain:
+                break
+            self._search(s)
+
+        self._cycles = []
+        while not self._pq.isEmpty():
+            self._cycles.append(self._pq.delMin())
+        self._cycles.reverse()
+
+    # Lightest walks back to s with at most r edges through the vertices >= s, for r = 0..k (indexed by x - s)
+    def _back_table(self, s):
+        W = self.W[s:, s:]
+        B = np.empty((self.k+1, W.shape[0]))
+        B[0] = np.inf
+        B[0][0] = 0
+        for r in range(1, self.k+1):
+            B[r] = np.minimum(B[r-1], np.min(W + B[r-1][None, :], axis=1))
+        return B
+
+    def _search(self, s):
+        B = self._back_table(s)
+        W = self.W[s:, s:]
+        k = self.k
+        path = [0]
+        on_path = np.zeros(W.shape[0], dtype=bool)
+        on_path[0] = True
+
+        # path holds the vertices minus s, path_weight is the weight of the edges on path
+        def dfs(path_weight):
+            x = path[-1]
+            h = len(path) - 1
+            # Close the cycle with the edge x->s
+            if path_weight + W[x, 0] < self._threshold:
+                self._add(path_weight + W[x, 0], tuple(v + s for v in path))
+            if h + 2 > k:
+                return
+            # Next vertices y: not on the path, and y->...->s with at most k-h-1 edges can still give a profitable cycle
+            bound = path_weight + W[x] + B[k-h-1]
+            bound[on_path] = np.inf
+            for y in np.nonzero(bound < self._threshold)[0]:
+                # The threshold can get lower while the other vertices are searched
+                if path_weight + W[x, y] + B[k-h-1][y] >= self._threshold:
+                    continue
+                path.append(int(y))
+                on_path[y] = True
+                dfs(path_weight + W[x, y])
+                on_path[y] = False
+                path.pop()
+
+        dfs(0.0)
+
+    def _add(self, weight, vertices):
+        self._pq.insert((math.exp(-weight), vertices))
+        if self.top is not None and self._pq.size() > self.top:
+            self._pq.delMin()
+        if self.top is not None and self._pq.size() == self.top:
+            self._threshold = min(-self.tolerance, -math.log(self._pq.min()[0]))
+
+    # Karp's minimum mean cycle weight (a cycle with L edges weighs at least L times this)
+    def min_mean(self):
+        return self._mu
+
+    def count(self):
+        return len(self._cycles)
+
+    # Returns the arbitrage opportunities as a list of (cycle, gain), from the largest gain to the smallest gain.
+    # cycle is a stack of directed edges (iterating through the stack goes around the cycle in order, starting at its smallest vertex)
+    def arbitrages(self):
+        return [(self._cycle_stack(vertices), gain) for gain, vertices in self._cycles]
+
+    def best(self):
+        if len(self._cycles) == 0:
+            return None
+        return self.arbitrages()[0]
+
+    def _cycle_stack(self, vertices):
+        cycle = Stack_ResizingArray()
+        for i in range(len(vertices)-1, -1, -1):
+            v = vertices[i]
+            w = vertices[(i+1) % len(vertices)]
+            cycle.push(Directed_Edge(v, w, float(self.W[v, w])))
+        return cycle
+
+
+
+def main():
+    ewdg, name_list = build_ewdag(sys.argv[1], sys.argv[2])
+    k = int(sys.argv[3])
+    top = None
+    if len(sys.argv) > 4:
+        top = int(sys.argv[4])
+    best = Best_Arbitrage(ewdg, k, top)
+    print('Minimum mean cycle weight:', best.min_mean())
+    print('Arbitrage opportunities with at most', k, 'exchanges:', best.count())
+    for cycle, gain in best.arbitrages():
+        print_arbitrage(cycle, gain, name_list)
+
+
+if __name__=="__main__": main()
@@ -0,0 +1,189 @@
+"""
+Title: arbitrage_incremental.py
+Author: Ryan Borchardt
+
+A long-lived arbitrage detector for exchange rates that change a few pairs at a time (rate ticks).
+arbitrage.py builds the whole edge-weighted digraph and runs Bellman-Ford for every table of rates (time proportional to E*V).
+Here the digraph is kept between ticks and each tick only searches the part of the digraph that the changed rates affect.
+
+As in arbitrage.py, the weight of the edge v->w is -ln(rate from v to w), so an arbitrage opportunity is a negative cycle.
+
+Potentials instead of shortest paths:
+    The engine keeps a potential p[v] for every vertex such that p[w] <= p[v] + weight(v->w) for every edge (a "feasible potential").
+    A feasible potential exists if and only if the digraph has no negative cycle, so shortest paths from a source are never needed.
+    Starting with p[v] = 0 for every vertex, every edge with a non-negative weight (a rate <= 1) is already feasible.
+
+When the weight of the edge v->w changes:
+    1. The weight went up (or the edge is still feasible): p is still feasible, nothing else is done.
+    2. The weight went down and p[v] + weight(v->w) < p[w]: every negative cycle that can now exist goes through v->w.
+       delta = p[v] + weight(v->w) - p[w] (< 0) is how much p[w] would have to be lowered.
+       Dijkstra's algorithm is run from w on the reduced weights weight(x->y) + p[x] - p[y] (which are >= 0 for every other edge).
+       Only vertices whose distance d[x] from w is less than -delta are put on the indexed priority queue, because only their potentials have to be lowered.
+           If v is reached (d[v] < -delta), the path w->...->v plus v->w is a cycle with weight d[v] + delta < 0: an arbitrage opportunity.
+           Otherwise, p[x] = p[x] + d[x] + delta for every vertex that was reached, and p is feasible again.
+    The work for an update is proportional to the number of vertices (and their edges) whose potential has to be lowered, not to E*V.
+
+Edges that form an arbitrage are "open": they are left out of the digraph that p is feasible for and tried again after every update
+(the rates that caused the arbitrage usually change again within a few ticks). update() returns every open arbitrage opportunity as
+(cycle, gain): cycle is a stack of directed edges (iterating through the stack goes around the cycle in order, starting with the open edge)
+and gain is the product of the rates around the cycle (1.007 means a 0.7% profit).
+
+Floating point: ln() of rates that are arbitrage free can still sum to a tiny negative number, so a cycle has to gain more than tolerance (in ln units) to be reported.
+
+Time complexity:
+    update(): Proportional to (A + the edges of A)*lg(A) for each edge that is tried, A is the number of vertices whose potential is lowered
+    Constructor: E updates
+Space complexity: Proportional to V + E
+
+Example (the updates are read from standard input, one "FROM TO rate" per line):
+python arbitrage_incremental.py rates.txt ' ' < /dev/null
+printf 'USD EUR 0.75\nEUR GBP 0.9\nUSD EUR 0.74\n' | python arbitrage_incremental.py rates.txt ' '
+
+"""
+
+import sys
+import math
+
+from chapter_1.stack.stack_resizingarray import Stack_ResizingArray
+from chapter_4.edge_weighted_digraphs.directed_edge import Directed_Edge
+from chapter_4.edge_weighted_digraphs.arbitrage import build_ewdag
+from chapter_2.priority_queue.indexed_priorityqueue_min_standard import Indexed_PriorityQueue_Min
+
+
+
+class Arbitrage_Engine:
+    def __init__(self, ewdg, name_list=None, tolerance=1e-12):
+        self._V = ewdg.V()
+        V = self._V
+        self.name_list = name_list
+        self.tolerance = tolerance
+
+        # out_arcs[v][w] is the weight (-ln(rate)) of the edge v->w (the weights are changed in place by update())
+        self._out_arcs = [{} for _ in range(V)]
+        self.p = [0.0]*V
+        # open_arcs[(v, w)] is (cycle, gain) for every edge v->w that forms an arbitrage (left out of the digraph p is feasible for)
+        self.open_arcs = {}
+        # One indexed priority queue is reused by all of the searches (each search leaves it empty)
+        self._ipq = Indexed_PriorityQueue_Min(max_nodes=V)
+
+        for directed_edge in ewdg.edges():
+            self._set_weight(directed_edge.from_vert(), directed_edge.towards_vert(), directed_edge.weight())
+        self._retry_open()
+
+    def V(self):
+        return self._V
+
+    def vertex(self, name):
+        return self.name_list.index(name)
+
+    # Sets the rate from v to w (adds the edge v->w if there is none) and returns every open arbitrage opportunity as a list of (cycle, gain)
+    def update(self, v, w, rate):
+        self._set_weight(v, w, -math.log(rate))
+        self._retry_open()
+        return self.arbitrages()
+
+    def arbitrages(self):
+        return list(self.open_arcs.values())
+
+    def hasArbitrage(self):
+        return len(self.open_arcs) > 0
+
+    def _set_weight(self, v, w, weight):
+        self._out_arcs[v][w] = weight
+        if (v, w) in self.open_arcs:
+            return
+        if self.p[v] + weight < self.p[w] - self.tolerance:
+            # Tried by _retry_open()
+            self.open_arcs[(v, w)] = None
+
+    # Tries to put every open edge back into the digraph that p is feasible for
+    def _retry_open(self):
+        for v, w in list(self.open_arcs):
+            cycle = self._insert(v, w)
+            if cycle is None:
+                del self.open_arcs[(v, w)]
+            else:
+                self.open_arcs[(v, w)] = cycle
+
+    # Makes p feasible for the edge v->w (and returns None) or returns (cycle, gain) for a negative cycle through v->w (p is not changed)
+    def _insert(self, v, w):
+        p = self.p
+        weight_vw = self._out_arcs[v][w]
+        delta = p[v] + weight_vw - p[w]
+        if delta >= -self.tolerance:
+            return None
+        limit = -delta - self.tolerance
+
+        ipq = self._ipq
+        distTo = {w: 0.0}
+        edgeTo = {}
+        settled = []
+        ipq.insert(w, 0.0)
+        found = False
+        while ipq:
+            x = ipq.delMin()
+            if x == v:
+                found = True
+                break
+            settled.append(x)
+            for y, weight in self._out_arcs[x].items():
+                if (x, y) in self.open_arcs:
+                    continue
+                # Reduced weights are >= 0 up to rounding
+                d = distTo[x] + max(weight + p[x] - p[y], 0.0)
+                if d < limit and d < distTo.get(y, float('inf')):
+                    distTo[y] = d
+                    edgeTo[y] = x
+                    if ipq.contains(y):
+                        ipq.change(y, d)
+                    else:
+                        ipq.insert(y, d)
+        ipq.clear()
+
+        if not found:
+            for x in settled:
+                p[x] += distTo[x] + delta
+            return None
+
+        # The cycle is v->w->...->v, the stack is filled from its last edge back to its first edge
+        cycle = Stack_ResizingArray()
+        cycle_weight = weight_vw
+        y = v
+        while y != w:
+            x = edgeTo[y]
+            cycle.push(Directed_Edge(x, y, self._out_arcs[x][y]))
+            cycle_weight += self._out_arcs[x][y]
+            y = x
+        cycle.push(Directed_Edge(v, w, weight_vw))
+        return (cycle, math.exp(-cycle_weight))
+
+
+
+def print_arbitrage(cycle, gain, name_list):
+    stake = 1000
+    print('Arbitrage opporunity identified (gain:', gain, '):')
+    for edge in cycle:
+        new_amount = math.exp((edge.weight()*-1))*stake
+        print(stake, name_list[edge.from_vert()], ' to ', new_amount, name_list[edge.towards_vert()])
+        stake = new_amount
+
+
+def main():
+    ewdg, name_list = build_ewdag(sys.argv[1], sys.argv[2])
+    engine = Arbitrage_Engine(ewdg, name_list)
+    for cycle, gain in engine.arbitrages():
+        print_arbitrage(cycle, gain, name_list)
+
+    for line in sys.stdin:
+        line = line.strip().split()
+        if len(line) != 3:
+            continue
+        print('Update:', line[0], 'to', line[1], 'at', line[2])
+        arbitrages = engine.update(engine.vertex(line[0]), engine.vertex(line[1]), float(line[2]))
+        if len(arbitrages) == 0:
+            print('No arbitrage opporunity identified')
+        for cycle, gain in arbitrages:
+            print_arbitrage(cycle, gain, name_list)
+
+
+if __name__=="__main__": main()
@@ -0,0 +1,398 @@
+"""
+Title: contraction_hierarchy.py
+Author: Ryan Borchardt
+
+Contraction hierarchies (CH) for answering many shortest path queries (single source vertex s to single target vertex t) on a static edge-weighted digraph.
+
+Preprocessing (done once):
+    The vertices are contracted one at a time, from the least important vertex to the most important vertex.
+    Contracting a vertex v removes it from the (remaining) digraph. For every pair of edges u->v and v->w that goes through v:
+        if u->v->w is the only shortest path from u to w in the remaining digraph, a shortcut edge u->w (weight of u->v + weight of v->w) is added
+        so that the distances between the remaining vertices don't change.
+        A "witness search" (Dijkstra's algorithm from u that skips v and stops after max_settled vertices or once the distance is more than
+        the weight of u->v->w) looks for another path from u to w that is not longer. If one is found, the shortcut is not needed.
+    The rank of a vertex is its position in the contraction order (the most important vertex is contracted last).
+
+    Vertex order (edge difference heuristic):
+        priority(v) = (# of shortcuts that contracting v would add) - (# of edges into v + # of edges out of v) + (# of neighbours of v that were already contracted)
+        The vertex with the lowest priority is contracted next.
+        Priorities change as the digraph changes, so they are updated lazily: when the vertex with the lowest priority is removed from the
+        indexed priority queue, its priority is computed again. If it is no longer the lowest, it is put back on the queue.
+        The priorities of the neighbours of a contracted vertex are also updated.
+
+    Every edge (original edge or shortcut) goes from a lower ranked vertex to a higher ranked vertex or the other way around:
+        The upward graph keeps the edges v->w where rank[w] > rank[v] (stored with v).
+        The downward graph keeps the edges u->v where rank[u] > rank[v] (stored with v, in reverse: the backward search goes from v to u).
+    Both graphs are stored compactly in the CSR (compressed sparse row) format with typed arrays (see edge_weighted_digraph_csr.py):
+        offsets, targets, weights and middle (the vertex a shortcut goes through, -1 for an original edge).
+
+Query from s to t:
+    A forward Dijkstra search from s that only uses the upward graph and a backward Dijkstra search from t that only uses the downward graph.
+    Every shortest path has a highest ranked vertex: the forward search reaches it by going up from s and the backward search reaches it by going up from t.
+    mu is the length of the shortest path found so far (distF[v] + distB[v] for a vertex v reached by both searches).
+    Each search stops when the minimum distance on its indexed priority queue is at least mu.
+    The path through the meeting vertex is made of shortcuts. Each shortcut u->w through the vertex m is unpacked into the edges u->m and m->w
+    (which can be shortcuts themselves) until only original edges are left (the Directed_Edge objects of the digraph itself, same as Shortest_Paths.pathTo()).
+
+The two searches only go up the hierarchy, so they settle very few vertices (the important vertices are shared by many shortest paths).
+
+Assumptions:
+1. non-negative edges
+2. the edge-weighted digraph doesn't change after the contraction hierarchy is built
+
+Time complexity:
+    Preprocessing: depends on the digraph (the number of shortcuts and the size of the witness searches), each witness search is limited to max_settled vertices
+    Query: Proportional to the size of the upward search spaces of s and t (usually a few hundred vertices even for large road networks) + the length of the path
+Space complexity: Proportional to V + E + number of shortcuts
+
+Example:
+python contraction_hierarchy.py mediumEWD.txt ' '
+python contraction_hierarchy.py mediumEWD.txt ' ' 0 50
+python contraction_hierarchy.py tinyEWD.txt ' ' 0 6
+
+"""
+
+import sys
+import time
+import random
+from array import array
+
+from chapter_1.stack.stack_resizingarray import Stack_ResizingArray
+from chapter_4.edge_weighted_digraphs.edge_weighted_digraph import Edge_Weighted_Digraph
+from chapter_4.edge_weighted_digraphs.sp_dijkstra import Shortest_Paths
+from chapter_2.priority_queue.indexed_priorityqueue_min_standard import Indexed_PriorityQueue_Min
+
+
+class Contraction_Hierarchy:
+    def __init__(self, ewdg, max_settled=50):
+        self._V = ewdg.V()
+        V = self._V
+        self.max_settled = max_settled
+
+        # The remaining digraph while contracting: out_arcs[v][w] and in_arcs[w][v] are the weight of the edge v->w
+        # (only the lightest of parallel edges is kept, self-loops are never part of a shortest path)
+        self._out_arcs = [{} for _ in range(V)]
+        self._in_arcs = [{} for _ in range(V)]
+        # middle[(v, w)]: the vertex that the shortcut v->w goes through (-1 for an original edge)
+        self._middle = {}
+        # original_edge[(v, w)]: the lightest Directed_Edge v->w of ewdg (path() returns these objects for the original edges)
+        self._original_edge = {}
+        for v in range(V):
+            for directed_edge in ewdg.adjacent(v):
+                w = directed_edge.towards_vert()
+                if w != v and directed_edge.weight() < self._out_arcs[v].get(w, float('inf')):
+                    self._out_arcs[v][w] = directed_edge.weight()
+                    self._in_arcs[w][v] = directed_edge.weight()
+                    self._middle[(v, w)] = -1
+                    self._original_edge[(v, w)] = directed_edge
+
+        # One indexed priority queue is reused by all of the witness searches (each search leaves it empty)
+        self._witness_ipq = Indexed_PriorityQueue_Min(max_nodes=V)
+        self._num_shortcuts = 0
+
+        self._contract_all()
+
+        # Not needed after preprocessing
+        self._out_arcs = None
+        self._in_arcs = None
+        self._middle = None
+        self._witness_ipq = None
+
+        # Reused by the queries (each query leaves them empty)
+        self._ipqF = Indexed_PriorityQueue_Min(max_nodes=V)
+        self._ipqB = Indexed_PriorityQueue_Min(max_nodes=V)
+        self._last_query = None
+        self._num_settled = 0
+
+    def V(self):
+        return self._V
+
+    def num_shortcuts(self):
+        return self._num_shortcuts
+
+    # ---------------- Preprocessing ----------------
+
+    # Dijkstra's algorithm from u in the remaining digraph without the vertex skip.
+    # Stops once every vertex in targets is settled, max_settled vertices are settled or the smallest distance is more than max_dist.
+    # Returns a dictionary (vertex: length of a path from u that doesn't go through skip).
+    def _witness_search(self, u, skip, max_dist, targets):
+        ipq = self._witness_ipq
+        distTo = {u: 0}
+        ipq.insert(u, 0)
+        settled = 0
+        targets_left = len(targets)
+        while ipq:
+            if ipq.min() > max_dist or settled == self.max_settled or targets_left == 0:
+                break
+            v = ipq.delMin()
+            settled += 1
+            if v in targets:
+                targets_left -= 1
+            for w, weight in self._out_arcs[v].items():
+                if w == skip:
+                    continue
+                if distTo[v] + weight < distTo.get(w, float('inf')):
+                    distTo[w] = distTo[v] + weight
+                    if ipq.contains(w):
+                        ipq.change(w, distTo[w])
+                    else:
+                        ipq.insert(w, distTo[w])
+        ipq.clear()
+        return distTo
+
+    # Returns the list of shortcuts (u, w, weight) that are needed if v is contracted
+    def _shortcuts(self, v):
+        shortcuts = []
+        out_arcs = self._out_arcs[v]
+        if len(out_arcs) == 0:
+            return shortcuts
+        max_out_weight = max(out_arcs.values())
+        for u, weight_uv in self._in_arcs[v].items():
+            distTo = self._witness_search(u, v, weight_uv + max_out_weight, out_arcs)
+            for w, weight_vw in out_arcs.items():
+                if w == u:
+                    continue
+                if distTo.get(w, float('inf')) > weight_uv + weight_vw:
+                    shortcuts.append((u, w, weight_uv + weight_vw))
+        return shortcuts
+
+    # Edge difference + number of contracted neighbours. Returns (priority, shortcuts needed if v is contracted)
+    def _priority(self, v, contracted_neighbours):
+        shortcuts = self._shortcuts(v)
+        return len(shortcuts) - len(self._in_arcs[v]) - len(self._out_arcs[v]) + contracted_neighbours[v], shortcuts
+
+    def _contract_all(self):
+        V = self._V
+        self.rank = array('i', [0])*V
+        # edges of the upward graph stored with v: (w, weight, middle). edges of the downward graph stored with v: (u, weight, middle)
+        up_lists = [None]*V
+        down_lists = [None]*V
+        contracted_neighbours = [0]*V
+
+        order_ipq = Indexed_PriorityQueue_Min(max_nodes=V)
+        for v in range(V):
+            order_ipq.insert(v, self._priority(v, contracted_neighbours)[0])
+
+        next_rank = 0
+        while order_ipq:
+            v = order_ipq.delMin()
+            # Lazy update: the priority of v may have changed since it was inserted
+            priority, shortcuts = self._priority(v, contracted_neighbours)
+            if order_ipq and priority > order_ipq.min():
+                order_ipq.insert(v, priority)
+                continue
+
+            self.rank[v] = next_rank
+            next_rank += 1
+
+            # Every remaining neighbour of v will be contracted after v (higher rank)
+            up_lists[v] = [(w, weight, self._middle[(v, w)]) for w, weight in self._out_arcs[v].items()]
+            down_lists[v] = [(u, weight, self._middle[(u, v)]) for u, weight in self._in_arcs[v].items()]
+
+            for u, w, weight in shortcuts:
+                if weight < self._out_arcs[u].get(w, float('inf')):
+                    self._out_arcs[u][w] = weight
+                    self._in_arcs[w][u] = weight
+                    self._middle[(u, w)] = v
+                    self._num_shortcuts += 1
+
+            # Remove v from the remaining digraph
+            neighbours = set(self._out_arcs[v]) | set(self._in_arcs[v])
+            for w in self._out_arcs[v]:
+                del self._in_arcs[w][v]
+            for u in self._in_arcs[v]:
+                del self._out_arcs[u][v]
+            self._out_arcs[v] = {}
+            self._in_arcs[v] = {}
+
+            for x in neighbours:
+                contracted_neighbours[x] += 1
+                order_ipq.change(x, self._priority(x, contracted_neighbours)[0])
+
+        self.up_offsets, self.up_targets, self.up_weights, self.up_middle = _csr_arrays(up_lists)
+        self.down_offsets, self.down_targets, self.down_weights, self.down_middle = _csr_arrays(down_lists)
+
+    # ---------------- Queries ----------------
+
+    # Bidirectional upward search. Returns (mu, meeting vertex, forward parents, backward parents).
+    # parentF[v] is the position (in the upward arrays) of the edge the forward search used to reach v (-1 for s).
+    # parentB[v] is the position (in the downward arrays) of the edge the backward search used to reach v (-1 for t).
+    def _search(self, s, t):
+        if self._last_query is not None and self._last_query[0] == s and self._last_query[1] == t:
+            return self._last_query[2]
+
+        ipqF = self._ipqF
+        ipqB = self._ipqB
+        distF = {s: 0}
+        distB = {t: 0}
+        parentF = {s: -1}
+        parentB = {t: -1}
+        # The vertex of parentF[v]/parentB[v] (the vertex the search came from)
+        fromF = {}
+        fromB = {}
+        mu = float('inf')
+        meet = None
+        if s == t:
+            mu = 0
+            meet = s
+        ipqF.insert(s, 0)
+        ipqB.insert(t, 0)
+        settled = 0
+
+        while (ipqF and ipqF.min() < mu) or (ipqB and ipqB.min() < mu):
+            # The search with the smaller minimum goes next (a search that can't improve mu is finished)
+            forward = ipqF and ipqF.min() < mu and (not (ipqB and ipqB.min() < mu) or ipqF.min() <= ipqB.min())
+            if forward:
+                ipq, distTo, parent, came_from, other_distTo = ipqF, distF, parentF, fromF, distB
+                offsets, targets, weights = self.up_offsets, self.up_targets, self.up_weights
+            else:
+                ipq, distTo, parent, came_from, other_distTo = ipqB, distB, parentB, fromB, distF
+                offsets, targets, weights = self.down_offsets, self.down_targets, self.down_weights
+            v = ipq.delMin()
+            settled += 1
+            for i in range(offsets[v], offsets[v+1]):
+                w = targets[i]
+                if distTo[v] + weights[i] < distTo.get(w, float('inf')):
+                    distTo[w] = distTo[v] + weights[i]
+                    parent[w] = i
+                    came_from[w] = v
+                    if ipq.contains(w):
+                        ipq.change(w, distTo[w])
+                    else:
+                        ipq.insert(w, distTo[w])
+                    if w in other_distTo and distTo[w] + other_distTo[w] < mu:
+                        mu = distTo[w] + other_distTo[w]
+                        meet = w
+
+        ipqF.clear()
+        ipqB.clear()
+
+        result = (mu, meet, parentF, fromF, parentB, fromB)
+        self._last_query = (s, t, result)
+        self._num_settled = settled
+        return result
+
+    def hasPath(self, s, t):
+        return self._search(s, t)[1] is not None
+
+    # Length of the shortest path from s to t (infinity if there is no path)
+    def dist(self, s, t):
+        return self._search(s, t)[0]
+
+    # Number of vertices settled by the last query
+    def num_settled(self):
+        return self._num_settled
+
+    # Unpacks the edge u->w (original edge or shortcut) into original edges, appended to edge_list in order
+    def _unpack(self, u, w, weight, middle, edge_list):
+        arcs = [(u, w, weight, middle)]
+        while arcs:
+            u, w, weight, middle = arcs.pop()
+            if middle == -1:
+                edge_list.append(self._original_edge[(u, w)])
+                continue
+            # The middle vertex was contracted before u and w:
+            # u->middle is in the downward graph of middle and middle->w is in the upward graph of middle
+            i = _find(self.down_offsets, self.down_targets, middle, u)
+            j = _find(self.up_offsets, self.up_targets, middle, w)
+            arcs.append((middle, w, self.up_weights[j], self.up_middle[j]))
+            arcs.append((u, middle, self.down_weights[i], self.down_middle[i]))
+
+    # Returns stack of directed edges from s to t (the first edge of the path is on top of the stack)
+    # Returns None if there is no path.
+    def path(self, s, t):
+        mu, meet, parentF, fromF, parentB, fromB = self._search(s, t)
+        if meet is None:
+            return None
+        if s == t:
+            return "No edges required to reach source vertex from source vertex"
+
+        # edges of the upward graph from s to meet (collected from meet back to s)
+        forward_arcs = []
+        v = meet
+        while parentF[v] != -1:
+            i = parentF[v]
+            forward_arcs.append((fromF[v], v, self.up_weights[i], self.up_middle[i]))
+            v = fromF[v]
+        edge_list = []
+        for i in range(len(forward_arcs)-1, -1, -1):
+            self._unpack(*forward_arcs[i], edge_list)
+
+        # edges of the downward graph from meet to t (the backward search reached v from fromB[v], so the edge is v->fromB[v])
+        v = meet
+        while parentB[v] != -1:
+            i = parentB[v]
+            self._unpack(v, fromB[v], self.down_weights[i], self.down_middle[i], edge_list)
+            v = fromB[v]
+
+        path_stack = Stack_ResizingArray()
+        for i in range(len(edge_list)-1, -1, -1):
+            path_stack.push(edge_list[i])
+        return path_stack
+
+
+# Builds the CSR arrays (offsets, targets, weights, middle) from lists of (vertex, weight, middle) for every vertex
+def _csr_arrays(lists):
+    offsets = array('q', [0])
+    targets = array('i')
+    weights = array('d')
+    middle = array('i')
+    for arc_list in lists:
+        for w, weight, m in arc_list:
+            targets.append(w)
+            weights.append(weight)
+            middle.append(m)
+        offsets.append(len(targets))
+    return offsets, targets, weights, middle
+
+
+# Returns the position of the edge between v and w in the range of v
+def _find(offsets, targets, v, w):
+    for i in range(offsets[v], offsets[v+1]):
+        if targets[i] == w:
+            return i
+    raise Exception("Edge not found in the contraction hierarchy.")
+
+
+
+def main():
+    ewdg = Edge_Weighted_Digraph(filename=sys.argv[1], delimiter=sys.argv[2])
+
+    start = time.perf_counter()
+    ch = Contraction_Hierarchy(ewdg)
+    print('Preprocessing:', round(time.perf_counter() - start, 3), 'seconds,', ch.num_shortcuts(), 'shortcuts')
+
+    if len(sys.argv) > 3:
+        s = int(sys.argv[3])
+        t = int(sys.argv[4])
+        print("Shortest path from ", s, " to ", t, ":")
+        print(ch.path(s, t))
+        print("Total cost:", ch.dist(s, t))
+        print("Vertices settled (CH):", ch.num_settled())
+        print("Vertices settled (Dijkstra stopping at t):", Shortest_Paths(ewdg, s, targets=[t]).num_settled())
+        return
+
+    random.seed(1)
+    queries = [(random.randrange(ewdg.V()), random.randrange(ewdg.V())) for _ in range(200)]
+    settled = 0
+    start = time.perf_counter()
+    for s, t in queries:
+        ch.dist(s, t)
+        settled += ch.num_settled()
+    ch_time = time.perf_counter() - start
+
+    dijkstra_settled = 0
+    start = time.perf_counter()
+    for s, t in queries:
+        dijkstra_settled += Shortest_Paths(ewdg, s, targets=[t]).num_settled()
+    dijkstra_time = time.perf_counter() - start
+
+    for s, t in queries:
+        if abs(ch.dist(s, t) - Shortest_Paths(ewdg, s, targets=[t]).distTo(t)) > 1e-9:
+            raise Exception("CH and Dijkstra's algorithm found different distances from " + str(s) + " to " + str(t))
+    print('Average over', len(queries), 'random queries:')
+    print('CH:                     ', settled/len(queries), 'vertices settled,', round(ch_time/len(queries)*1000, 3), 'ms')
+    print('Dijkstra stopping at t: ', dijkstra_settled/len(queries), 'vertices settled,', round(dijkstra_time/len(queries)*1000, 3), 'ms')
+
+
+if __name__== "__main__": main()
@@ -39,6 +39,7 @@ import sys
 from chapter_4.edge_weighted_digraphs.directed_edge import Directed_Edge
 from chapter_4.edge_weighted_digraphs.edge_weighted_digraph import Edge_Weighted_Digraph
 from chapter_4.edge_weighted_digraphs.lp_acyclic import Longest_Paths
+from tracing.tracer import Print_Tracer
 
 
 def build_ewdag(filename, delimter):
@@ -73,8 +74,22 @@ def build_ewdag(filename, delimter):
     
     return ewdag
     
-def scheduler(ewdag):
-    lp_acyclic = Longest_Paths(ewdag, s=ewdag.V()-2)
+# Returns (durations, successors) of the jobs of an ewdag built by build_ewdag(): successors[i] are the jobs that can't start before job i has finished
+def jobs_from_ewdag(ewdag):
+    num_jobs = ewdag.V()//2 - 1
+    target_vertex = num_jobs*2 + 1
+    durations = [0.0]*num_jobs
+    successors = [[] for _ in range(num_jobs)]
+    for i in range(num_jobs):
+        for edge in ewdag.adjacent(i):
+            durations[i] = edge.weight()
+        for edge in ewdag.adjacent(i+num_jobs):
+            if edge.towards_vert() != target_vertex:
+                successors[i].append(edge.towards_vert())
+    return durations, successors
+
+def scheduler(ewdag, tracer=None):
+    lp_acyclic = Longest_Paths(ewdag, s=ewdag.V()-2, tracer=tracer)
     
     scheduler_string = "Start times: \n"
     for i in range(int(ewdag.V()/2 - 1)):
@@ -85,7 +100,7 @@ def scheduler(ewdag):
         
 def main():
     ewdag = build_ewdag(sys.argv[1], sys.argv[2])
-    schedule_string = scheduler(ewdag)
+    schedule_string = scheduler(ewdag, tracer=Print_Tracer())
     print(schedule_string)
     
     
@@ -0,0 +1,248 @@
+"""
+Title: cpm_incremental.py
+Author: Ryan Borchardt
+
+Critical path method (see cpm.py) for a pipeline of jobs whose durations and precedence constraints keep changing.
+cpm.py builds the 2N+2 vertex edge-weighted DAG and runs Longest_Paths on all of it again after every change.
+Here the schedule is kept up to date, and a change only does work for the jobs whose times actually change.
+
+For every job i the structure keeps:
+    1. ord[i]: the position of job i in a topological order of the jobs (and vertex_at[position], the job at each position)
+    2. earliest[i]: the earliest start time = max over the predecessors p of (earliest[p] + duration[p]) (0 if there are none)
+    3. tail[i]: the length of the longest chain of jobs that starts with i = duration[i] + max over the successors s of tail[s] (0 if there are none)
+The makespan is max over i of (earliest[i] + duration[i]) (kept on an indexed priority queue of finish times),
+latest start time = makespan - tail[i] and slack = latest start time - earliest[i] (0 for the jobs on a critical path).
+
+Updates:
+    set_duration(i, d): the earliest start times of the jobs after i and the tails of i and the jobs before i can change.
+    add_constraint(i, j): job j can't start before job i has finished.
+        If ord[i] > ord[j], the topological order is repaired like the dynamic topological sort of Pearce and Kelly:
+            F = the jobs reachable from j with a position <= ord[i] (if i is one of them, the constraint would create a cycle and is rejected)
+            B = the jobs that reach i with a position >= ord[j]
+            Only F and B get new positions: the positions they had (sorted) are given to the jobs of B first and then the jobs of F
+            (each set keeps its own relative order).
+    remove_constraint(i, j): the topological order stays valid.
+    After each update, the earliest start times are propagated forwards from the jobs that changed, in topological order
+    (an indexed priority queue keyed by ord), and the tails are propagated backwards in reverse topological order.
+    A job is only put on the priority queue if one of its neighbours changed, so the work is proportional to the jobs
+    whose times change (and their constraints), not to N.
+    Note that the latest start times are upstream of a change: a longer job near the end of a long chain changes the tail of every job before it.
+
+Jobs file format (same as jobsPC.txt): the number of jobs, then one line per job: duration followed by the jobs that must start after it finishes.
+
+Time complexity:
+    Constructor: Proportional to N + E (E is the number of constraints)
+    Each update: Proportional to (A + the constraints of A)*lg(N), where A is the number of jobs whose times (or positions) change
+Space complexity: Proportional to N + E
+
+Example (the updates are read from standard input: "duration i d", "add i j" or "remove i j", one per line):
+python cpm_incremental.py jobsPC.txt ' ' < /dev/null
+printf 'duration 5 200\nadd 2 5\nremove 7 3\nadd 3 0\n' | python cpm_incremental.py jobsPC.txt ' '
+
+"""
+
+import sys
+
+from chapter_2.priority_queue.indexed_priorityqueue_min_standard import Indexed_PriorityQueue_Min
+from chapter_4.directed_graphs.digraph import Digraph
+from chapter_4.directed_graphs.topological_kahn import Topological_Kahn
+
+
+
+# Returns (durations, successors) from a jobsPC.txt-style file
+def read_jobs(filename, delimiter):
+    with open(filename, 'r') as file_object:
+        num_jobs = int(file_object.readline())
+        durations = []
+        successors = []
+        for i in range(num_jobs):
+            list_string = file_object.readline().split(delimiter)
+            durations.append(float(list_string[0]))
+            successors.append([int(j) for j in list_string[1:]])
+    return durations, successors
+
+
+class Incremental_CPM:
+    def __init__(self, durations, successors):
+        self.N = len(durations)
+        N = self.N
+        self.duration = list(durations)
+        self.succ = [set() for _ in range(N)]
+        self.pred = [set() for _ in range(N)]
+        digraph = Digraph(V=N)
+        for i in range(N):
+            for j in successors[i]:
+                if j not in self.succ[i]:
+                    self.succ[i].add(j)
+                    self.pred[j].add(i)
+                    digraph.addEdge(i, j)
+
+        topological_sort = Topological_Kahn(digraph)
+        if not topological_sort.isDag():
+            raise Exception("The precedence constraints have a cycle. A schedule could not be found.")
+        self.vertex_at = topological_sort.order()
+        self.ord = [0]*N
+        for position, v in enumerate(self.vertex_at):
+            self.ord[v] = position
+
+        self.earliest = [0.0]*N
+        for v in self.vertex_at:
+            for p in self.pred[v]:
+                self.earliest[v] = max(self.earliest[v], self.earliest[p] + self.duration[p])
+        self.tail = [0.0]*N
+        for v in reversed(self.vertex_at):
+            self.tail[v] = self.duration[v] + max([self.tail[s] for s in self.succ[v]], default=0.0)
+
+        # The finish times are kept negated so that the minimum is the makespan
+        self._finish = Indexed_PriorityQueue_Min(max_nodes=N)
+        for v in range(N):
+            self._finish.insert(v, -(self.earliest[v] + self.duration[v]))
+        # Reused by the propagations (each propagation leaves it empty)
+        self._ipq = Indexed_PriorityQueue_Min(max_nodes=N)
+
+    # ---------------- Queries ----------------
+
+    def makespan(self):
+        if self.N == 0:
+            return 0.0
+        return -self._finish.min()
+
+    def earliest_start(self, i):
+        return self.earliest[i]
+
+    def latest_start(self, i):
+        return self.makespan() - self.tail[i]
+
+    def slack(self, i):
+        return self.latest_start(i) - self.earliest[i]
+
+    # Returns the jobs in topological order
+    def order(self):
+        return list(self.vertex_at)
+
+    # ---------------- Updates ----------------
+
+    def set_duration(self, i, duration):
+        if duration == self.duration[i]:
+            return
+        self.duration[i] = duration
+        self._finish.change(i, -(self.earliest[i] + duration))
+        self._propagate_earliest(self.succ[i])
+        self._propagate_tail([i])
+
+    # Job j can't start before job i has finished
+    def add_constraint(self, i, j):
+        if j in self.succ[i]:
+            return
+        if i == j:
+            raise Exception("A job can't be constrained by itself.")
+        if self.ord[i] > self.ord[j]:
+            self._reorder(i, j)
+        self.succ[i].add(j)
+        self.pred[j].add(i)
+        self._propagate_earliest([j])
+        self._propagate_tail([i])
+
+    def remove_constraint(self, i, j):
+        if j not in self.succ[i]:
+            return
+        self.succ[i].remove(j)
+        self.pred[j].remove(i)
+        self._propagate_earliest([j])
+        self._propagate_tail([i])
+
+    # Pearce-Kelly: makes ord[i] < ord[j] by only moving the jobs between them that have to move.
+    # Raises an exception (and changes nothing) if j already reaches i.
+    def _reorder(self, i, j):
+        lower = self.ord[j]
+        upper = self.ord[i]
+        forward = self._reach(j, self.succ, lambda x: self.ord[x] <= upper)
+        if i in forward:
+            raise Exception("Adding the constraint " + str(i) + " -> " + str(j) + " would create a cycle.")
+        backward = self._reach(i, self.pred, lambda x: self.ord[x] >= lower)
+
+        forward.sort(key=lambda x: self.ord[x])
+        backward.sort(key=lambda x: self.ord[x])
+        positions = sorted(self.ord[x] for x in backward + forward)
+        for position, v in zip(positions, backward + forward):
+            self.ord[v] = position
+            self.vertex_at[position] = v
+
+    # Iterative DFS from start through the adjacency lists adj, only visiting the vertices x where inside(x) is True.
+    # Returns the list of the vertices that were visited.
+    def _reach(self, start, adj, inside):
+        visited = {start}
+        stack = [start]
+        while len(stack) > 0:
+            v = stack.pop()
+            for w in adj[v]:
+                if w not in visited and inside(w):
+                    visited.add(w)
+                    stack.append(w)
+        return list(visited)
+
+    # Recomputes the earliest start times of the jobs in seeds, and of the jobs after them that change, in topological order
+    def _propagate_earliest(self, seeds):
+        ipq = self._ipq
+        for v in seeds:
+            if not ipq.contains(v):
+                ipq.insert(v, self.ord[v])
+        while ipq:
+            v = ipq.delMin()
+            new_earliest = max([self.earliest[p] + self.duration[p] for p in self.pred[v]], default=0.0)
+            if new_earliest == self.earliest[v]:
+                continue
+            self.earliest[v] = new_earliest
+            self._finish.change(v, -(new_earliest + self.duration[v]))
+            for s in self.succ[v]:
+                if not ipq.contains(s):
+                    ipq.insert(s, self.ord[s])
+
+    # Recomputes the tails of the jobs in seeds, and of the jobs before them that change, in reverse topological order
+    def _propagate_tail(self, seeds):
+        ipq = self._ipq
+        for v in seeds:
+            if not ipq.contains(v):
+                ipq.insert(v, -self.ord[v])
+        while ipq:
+            v = ipq.delMin()
+            new_tail = self.duration[v] + max([self.tail[s] for s in self.succ[v]], default=0.0)
+            if new_tail == self.tail[v]:
+                continue
+            self.tail[v] = new_tail
+            for p in self.pred[v]:
+                if not ipq.contains(p):
+                    ipq.insert(p, -self.ord[p])
+
+    def __str__(self):
+        string = "Job: earliest start, latest start, slack \n"
+        for i in range(self.N):
+            string = string + str(i) + ": " + str(self.earliest_start(i)) + ", " + str(self.latest_start(i)) + ", " + str(self.slack(i)) + "\n"
+        string = string + "Finish time: " + str(self.makespan())
+        return string
+
+
+
+def main():
+    durations, successors = read_jobs(sys.argv[1], sys.argv[2])
+    cpm = Incremental_CPM(durations, successors)
+    print(cpm)
+
+    for line in sys.stdin:
+        line = line.strip().split()
+        if len(line) != 3:
+            continue
+        print('\nUpdate:', ' '.join(line))
+        if line[0] == 'duration':
+            cpm.set_duration(int(line[1]), float(line[2]))
+        elif line[0] == 'add':
+            try:
+                cpm.add_constraint(int(line[1]), int(line[2]))
+            except Exception as error:
+                print(error)
+        elif line[0] == 'remove':
+            cpm.remove_constraint(int(line[1]), int(line[2]))
+        print(cpm)
+
+
+if __name__=="__main__": main()
@@ -0,0 +1,194 @@
+"""
+Title: cpm_list_scheduler.py
+Author: Ryan Borchardt
+
+Schedules precedence-constrained jobs (a jobsPC.txt-style file) on k identical workers with list scheduling.
+The critical path method (cpm.py) assumes there are as many workers as there are jobs that can run at the same time,
+so its finish time is only a lower bound when there are k workers.
+
+Priorities (critical path method):
+    The edge-weighted DAG is built with cpm.build_ewdag() and Longest_Paths is run on the reversed DAG from the target vertex.
+    tail[i] = the longest path from job i to the target vertex (the duration of job i plus the longest chain of jobs that has to run after it).
+    The jobs with the longest tails are the most urgent (they are on, or close to, the critical path).
+
+List scheduling (simulation of the k workers):
+    1. The jobs whose predecessors have all finished are kept on a minimum priority queue ordered by (-tail, job).
+    2. The busy workers are kept on a minimum priority queue ordered by the time they are free again (the finish time of their job).
+    3. At time t, while there is an idle worker and a ready job, the ready job with the longest tail is started on the idle worker at time t.
+       Then t becomes the earliest free time of the busy workers. Every worker that is free at t finishes its job:
+       the worker is idle again and the jobs that only waited for that job are put on the ready priority queue.
+    A worker is never idle while a job is ready, so the makespan is at most (total work)/k + (CPM finish time) (Graham's bound),
+    and at least max((total work)/k, CPM finish time).
+
+Results:
+    start(i) and worker(i): when and on which worker job i runs, makespan(), utilization() = total work/(k * makespan).
+
+Time complexity: Proportional to N^2 (building the DAG and Longest_Paths, see cpm.py) + N*lg(N) (the priority queues)
+Space complexity: Proportional to N^2 (the DAG)
+
+Example:
+python cpm_list_scheduler.py jobsPC.txt ' ' 2
+python cpm_list_scheduler.py jobsPC.txt ' ' 3
+Benchmark against the unlimited-worker CPM bound on generated job DAGs (N jobs in levels, for each number of workers):
+python cpm_list_scheduler.py --benchmark 100000 4 16 64
+
+"""
+
+import sys
+import time
+import random
+
+from chapter_2.priority_queue.priorityqueue_min_binaryheap import PriorityQueue_Min_BinaryHeap
+from chapter_4.edge_weighted_digraphs.directed_edge import Directed_Edge
+from chapter_4.edge_weighted_digraphs.edge_weighted_digraph import Edge_Weighted_Digraph
+from chapter_4.edge_weighted_digraphs.cpm import build_ewdag, jobs_from_ewdag
+from chapter_4.edge_weighted_digraphs.lp_acyclic import Longest_Paths
+
+
+
+class List_Scheduler:
+    def __init__(self, ewdag, k):
+        self.k = k
+        self.N = ewdag.V()//2 - 1
+        N = self.N
+        self.duration, self.successors = jobs_from_ewdag(ewdag)
+
+        forward = Longest_Paths(ewdag, s=2*N)
+        backward = Longest_Paths(ewdag.reverse(), s=2*N+1)
+        self._cpm_makespan = forward.distTo(2*N+1)
+        self.tail = [backward.distTo(i) for i in range(N)]
+
+        self._start = [None]*N
+        self._worker = [None]*N
+        self._schedule()
+
+    def _schedule(self):
+        N = self.N
+        waiting_for = [0]*N
+        for i in range(N):
+            for j in self.successors[i]:
+                waiting_for[j] += 1
+
+        ready = PriorityQueue_Min_BinaryHeap()
+        for i in range(N):
+            if waiting_for[i] == 0:
+                ready.insert((-self.tail[i], i))
+        # (free time, worker, job) for every busy worker
+        busy = PriorityQueue_Min_BinaryHeap()
+        idle = list(range(self.k-1, -1, -1))
+
+        t = 0.0
+        makespan = 0.0
+        while True:
+            while len(idle) > 0 and not ready.isEmpty():
+                i = ready.delMin()[1]
+                worker = idle.pop()
+                self._start[i] = t
+                self._worker[i] = worker
+                busy.insert((t + self.duration[i], worker, i))
+            if busy.isEmpty():
+                break
+            t = busy.min()[0]
+            while not busy.isEmpty() and busy.min()[0] == t:
+                _, worker, i = busy.delMin()
+                idle.append(worker)
+                makespan = t
+                for j in self.successors[i]:
+                    waiting_for[j] -= 1
+                    if waiting_for[j] == 0:
+                        ready.insert((-self.tail[j], j))
+        self._makespan = makespan
+
+    def start(self, i):
+        return self._start[i]
+
+    def worker(self, i):
+        return self._worker[i]
+
+    def makespan(self):
+        return self._makespan
+
+    # The finish time of the critical path method (unlimited workers), a lower bound for the makespan
+    def cpm_makespan(self):
+        return self._cpm_makespan
+
+    def utilization(self):
+        if self._makespan == 0:
+            return 0.0
+        return sum(self.duration)/(self.k*self._makespan)
+
+    # Checks that every job starts after all of its predecessors have finished and that the jobs of a worker don't overlap
+    def isFeasible(self):
+        for i in range(self.N):
+            if self._start[i] is None:
+                return False
+            for j in self.successors[i]:
+                if self._start[j] is None or self._start[j] < self._start[i] + self.duration[i]:
+                    return False
+        jobs_of_worker = [[] for _ in range(self.k)]
+        for i in range(self.N):
+            jobs_of_worker[self._worker[i]].append((self._start[i], self._start[i] + self.duration[i]))
+        for intervals in jobs_of_worker:
+            intervals.sort()
+            for x in range(1, len(intervals)):
+                if intervals[x][0] < intervals[x-1][1]:
+                    return False
+        return True
+
+    def __str__(self):
+        string = "Job: start, worker \n"
+        for i in range(self.N):
+            string = string + str(i) + ": " + str(self._start[i]) + ", " + str(self._worker[i]) + "\n"
+        string = string + "Finish time: " + str(self._makespan) + " (critical path method: " + str(self._cpm_makespan) + ")\n"
+        string = string + "Utilization: " + str(self.utilization())
+        return string
+
+
+# Builds the same ewdag as cpm.build_ewdag() for N random jobs in levels (each job after the first level depends on 1 to 3 jobs of the level before it)
+def generate_ewdag(N, levels=100, seed=0):
+    rng = random.Random(seed)
+    ewdag = Edge_Weighted_Digraph(N*2+2)
+    source_vertex = N*2
+    target_vertex = N*2 + 1
+    level_of = sorted(rng.randrange(levels) for _ in range(N))
+    first_of_level = [N]*(levels+1)
+    for i in range(N-1, -1, -1):
+        first_of_level[level_of[i]] = i
+    for l in range(levels-1, -1, -1):
+        first_of_level[l] = min(first_of_level[l], first_of_level[l+1])
+
+    for i in range(N):
+        ewdag.addEdge(Directed_Edge(v=i, w=i+N, weight=float(rng.randint(1, 100))))
+        ewdag.addEdge(Directed_Edge(v=source_vertex, w=i, weight=0))
+        ewdag.addEdge(Directed_Edge(v=i+N, w=target_vertex, weight=0))
+        l = level_of[i]
+        if l > 0 and first_of_level[l-1] < first_of_level[l]:
+            for p in set(rng.randrange(first_of_level[l-1], first_of_level[l]) for _ in range(rng.randint(1, 3))):
+                ewdag.addEdge(Directed_Edge(v=p+N, w=i, weight=0))
+    return ewdag
+
+
+def benchmark(N, worker_counts):
+    start = time.perf_counter()
+    ewdag = generate_ewdag(N)
+    print('Generated', N, 'jobs:', round(time.perf_counter() - start, 3), 'seconds')
+    for k in worker_counts:
+        start = time.perf_counter()
+        scheduler = List_Scheduler(ewdag, k)
+        elapsed = time.perf_counter() - start
+        lower_bound = max(scheduler.cpm_makespan(), sum(scheduler.duration)/k)
+        print('k =', k, ': makespan', scheduler.makespan(), ', CPM bound', scheduler.cpm_makespan(),
+              ', makespan/lower bound', round(scheduler.makespan()/lower_bound, 4), ', utilization', round(scheduler.utilization(), 4),
+              ', feasible', scheduler.isFeasible(), ',', round(elapsed, 3), 'seconds')
+
+
+def main():
+    if sys.argv[1] == '--benchmark':
+        benchmark(int(sys.argv[2]), [int(k) for k in sys.argv[3:]])
+        return
+    ewdag = build_ewdag(sys.argv[1], sys.argv[2])
+    scheduler = List_Scheduler(ewdag, int(sys.argv[3]))
+    print(scheduler)
+
+
+if __name__=="__main__": main()
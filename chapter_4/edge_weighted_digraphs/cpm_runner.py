@@ -0,0 +1,165 @@
+"""
+Title: cpm_runner.py
+Author: Ryan Borchardt
+
+Runs a pipeline of precedence-constrained jobs (a jobsPC.txt-style file) on a pool of threads or processes.
+cpm.py only computes the start times of the critical path method, this module actually runs the jobs:
+a job is dispatched as soon as every job it depends on has finished (not at its planned start time).
+
+Planning (critical path method, see cpm.py):
+    The edge-weighted DAG is built with cpm.build_ewdag() (job i is the edge i -> i+N with the duration of the job as its weight).
+    1. earliest start of job i: the longest path from the source vertex to i (Longest_Paths on the DAG)
+    2. tail of job i: the longest path from i to the target vertex (Longest_Paths on the reversed DAG, from the target vertex).
+       The tail includes the duration of job i and of every job that has to run after it.
+    3. planned makespan: the longest path from the source vertex to the target vertex
+    4. slack of job i: planned makespan - earliest start - tail (0 for the jobs on a critical path)
+
+Running:
+    The jobs whose predecessors have all finished are kept on a minimum priority queue ordered by (slack, -tail),
+    so when there are more ready jobs than workers, the jobs on (or closest to) the critical path are dispatched first.
+    At most max_workers (default: the number of CPUs) jobs are dispatched at a time, so that the pool doesn't queue them in its own (first in, first out) order.
+    When a job finishes, the jobs that depend on it have one less predecessor to wait for and are put on the priority queue once they have none left.
+
+jobs[i] is the callable for job i (it is called with no arguments). For a process pool the callables must be picklable (module-level functions).
+If a job raises an exception, no other jobs are dispatched and the exception is raised by run() once the running jobs have finished.
+
+run() returns the actual makespan (wall-clock seconds), and start_time(i) / finish_time(i) give the actual times of each job (seconds from the start of run()).
+The planned times are in the units of the jobs file; time_scale converts them to seconds (planned_makespan() * time_scale is comparable with the actual makespan).
+
+Time complexity: Proportional to N^2 (planning, see cpm.py) + N*lg(N) (priority queue) + the time it takes to run the jobs
+Space complexity: Proportional to N^2 (the DAG)
+
+Example (every job sleeps for its duration * time_scale seconds):
+python cpm_runner.py jobsPC.txt ' ' 0.01
+python cpm_runner.py jobsPC.txt ' ' 0.01 2
+
+"""
+
+import sys
+import os
+import time
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from chapter_2.priority_queue.priorityqueue_min_binaryheap import PriorityQueue_Min_BinaryHeap
+from chapter_4.edge_weighted_digraphs.cpm import build_ewdag, jobs_from_ewdag
+from chapter_4.edge_weighted_digraphs.lp_acyclic import Longest_Paths
+
+
+
+class CPM_Runner:
+    def __init__(self, ewdag, jobs, max_workers=None, processes=False, time_scale=1.0):
+        self.N = ewdag.V()//2 - 1
+        N = self.N
+        self.jobs = jobs
+        if max_workers is None:
+            max_workers = os.cpu_count()
+        self.max_workers = max_workers
+        self.processes = processes
+        self.time_scale = time_scale
+
+        source_vertex = 2*N
+        target_vertex = 2*N + 1
+        # successors[i]: the jobs that can't start before job i has finished
+        _, self.successors = jobs_from_ewdag(ewdag)
+        self.num_predecessors = [0]*N
+        for i in range(N):
+            for j in self.successors[i]:
+                self.num_predecessors[j] += 1
+
+        forward = Longest_Paths(ewdag, s=source_vertex)
+        backward = Longest_Paths(ewdag.reverse(), s=target_vertex)
+        self._planned_makespan = forward.distTo(target_vertex)
+        self.earliest_start = [forward.distTo(i) for i in range(N)]
+        self.tail = [backward.distTo(i) for i in range(N)]
+        self.slack = [self._planned_makespan - self.earliest_start[i] - self.tail[i] for i in range(N)]
+
+        self._start_time = [None]*N
+        self._finish_time = [None]*N
+        self._makespan = None
+
+    def planned_makespan(self):
+        return self._planned_makespan
+
+    def planned_start(self, i):
+        return self.earliest_start[i]
+
+    def makespan(self):
+        return self._makespan
+
+    def start_time(self, i):
+        return self._start_time[i]
+
+    def finish_time(self, i):
+        return self._finish_time[i]
+
+    def run(self):
+        N = self.N
+        waiting_for = list(self.num_predecessors)
+        ready = PriorityQueue_Min_BinaryHeap()
+        for i in range(N):
+            if waiting_for[i] == 0:
+                ready.insert((self.slack[i], -self.tail[i], i))
+
+        if self.processes:
+            executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        else:
+            executor = ThreadPoolExecutor(max_workers=self.max_workers)
+
+        error = None
+        running = {}
+        start = time.perf_counter()
+        with executor:
+            while (not ready.isEmpty() and error is None) or len(running) > 0:
+                while not ready.isEmpty() and len(running) < self.max_workers and error is None:
+                    i = ready.delMin()[2]
+                    self._start_time[i] = time.perf_counter() - start
+                    running[executor.submit(self.jobs[i])] = i
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    i = running.pop(future)
+                    self._finish_time[i] = time.perf_counter() - start
+                    if future.exception() is not None:
+                        if error is None:
+                            error = future.exception()
+                        continue
+                    for j in self.successors[i]:
+                        waiting_for[j] -= 1
+                        if waiting_for[j] == 0:
+                            ready.insert((self.slack[j], -self.tail[j], j))
+        self._makespan = time.perf_counter() - start
+        if error is not None:
+            raise error
+        return self._makespan
+
+    def __str__(self):
+        string = "Job: planned start, actual start, slack \n"
+        for i in range(self.N):
+            actual = self._start_time[i]
+            if actual is not None:
+                actual = actual/self.time_scale
+            string = string + str(i) + ": " + str(self.earliest_start[i]) + ", " + str(actual) + ", " + str(self.slack[i]) + "\n"
+        string = string + "Planned makespan: " + str(self._planned_makespan*self.time_scale) + " seconds\n"
+        string = string + "Actual makespan: " + str(self._makespan) + " seconds"
+        return string
+
+
+
+def main():
+    ewdag = build_ewdag(sys.argv[1], sys.argv[2])
+    time_scale = float(sys.argv[3])
+    max_workers = None
+    if len(sys.argv) > 4:
+        max_workers = int(sys.argv[4])
+    N = ewdag.V()//2 - 1
+    jobs = [None]*N
+    for i in range(N):
+        for edge in ewdag.adjacent(i):
+            jobs[i] = partial(time.sleep, edge.weight()*time_scale)
+    runner = CPM_Runner(ewdag, jobs, max_workers=max_workers, time_scale=time_scale)
+    runner.run()
+    print(runner)
+
+
+if __name__=="__main__": main()
@@ -8,6 +8,12 @@ The implementation is very similar to edge_weighted_graph.py except for a given
 Each element in the array corresponds to a vertex and each of its elements contains a reference linked list where all of the edges from that particular vertex are listed.
 Each node in a linked list contains a reference to a Directed_Edge object (in the node's self.item instance variable).
 
+reverse() returns the edge-weighted digraph with every edge reversed. It is built the first time it is called and then cached
+(algorithms that search backwards from a target, like sp_dijkstra_bidirectional.py, call it for every query).
+The cached reverse is discarded when an edge is added.
+The reversed digraph remembers which edge of the original digraph each of its edges came from (original_edge()),
+so a search on the reversed digraph can return the edges of the original digraph.
+
 
 Example:
 python edge_weighted_digraph.py tinyEWD.txt ' '
@@ -23,6 +29,11 @@ from chapter_4.edge_weighted_digraphs.directed_edge import Directed_Edge
 
 class Edge_Weighted_Digraph:
     def __init__(self, V=None, filename=None, delimiter=None):
+        # The reversed edge-weighted digraph (built by reverse() the first time it is needed)
+        self._reverse = None
+        # Only for a digraph built by reverse(): id() of each of its edges -> the edge of the original digraph that it reverses
+        # (Directed_Edge defines __eq__ by weight, so the edges themselves can't be used as keys)
+        self._original_edge = None
         if V is not None:
             self._V= V
             self._E = 0
@@ -60,11 +71,31 @@ class Edge_Weighted_Digraph:
         # Edge is only added to linked list of vertex that the edge is pointing from
         self.adj[v].add(directed_edge)
         self._E += 1
+        self._reverse = None
     
     # Returns an iterable of edges directed from a given vertex, v (as a bag of edges)
     def adjacent(self, v):
         return self.adj[v]
     
+    # Returns the edge-weighted digraph with all of the edges reversed (w->v with the same weight for every edge v->w)
+    def reverse(self):
+        if self._reverse is None:
+            rev_ewdg = Edge_Weighted_Digraph(V=self._V)
+            rev_ewdg._original_edge = {}
+            for v in range(self._V):
+                for directed_edge in self.adj[v]:
+                    reversed_edge = Directed_Edge(directed_edge.towards_vert(), v, directed_edge.weight())
+                    rev_ewdg.addEdge(reversed_edge)
+                    rev_ewdg._original_edge[id(reversed_edge)] = directed_edge
+            self._reverse = rev_ewdg
+        return self._reverse
+    
+    # For a digraph built by reverse(): returns the edge of the original digraph that reversed_edge reverses
+    def original_edge(self, reversed_edge):
+        if self._original_edge is None:
+            raise Exception("original_edge() is only available on a digraph built by reverse()")
+        return self._original_edge[id(reversed_edge)]
+    
     # returns iterable of all edges
     def edges(self):
         iterable_edges = Bag_LinkedList()
@@ -0,0 +1,142 @@
+"""
+Title: edge_weighted_digraph_csr.py
+Author: Ryan Borchardt
+
+This implements a frozen (read-only) edge-weighted digraph using the compressed sparse row (CSR) representation.
+The implementation is very similar to digraph_csr.py except that a third typed array holds the weight of each edge:
+    1. self.offsets (length V+1): the edges coming from vertex v are stored at positions self.offsets[v] to self.offsets[v+1]-1
+    2. self.targets (length E): the vertex each edge points towards
+    3. self.weights (length E): the weight of each edge
+
+Edge_Weighted_Digraph keeps a Directed_Edge object (plus a _Node object) in memory for every edge.
+The CSR digraph only keeps 12 bytes per edge (4 byte target + 8 byte weight) and creates the Directed_Edge objects when adjacent(v) is called.
+This way Shortest_Paths (Dijkstra, acyclic, Bellman-Ford), Longest_Paths, Directed_Weighted_Cycle etc. run on it unchanged.
+Note that the Directed_Edge objects returned by two calls to adjacent(v) are different objects (with the same from_vert, towards_vert and weight).
+
+The order of each range is the same order that Bag_LinkedList would iterate through the edges (LIFO), so the algorithms examine the edges in exactly the same order.
+
+Time complexity: Proportional to V + E to construct
+Space complexity: Proportional to V + E
+
+Example:
+python edge_weighted_digraph_csr.py tinyEWD.txt ' '
+
+"""
+
+import sys
+from array import array
+
+from chapter_4.edge_weighted_digraphs.directed_edge import Directed_Edge
+from chapter_4.edge_weighted_digraphs.edge_weighted_digraph import Edge_Weighted_Digraph
+
+
+# Builds the offsets, targets and weights arrays from a list of directed edges.
+# Each range is filled from its end towards its beginning so that the order matches the LIFO order of Bag_LinkedList.
+def build_csr_arrays(V, from_list, towards_list, weight_list):
+    outdegree = [0]*V
+    for v in from_list:
+        outdegree[v] += 1
+
+    offsets = array('q', [0])*(V+1)
+    for v in range(V):
+        offsets[v+1] = offsets[v] + outdegree[v]
+
+    targets = array('i', [0])*offsets[V]
+    weights = array('d', [0.0])*offsets[V]
+    next_position = offsets[1:]
+    for i in range(len(from_list)):
+        v = from_list[i]
+        next_position[v] -= 1
+        targets[next_position[v]] = towards_list[i]
+        weights[next_position[v]] = weight_list[i]
+    return offsets, targets, weights
+
+
+class Edge_Weighted_Digraph_CSR:
+    def __init__(self, ewdg=None, filename=None, delimiter=None, offsets=None, targets=None, weights=None):
+        if ewdg is not None:
+            self._V = ewdg.V()
+            self.offsets = array('q', [0])
+            self.targets = array('i')
+            self.weights = array('d')
+            for v in range(self._V):
+                for directed_edge in ewdg.adjacent(v):
+                    self.targets.append(directed_edge.towards_vert())
+                    self.weights.append(directed_edge.weight())
+                self.offsets.append(len(self.targets))
+        elif filename is not None:
+            file_object = open(filename, 'r')
+            self._V = int(file_object.readline())
+            # consuming the line that contains the # of edges
+            file_object.readline()
+
+            from_list = []
+            towards_list = []
+            weight_list = []
+            for line in file_object:
+                line = line.strip().split()
+                if len(line) < 3:
+                    continue
+                from_list.append(int(line[0]))
+                towards_list.append(int(line[1]))
+                weight_list.append(float(line[2]))
+            file_object.close()
+
+            self.offsets, self.targets, self.weights = build_csr_arrays(self._V, from_list, towards_list, weight_list)
+        else:
+            self.offsets = offsets
+            self.targets = targets
+            self.weights = weights
+            self._V = len(offsets) - 1
+        self._E = len(self.targets)
+
+    def V(self):
+        return self._V
+
+    def E(self):
+        return self._E
+
+    # Returns an iterable of edges directed from a given vertex, v (as a list of Directed_Edge objects)
+    def adjacent(self, v):
+        targets = self.targets
+        weights = self.weights
+        return [Directed_Edge(v, targets[i], weights[i]) for i in range(self.offsets[v], self.offsets[v+1])]
+
+    def outdegree(self, v):
+        return self.offsets[v+1] - self.offsets[v]
+
+    # returns iterable of all edges
+    def edges(self):
+        edge_list = []
+        for v in range(self._V):
+            edge_list.extend(self.adjacent(v))
+        return edge_list
+
+    def __str__(self):
+        string = ""
+        for i in range(self._V):
+            string = string + 'Edges coming from vertex ' + str(i) + ':' + '\n'
+            for directed_edge in self.adjacent(i):
+                string = string + str(directed_edge) + '\n'
+            string = string + '\n'
+        return string
+
+
+
+def main():
+    ewdg_csr = Edge_Weighted_Digraph_CSR(filename=sys.argv[1], delimiter=sys.argv[2])
+    print(ewdg_csr.V())
+    print(ewdg_csr.E())
+    print(ewdg_csr)
+
+    # Building the CSR digraph from an existing Edge_Weighted_Digraph object gives the same ranges
+    ewdg = Edge_Weighted_Digraph(filename=sys.argv[1], delimiter=sys.argv[2])
+    same = True
+    for v in range(ewdg.V()):
+        csr_edges = [(e.from_vert(), e.towards_vert(), e.weight()) for e in ewdg_csr.adjacent(v)]
+        bag_edges = [(e.from_vert(), e.towards_vert(), e.weight()) for e in ewdg.adjacent(v)]
+        same = same and csr_edges == bag_edges
+    print('Same as Edge_Weighted_Digraph:', same)
+
+
+if __name__=="__main__": main()
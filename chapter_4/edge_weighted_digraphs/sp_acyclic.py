@@ -62,19 +62,23 @@ from chapter_1.stack.stack_resizingarray import Stack_ResizingArray
 from chapter_4.edge_weighted_digraphs.directed_edge import Directed_Edge
 from chapter_4.edge_weighted_digraphs.edge_weighted_digraph import Edge_Weighted_Digraph
 from chapter_4.edge_weighted_digraphs.topological_ewd import Topological
+from tracing.tracer import Print_Tracer
 
 
 class Shortest_Paths:
-    def __init__(self, ewdg, s):
+    def __init__(self, ewdg, s, tracer=None):
         self._distTo = [float('inf') for i in range(ewdg.V())]
         self._distTo[s] = 0
         
         self.edgeTo = [None]*ewdg.V()
               
         self.s = s
+        # tracer (see tracing/tracer.py) receives an event for every step of the algorithm. None means no tracing.
+        self.tracer = tracer
         # some way of determining the order methodology of choosing v:
         topological_order_stack = Topological(ewdg).order()
-        print(topological_order_stack)
+        if tracer is not None:
+            tracer.topological_order(topological_order_stack)
         
 
         while topological_order_stack.isEmpty()==False:
@@ -83,23 +87,29 @@ class Shortest_Paths:
     
     # vertex or edge relaxation
     def relax(self, ewdg, v):
-        print('All the paths from source vertex ', self.s, ' to vertex ', v, ' have been examined and the shortest path has been permanently determined.')
-        print("from vertex: ",v)
+        # The tracer is checked once per vertex, the loop over the edges has no tracing code in it.
+        if self.tracer is not None:
+            self._relax_traced(ewdg, v)
+            return
         for edge in ewdg.adjacent(v):
-            print('Edge: ', edge)
-            v = edge.from_vert()
             w = edge.towards_vert()
-            
             if self._distTo[v] + edge.weight() < self._distTo[w]:
-                print('This edge is eligible and will be relaxed')
+                self._distTo[w] = self._distTo[v] + edge.weight()
                 self.edgeTo[w] = edge
-                
+
+    # Same as relax() but sends an event to the tracer for every step
+    def _relax_traced(self, ewdg, v):
+        tracer = self.tracer
+        tracer.vertex_examined(self.s, v)
+        for edge in ewdg.adjacent(v):
+            w = edge.towards_vert()
+            if self._distTo[v] + edge.weight() < self._distTo[w]:
                 self._distTo[w] = self._distTo[v] + edge.weight()
                 self.edgeTo[w] = edge
-                print("towards vertex", w)
+                tracer.relax_eligible(edge)
             else:
-                print('This edge is ineligible')
-        print('\n')
+                tracer.relax_ineligible(edge)
+        tracer.vertex_done(v)
 
             
         
@@ -132,7 +142,7 @@ def main():
     
     ewdg = Edge_Weighted_Digraph(filename=sys.argv[1], delimiter=sys.argv[2])
     source_vertex = int(sys.argv[3])
-    sp = Shortest_Paths(ewdg, source_vertex)
+    sp = Shortest_Paths(ewdg, source_vertex, tracer=Print_Tracer())
     
     
     for i in range(ewdg.V()):
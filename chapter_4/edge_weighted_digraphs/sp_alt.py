@@ -0,0 +1,234 @@
+"""
+Title: sp_alt.py
+Author: Ryan Borchardt
+
+A* search with ALT lower bounds (A*, Landmarks and the Triangle inequality) for single source vertex s to single target vertex t queries.
+
+Dijkstra's algorithm (sp_dijkstra.py) settles the vertices in the order of their distance from s, so it explores a "ball" around s in every direction.
+A* settles the vertices in the order of distTo[v] + h(v), where h(v) is a lower bound on the distance from v to t.
+Vertices that are in the wrong direction (away from t) get a large h(v) and are settled late (or never).
+
+Preprocessing (the Landmarks class):
+    1. k landmark vertices are chosen with the farthest-point heuristic:
+        The first landmark is the vertex farthest from vertex 0. Each next landmark is the vertex farthest from all of the landmarks chosen so far
+        (the vertex with the largest distance from its closest landmark). This spreads the landmarks out to the "edges" of the graph.
+    2. For every landmark L, Dijkstra's algorithm is run twice (sp_dijkstra.Shortest_Paths):
+        forward from L on the digraph:           forward[i][v] = distance from L to v
+        forward from L on the reversed digraph:  backward[i][v] = distance from v to L
+    3. The two k by V distance tables are NumPy arrays and can be saved to a file (save()) and loaded again (Landmarks(filename=...)).
+
+The lower bound (triangle inequality) for every landmark L:
+    dist(L,t) <= dist(L,v) + dist(v,t)  so  dist(v,t) >= dist(L,t) - dist(L,v)
+    dist(v,L) <= dist(v,t) + dist(t,L)  so  dist(v,t) >= dist(v,L) - dist(t,L)
+    h(v) is the largest of these bounds over all of the landmarks (and at least 0).
+These lower bounds are consistent (h(v) <= weight(v->w) + h(w) for every edge), so like Dijkstra's algorithm,
+once t is removed from the indexed priority queue its shortest path has been permanently determined and the search stops.
+
+Assumptions:
+1. non-negative edges
+
+Time complexity:
+    Preprocessing: 2k runs of Dijkstra's algorithm, proportional to k*(E*lg(V) + V*lg(V))
+    Query: Proportional to E*lg(V) + V*lg(V) in the worst case, but usually only a small fraction of the vertices are settled. h(v) takes time proportional to k.
+Space complexity: Proportional to k*V (the distance tables)
+
+Example:
+python sp_alt.py mediumEWD.txt ' ' 8
+python sp_alt.py mediumEWD.txt ' ' 8 0 50
+python sp_alt.py tinyEWD.txt ' ' 2 0 6
+
+"""
+
+import sys
+import random
+
+import numpy as np
+
+from chapter_1.stack.stack_resizingarray import Stack_ResizingArray
+from chapter_4.edge_weighted_digraphs.edge_weighted_digraph import Edge_Weighted_Digraph
+from chapter_4.edge_weighted_digraphs.sp_dijkstra import Shortest_Paths
+from chapter_2.priority_queue.indexed_priorityqueue_min_standard import Indexed_PriorityQueue_Min
+
+
+class Landmarks:
+    def __init__(self, ewdg=None, k=None, filename=None):
+        if ewdg is None and filename is None:
+            raise Exception("Landmarks needs either an edge-weighted digraph (ewdg and k) or a file of saved landmark tables (filename)")
+        if ewdg is not None and k is None:
+            raise Exception("The number of landmarks k is needed to select landmarks from ewdg")
+        if ewdg is not None:
+            self._select(ewdg, k)
+        if filename is not None:
+            file_object = open(filename, 'rb')
+            tables = np.load(file_object)
+            self.landmarks = tables['landmarks'].tolist()
+            self.forward = tables['forward']
+            self.backward = tables['backward']
+            file_object.close()
+
+        # h(v) is computed with Python floats, so each column of the tables (the k distances of one vertex) is kept as a list
+        self._forward_columns = self.forward.T.tolist()
+        self._backward_columns = self.backward.T.tolist()
+
+    # Farthest-point selection of k landmarks, and the forward/backward distance tables
+    def _select(self, ewdg, k):
+        V = ewdg.V()
+        k = min(k, V)
+        reverse_ewdg = ewdg.reverse()
+        self.landmarks = []
+        self.forward = np.full((k, V), np.inf)
+        self.backward = np.full((k, V), np.inf)
+
+        # distance from the closest landmark chosen so far (vertices that no landmark reaches are the farthest)
+        farthest = Shortest_Paths(ewdg, 0)
+        closest_distance = np.array([farthest.distTo(v) for v in range(V)])
+        for i in range(k):
+            candidates = closest_distance.copy()
+            candidates[self.landmarks] = -1
+            landmark = int(np.argmax(candidates))
+            self.landmarks.append(landmark)
+
+            forward_sp = Shortest_Paths(ewdg, landmark)
+            backward_sp = Shortest_Paths(reverse_ewdg, landmark)
+            for v in range(V):
+                self.forward[i][v] = forward_sp.distTo(v)
+                self.backward[i][v] = backward_sp.distTo(v)
+
+            if i == 0:
+                closest_distance = self.forward[0].copy()
+            else:
+                closest_distance = np.minimum(closest_distance, self.forward[i])
+
+    def k(self):
+        return len(self.landmarks)
+
+    # Saves the landmarks and the distance tables (NumPy .npz format)
+    def save(self, filename):
+        file_object = open(filename, 'wb')
+        np.savez(file_object, landmarks=np.array(self.landmarks), forward=self.forward, backward=self.backward)
+        file_object.close()
+
+    # Lower bound on the distance from v to t
+    def lower_bound(self, v, t):
+        bound = 0
+        forward_v = self._forward_columns[v]
+        forward_t = self._forward_columns[t]
+        backward_v = self._backward_columns[v]
+        backward_t = self._backward_columns[t]
+        for i in range(len(forward_v)):
+            # inf - inf (a landmark that reaches neither vertex / is reached by neither vertex) gives no information
+            if forward_t[i] - forward_v[i] > bound:
+                bound = forward_t[i] - forward_v[i]
+            if backward_v[i] - backward_t[i] > bound:
+                bound = backward_v[i] - backward_t[i]
+        return bound
+
+
+class Shortest_Path_ALT:
+    def __init__(self, ewdg, s, t, landmarks):
+        self.s = s
+        self.t = t
+        V = ewdg.V()
+        self._distTo = [float('inf')]*V
+        self._distTo[s] = 0
+        self.edgeTo = [None]*V
+        self.settled = [False]*V
+        self._num_settled = 0
+
+        # h[v] is computed the first time v is reached
+        h = [None]*V
+        h[s] = landmarks.lower_bound(s, t)
+
+        ipq = Indexed_PriorityQueue_Min(max_nodes=V)
+        ipq.insert(s, h[s])
+        while ipq:
+            v = ipq.delMin()
+            self.settled[v] = True
+            self._num_settled += 1
+            if v == t:
+                break
+
+            for edge in ewdg.adjacent(v):
+                w = edge.towards_vert()
+                if self.settled[w]:
+                    continue
+                if self._distTo[v] + edge.weight() < self._distTo[w]:
+                    self.edgeTo[w] = edge
+                    self._distTo[w] = self._distTo[v] + edge.weight()
+                    if h[w] is None:
+                        h[w] = landmarks.lower_bound(w, t)
+                    if ipq.contains(w):
+                        ipq.change(w, self._distTo[w] + h[w])
+                    else:
+                        ipq.insert(w, self._distTo[w] + h[w])
+
+    def hasPath(self):
+        return self.settled[self.t]
+
+    # Length of the shortest path from s to t (infinity if there is no path)
+    def dist(self):
+        if self.settled[self.t] == False:
+            return float('inf')
+        return self._distTo[self.t]
+
+    # Number of vertices removed from the indexed priority queue (a measure of the work done by the query)
+    def num_settled(self):
+        return self._num_settled
+
+    # Returns stack of directed edges from s to t. Returns None if there is no path.
+    def path(self):
+        if self.hasPath() == False:
+            return None
+        if self.s == self.t:
+            return "No edges required to reach source vertex from source vertex"
+        path_stack = Stack_ResizingArray()
+        directed_edge = self.edgeTo[self.t]
+        while directed_edge is not None:
+            path_stack.push(directed_edge)
+            directed_edge = self.edgeTo[directed_edge.from_vert()]
+        return path_stack
+
+
+
+def main():
+    ewdg = Edge_Weighted_Digraph(filename=sys.argv[1], delimiter=sys.argv[2])
+    k = int(sys.argv[3])
+
+    # The distance tables are saved next to the graph file and loaded again
+    landmarks_filename = sys.argv[1] + '.landmarks.npz'
+    Landmarks(ewdg, k).save(landmarks_filename)
+    landmarks = Landmarks(filename=landmarks_filename)
+    print('Landmarks:', landmarks.landmarks)
+
+    if len(sys.argv) > 4:
+        s = int(sys.argv[4])
+        t = int(sys.argv[5])
+        alt = Shortest_Path_ALT(ewdg, s, t, landmarks)
+        print("Shortest path from ", s, " to ", t, ":")
+        print(alt.path())
+        print("Total cost:", alt.dist())
+        print("Vertices settled (ALT):", alt.num_settled())
+        print("Vertices settled (Dijkstra stopping at t):", Shortest_Paths(ewdg, s, targets=[t]).num_settled())
+        return
+
+    # Random queries: average number of settled vertices
+    random.seed(1)
+    queries = 200
+    alt_settled = 0
+    dijkstra_settled = 0
+    for _ in range(queries):
+        s = random.randrange(ewdg.V())
+        t = random.randrange(ewdg.V())
+        alt = Shortest_Path_ALT(ewdg, s, t, landmarks)
+        dijkstra = Shortest_Paths(ewdg, s, targets=[t])
+        if abs(alt.dist() - dijkstra.distTo(t)) > 1e-9:
+            raise Exception("ALT and Dijkstra's algorithm found different distances from " + str(s) + " to " + str(t))
+        alt_settled += alt.num_settled()
+        dijkstra_settled += dijkstra.num_settled()
+    print('Average vertices settled over', queries, 'random queries:')
+    print('ALT:', alt_settled/queries)
+    print('Dijkstra stopping at t:', dijkstra_settled/queries)
+    print('Fraction:', round(alt_settled/dijkstra_settled, 3))
+
+
+if __name__== "__main__": main()
@@ -69,11 +69,12 @@ from chapter_4.edge_weighted_digraphs.directed_edge import Directed_Edge
 from chapter_4.edge_weighted_digraphs.edge_weighted_digraph import Edge_Weighted_Digraph
 from chapter_1.queue.queue_linkedlist import Queue_LinkedList
 from chapter_4.edge_weighted_digraphs.directed_weighted_cycle import Directed_Weighted_Cycle
+from tracing.tracer import Print_Tracer
 
 
 
 class Shortest_Paths:
-    def __init__(self, ewdg, s):
+    def __init__(self, ewdg, s, tracer=None):
         self._distTo = [float('inf') for i in range(ewdg.V())]
         self._distTo[s] = 0
         
@@ -89,6 +90,9 @@ class Shortest_Paths:
         
         self.cycle = None
         
+        # tracer (see tracing/tracer.py) receives an event for every step of the algorithm. None means no tracing.
+        self.tracer = tracer
+        
         # Keeps track of the number of relax calls that are required in a pass
             # self.num_rcip = self.num_vaip after each pass 
         self.num_rcip = 1
@@ -101,12 +105,13 @@ class Shortest_Paths:
         
         # some way of determining the order methodology of choosing v
             # In this case, we only look at edges coming from vertices that were relaxed in the previous pass instead of all of the edges as in sp_bellmanford_manual.
-        print('Pass: ', self.pass_count)
+        if tracer is not None:
+            tracer.pass_started(self.pass_count)
         while self.vertex_queue.isEmpty() == False:
             
             if self.pass_count > ewdg.V():
-                print('\n\n Negative cycle is reachable from s. Shortest paths cannot be computed.')
-                print('--------------------------------------------------------------------------------- \n\n')
+                if tracer is not None:
+                    tracer.negative_cycle_found()
                 self.findNegativeCycle()
                 return
             
@@ -118,42 +123,52 @@ class Shortest_Paths:
                 self.num_rcip = self.num_vaip
                 self.num_vaip = 0
                 self.pass_count += 1
-                print('\n')
-                print('Pass: ', self.pass_count)
+                if tracer is not None:
+                    tracer.pass_started(self.pass_count)
             
             
             self.relax(ewdg, v)
             self.num_rcip -= 1
-        print('Queue is empty. Shortest paths for all reachable vertices from s have been found.')
-        print('--------------------------------------------------------------------------------- \n\n')
+        if tracer is not None:
+            tracer.queue_empty()
         
     
     
     def relax(self, ewdg, v):
-        print("from vertex: ",v, " (removed from queue)")
+        # The tracer is checked once per vertex, the loop over the edges has no tracing code in it.
+        if self.tracer is not None:
+            self._relax_traced(ewdg, v)
+            return
         for edge in ewdg.adjacent(v):
-            print('Edge: ', edge)
-            v = edge.from_vert()
             w = edge.towards_vert()
-            
             if self._distTo[v] + edge.weight() < self._distTo[w]:
                 # number of vertices added on this relax
                 self.num_vaip += 1
-                
-                print('This edge is eligible and will be relaxed')
                 self.edgeTo[w] = edge
-                
                 self._distTo[w] = self._distTo[v] + edge.weight()
-                print("towards vertex", w)
-                if self.on_queue[w] == True:
-                    print('The vertex ', w, ' is already on the queue')
+                if self.on_queue[w] == False:
+                    self.vertex_queue.enqueue(w)
+                    self.on_queue[w] = True
 
+    # Same as relax() but sends an event to the tracer for every step
+    def _relax_traced(self, ewdg, v):
+        tracer = self.tracer
+        tracer.vertex_dequeued(v)
+        for edge in ewdg.adjacent(v):
+            w = edge.towards_vert()
+            if self._distTo[v] + edge.weight() < self._distTo[w]:
+                self.num_vaip += 1
+                self.edgeTo[w] = edge
+                self._distTo[w] = self._distTo[v] + edge.weight()
+                tracer.relax_eligible(edge)
+                if self.on_queue[w] == True:
+                    tracer.already_on_queue(w)
                 else:
-                    print('The vertex ', w, ' was not already on the queue. Added to queue.')
+                    tracer.enqueue(w)
                     self.vertex_queue.enqueue(w)
                     self.on_queue[w] = True
             else:
-                print('This edge is ineligible')
+                tracer.relax_ineligible(edge)
 
             
         
@@ -211,7 +226,7 @@ def main():
     
     ewdg = Edge_Weighted_Digraph(filename=sys.argv[1], delimiter=sys.argv[2])
     source_vertex = int(sys.argv[3])
-    sp = Shortest_Paths(ewdg, source_vertex)
+    sp = Shortest_Paths(ewdg, source_vertex, tracer=Print_Tracer())
     
     if sp.hasNegativeCycle() == False:
         for i in range(ewdg.V()):
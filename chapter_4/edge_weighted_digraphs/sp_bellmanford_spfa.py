@@ -0,0 +1,195 @@
+"""
+Title: sp_bellmanford_spfa.py
+Author: Ryan Borchardt
+
+Queue-based Bellman-Ford (also known as SPFA, the shortest path faster algorithm) for production use.
+Same API as sp_bellmanford.py (distTo, hasPathTo, pathTo, hasNegativeCycle, negativeCycle), with no print() statements.
+
+Differences from sp_bellmanford.py:
+    1. The queue of vertices is a deque stored in a ring buffer (a Python list of V+1 slots with a head position and a count)
+       instead of Queue_LinkedList (no _Node object for every enqueue). Each vertex is on the deque at most once, so V+1 slots are enough.
+    2. Small Label First (SLF): a vertex whose distance was lowered is added to the FRONT of the deque if its distance is smaller than the
+       distance of the vertex at the front (otherwise to the back). Vertices that are likely to be on shortest paths are relaxed sooner.
+    3. Large Label Last (LLL): before a vertex is removed from the front of the deque, vertices whose distance is larger than the average
+       distance of the vertices on the deque are moved to the back.
+    4. Negative cycle detection by parent checking instead of counting passes (pass_count > V):
+       After every V successful edge relaxations, the edgeTo (parent) pointers are checked for a cycle.
+       Any cycle of edgeTo pointers is a negative cycle, and if a negative cycle is reachable from s a cycle of edgeTo pointers eventually forms.
+       The check takes time proportional to V, so it costs a constant amount of time per relaxation,
+       and a negative cycle is usually found long before V passes are finished (important for arbitrage.py).
+
+The negative cycle is returned as a stack of directed edges (iterating through the stack goes around the cycle in order), like Directed_Weighted_Cycle.
+
+Time complexity: Proportional to E*V (worst-case), usually close to E
+Space complexity: Proportional to V
+
+Example:
+python sp_bellmanford_spfa.py tinyEWDn.txt ' ' 0
+python sp_bellmanford_spfa.py tinyEWDnc.txt ' ' 0
+python sp_bellmanford_spfa.py mediumEWD.txt ' ' 0
+
+"""
+
+import sys
+from chapter_1.stack.stack_resizingarray import Stack_ResizingArray
+from chapter_4.edge_weighted_digraphs.edge_weighted_digraph import Edge_Weighted_Digraph
+
+
+
+class _Ring_Deque:
+    def __init__(self, capacity):
+        self.items = [0]*capacity
+        self.capacity = capacity
+        self.head = 0
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def front(self):
+        return self.items[self.head]
+
+    def push_front(self, item):
+        self.head = (self.head - 1) % self.capacity
+        self.items[self.head] = item
+        self.count += 1
+
+    def push_back(self, item):
+        self.items[(self.head + self.count) % self.capacity] = item
+        self.count += 1
+
+    def pop_front(self):
+        item = self.items[self.head]
+        self.head = (self.head + 1) % self.capacity
+        self.count -= 1
+        return item
+
+
+class Shortest_Paths:
+    def __init__(self, ewdg, s, slf=True, lll=True):
+        V = ewdg.V()
+        self._distTo = [float('inf')]*V
+        self._distTo[s] = 0
+        self.edgeTo = [None]*V
+        self.s = s
+        self.cycle = None
+
+        deque = _Ring_Deque(V+1)
+        on_queue = [False]*V
+        deque.push_back(s)
+        on_queue[s] = True
+        # sum of the distances of the vertices on the deque (for LLL)
+        queued_sum = 0.0
+
+        relaxations = 0
+        distTo = self._distTo
+        edgeTo = self.edgeTo
+        while len(deque) > 0:
+            if lll:
+                # Move vertices with a larger than average distance to the back (at most one full rotation)
+                average = queued_sum / len(deque)
+                for _ in range(len(deque)):
+                    if distTo[deque.front()] <= average:
+                        break
+                    deque.push_back(deque.pop_front())
+            v = deque.pop_front()
+            on_queue[v] = False
+            queued_sum -= distTo[v]
+
+            for edge in ewdg.adjacent(v):
+                w = edge.towards_vert()
+                if distTo[v] + edge.weight() < distTo[w]:
+                    if on_queue[w]:
+                        queued_sum -= distTo[w]
+                    distTo[w] = distTo[v] + edge.weight()
+                    edgeTo[w] = edge
+                    if on_queue[w]:
+                        queued_sum += distTo[w]
+                    else:
+                        if slf and len(deque) > 0 and distTo[w] < distTo[deque.front()]:
+                            deque.push_front(w)
+                        else:
+                            deque.push_back(w)
+                        on_queue[w] = True
+                        queued_sum += distTo[w]
+
+                    relaxations += 1
+                    if relaxations % V == 0:
+                        self.findNegativeCycle()
+                        if self.cycle is not None:
+                            return
+
+    # Checks the edgeTo (parent) pointers for a cycle. Each vertex has at most one parent, so following the parents from every vertex
+    # (and never following the parents of a vertex twice) takes time proportional to V.
+    def findNegativeCycle(self):
+        V = len(self._distTo)
+        # 0: not visited yet, otherwise the number of the walk that visited the vertex
+        walk_of = [0]*V
+        for start in range(V):
+            if walk_of[start] != 0:
+                continue
+            x = start
+            while walk_of[x] == 0 and self.edgeTo[x] is not None:
+                walk_of[x] = start + 1
+                x = self.edgeTo[x].from_vert()
+            # The walk came back to a vertex of the same walk: the vertices from x back to x are a cycle
+            if walk_of[x] == start + 1:
+                self.cycle = Stack_ResizingArray()
+                edge_list = []
+                edge = self.edgeTo[x]
+                edge_list.append(edge)
+                while edge.from_vert() != x:
+                    edge = self.edgeTo[edge.from_vert()]
+                    edge_list.append(edge)
+                for edge in edge_list:
+                    self.cycle.push(edge)
+                return
+
+    def distTo(self, v):
+        return self._distTo[v]
+
+    def hasPathTo(self,v):
+        return self._distTo[v] != float('inf')
+
+    # Returns stack of directed edges from the source vertex s to a given vertex v.
+    def pathTo(self,v):
+        if self.hasNegativeCycle():
+            raise Exception("A negative cycle is reachable from the source vertex. Shortest paths could not be found.")
+        if self.hasPathTo(v) == False:
+            return None
+        if v == self.s:
+            return "No edges required to reach source vertex from source vertex"
+        path_stack = Stack_ResizingArray()
+        directed_edge = self.edgeTo[v]
+        while directed_edge is not None:
+            path_stack.push(directed_edge)
+            directed_edge = self.edgeTo[directed_edge.from_vert()]
+        return path_stack
+
+    def hasNegativeCycle(self):
+        return self.cycle is not None
+
+    def negativeCycle(self):
+        return self.cycle
+
+
+
+def main():
+    ewdg = Edge_Weighted_Digraph(filename=sys.argv[1], delimiter=sys.argv[2])
+    source_vertex = int(sys.argv[3])
+    sp = Shortest_Paths(ewdg, source_vertex)
+
+    if sp.hasNegativeCycle() == False:
+        for i in range(ewdg.V()):
+            print("Shortest path from ", source_vertex, " to ", i, ":")
+            print(sp.pathTo(i))
+            print("Total cost:", sp.distTo(i))
+            print("\n\n")
+    else:
+        print("A negative cycle is reachable from the source vertex.")
+        print("Shortest paths could not be found.")
+        print("Negative cycle: ")
+        print(sp.negativeCycle())
+
+
+if __name__== "__main__": main()
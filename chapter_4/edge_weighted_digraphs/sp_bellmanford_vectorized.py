@@ -0,0 +1,177 @@
+"""
+Title: sp_bellmanford_vectorized.py
+Author: Ryan Borchardt
+
+Bellman-Ford where every pass relaxes all of the edges at once with NumPy (for large, dense digraphs such as a rates.txt with thousands of currencies).
+Same API as sp_bellmanford.py (distTo, hasPathTo, pathTo, hasNegativeCycle, negativeCycle), with no print() statements.
+
+sp_bellmanford_manual.py relaxes every edge in each of V passes with Python method calls on Directed_Edge objects.
+Here the digraph is three NumPy arrays of length E (from_array, towards_array, weights), and one pass is:
+    candidate = distTo[from_array] + weights                (the proposed distance for the towards vertex of every edge)
+    np.minimum.at(new_distTo, towards_array, candidate)     (scatter-min: new_distTo[w] = min(new_distTo[w], candidate of every edge into w))
+Every edge of a pass uses the distances from the end of the previous pass, so after pass i every shortest path with at most i edges has been found.
+
+1. The passes stop as soon as a pass changes nothing (usually long before V passes).
+2. When a distance is lowered, edgeTo[w] is set to (the index of) an edge that gave the new distance, like relax() does.
+3. A shortest path has at most V-1 edges, so if pass V still lowers a distance, a negative cycle is reachable from s.
+   The edgeTo edges are then checked for a cycle with Directed_Weighted_Cycle (as in sp_bellmanford.py),
+   and more passes are done until the cycle of edgeTo edges appears.
+
+The digraph can be given as an Edge_Weighted_Digraph (or an Edge_Weighted_Digraph_CSR) or directly as the three arrays:
+    Shortest_Paths(ewdg, 0)
+    Shortest_Paths(s=0, V=V, from_array=from_array, towards_array=towards_array, weights=weights)
+
+Time complexity: Proportional to E*V (worst-case), but each pass is a few NumPy operations on arrays of length E
+Space complexity: Proportional to V + E
+
+Example:
+python sp_bellmanford_vectorized.py tinyEWDn.txt ' ' 0
+python sp_bellmanford_vectorized.py tinyEWDnc.txt ' ' 0
+python sp_bellmanford_vectorized.py mediumEWD.txt ' ' 0
+
+"""
+
+import sys
+
+import numpy as np
+
+from chapter_1.stack.stack_resizingarray import Stack_ResizingArray
+from chapter_4.edge_weighted_digraphs.directed_edge import Directed_Edge
+from chapter_4.edge_weighted_digraphs.edge_weighted_digraph import Edge_Weighted_Digraph
+from chapter_4.edge_weighted_digraphs.edge_weighted_digraph_csr import Edge_Weighted_Digraph_CSR
+from chapter_4.edge_weighted_digraphs.directed_weighted_cycle import Directed_Weighted_Cycle
+
+
+
+# Returns the (from_array, towards_array, weights) NumPy arrays of the edges of a digraph
+def edge_arrays(ewdg):
+    if isinstance(ewdg, Edge_Weighted_Digraph_CSR):
+        # The CSR arrays already hold the targets and weights, the from vertex of each edge is found from the offsets
+        offsets = np.frombuffer(ewdg.offsets, dtype=np.int64)
+        from_array = np.repeat(np.arange(ewdg.V(), dtype=np.int64), np.diff(offsets))
+        towards_array = np.frombuffer(ewdg.targets, dtype=np.int32).astype(np.int64)
+        weights = np.frombuffer(ewdg.weights, dtype=np.float64).copy()
+        return from_array, towards_array, weights
+
+    from_list = []
+    towards_list = []
+    weight_list = []
+    for edge in ewdg.edges():
+        from_list.append(edge.from_vert())
+        towards_list.append(edge.towards_vert())
+        weight_list.append(edge.weight())
+    return np.array(from_list, dtype=np.int64), np.array(towards_list, dtype=np.int64), np.array(weight_list, dtype=np.float64)
+
+
+class Shortest_Paths:
+    def __init__(self, ewdg=None, s=0, V=None, from_array=None, towards_array=None, weights=None):
+        if ewdg is not None:
+            V = ewdg.V()
+            from_array, towards_array, weights = edge_arrays(ewdg)
+        self.from_array = from_array
+        self.towards_array = towards_array
+        self.weights = weights
+        self.s = s
+        self.cycle = None
+
+        distTo = np.full(V, np.inf)
+        distTo[s] = 0
+        # index of the edge (in the arrays) that was last used to lower distTo[w], -1 if there is none
+        self._edgeTo = np.full(V, -1, dtype=np.int64)
+        edge_index = np.arange(len(from_array), dtype=np.int64)
+
+        self._num_passes = 0
+        while True:
+            candidate = distTo[from_array] + weights
+            new_distTo = distTo.copy()
+            np.minimum.at(new_distTo, towards_array, candidate)
+            lowered = new_distTo < distTo
+            if not lowered.any():
+                break
+            self._num_passes += 1
+
+            # The edges that gave the new distance of a lowered vertex (if several did, the last one is kept)
+            relaxed = lowered[towards_array] & (candidate == new_distTo[towards_array])
+            self._edgeTo[towards_array[relaxed]] = edge_index[relaxed]
+            distTo = new_distTo
+
+            if self._num_passes >= V:
+                self.findNegativeCycle()
+                if self.cycle is not None:
+                    break
+        self._distTo = distTo
+
+    # Directed_Edge object for the edge at position i of the arrays
+    def _edge(self, i):
+        return Directed_Edge(int(self.from_array[i]), int(self.towards_array[i]), float(self.weights[i]))
+
+    def findNegativeCycle(self):
+        V = len(self._edgeTo)
+        # Build ew_digraph from edges in edgeTo
+        new_graph = Edge_Weighted_Digraph(V=V)
+        for w in range(V):
+            i = self._edgeTo[w]
+            if i == -1:
+                continue
+            edge = self._edge(i)
+            # Directed_Weighted_Cycle doesn't handle a self-loop, but a self-loop in edgeTo is a negative cycle of one edge
+            if edge.from_vert() == w:
+                self.cycle = Stack_ResizingArray()
+                self.cycle.push(edge)
+                return
+            new_graph.addEdge(edge)
+        cycle_finder = Directed_Weighted_Cycle(new_graph)
+        self.cycle = cycle_finder.cycle()
+
+    def distTo(self, v):
+        return float(self._distTo[v])
+
+    def hasPathTo(self,v):
+        return self._distTo[v] != np.inf
+
+    # Number of passes that lowered at least one distance
+    def num_passes(self):
+        return self._num_passes
+
+    # Returns stack of directed edges from the source vertex s to a given vertex v.
+    def pathTo(self,v):
+        if self.hasNegativeCycle():
+            raise Exception("A negative cycle is reachable from the source vertex. Shortest paths could not be found.")
+        if self.hasPathTo(v) == False:
+            return None
+        if v == self.s:
+            return "No edges required to reach source vertex from source vertex"
+        path_stack = Stack_ResizingArray()
+        i = self._edgeTo[v]
+        while i != -1:
+            path_stack.push(self._edge(i))
+            i = self._edgeTo[self.from_array[i]]
+        return path_stack
+
+    def hasNegativeCycle(self):
+        return self.cycle is not None
+
+    def negativeCycle(self):
+        return self.cycle
+
+
+
+def main():
+    ewdg = Edge_Weighted_Digraph(filename=sys.argv[1], delimiter=sys.argv[2])
+    source_vertex = int(sys.argv[3])
+    sp = Shortest_Paths(ewdg, source_vertex)
+
+    if sp.hasNegativeCycle() == False:
+        for i in range(ewdg.V()):
+            print("Shortest path from ", source_vertex, " to ", i, ":")
+            print(sp.pathTo(i))
+            print("Total cost:", sp.distTo(i))
+            print("\n\n")
+    else:
+        print("A negative cycle is reachable from the source vertex.")
+        print("Shortest paths could not be found.")
+        print("Negative cycle: ")
+        print(sp.negativeCycle())
+
+
+if __name__== "__main__": main()
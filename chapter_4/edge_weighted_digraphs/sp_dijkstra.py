@@ -7,6 +7,18 @@ Implementation of API on page 645.
 Assumptions: 
 1. non-negative edges
 
+Besides the single source version on page 645, the constructor also supports:
+    1. Multiple sources: s can be an iterable of vertices. Every source starts on the indexed priority queue with a distance of 0,
+       so distTo(v) is the length of the shortest path from the closest source to v.
+    2. Early termination: targets is an optional iterable of vertices. The algorithm stops as soon as every target has been
+       removed from the indexed priority queue (once a vertex is removed, its shortest path has been permanently determined).
+       For a point-to-point query use targets=[t].
+       The work done is then proportional to the vertices/edges that are closer to the source(s) than the farthest target,
+       instead of every vertex/edge that is reachable from the source(s).
+distTo(), hasPathTo() and pathTo() only give answers for settled vertices (the ones removed from the indexed priority queue).
+Without targets, every vertex reachable from the source(s) is settled (the same as before).
+A vertex that was not settled (unreachable, or not reached before the algorithm stopped) has no path and a distance of infinity.
+
 
 Time complexity: Proportional to E*lg(V) + V*lg(V)
     V delMin() operations (each lg(V))
@@ -17,6 +29,9 @@ Space complexity: Proportional to V
 
 Example:
 python sp_dijkstra.py tinyEWD.txt ' ' 0
+python sp_dijkstra.py tinyEWD.txt ' ' 0 6
+python sp_dijkstra.py mediumEWD.txt ' ' 0 10 50
+python sp_dijkstra.py tinyEWD.txt ' ' 0,5 1
 
 """
 
@@ -25,75 +40,130 @@ from chapter_1.stack.stack_resizingarray import Stack_ResizingArray
 from chapter_4.edge_weighted_digraphs.directed_edge import Directed_Edge
 from chapter_4.edge_weighted_digraphs.edge_weighted_digraph import Edge_Weighted_Digraph
 from chapter_2.priority_queue.indexed_priorityqueue_min_standard import Indexed_PriorityQueue_Min
+from tracing.tracer import Print_Tracer
 
 
 class Shortest_Paths:
-    def __init__(self, ewdg, s):
+    def __init__(self, ewdg, s, tracer=None, targets=None):
         self._distTo = [float('inf') for i in range(ewdg.V())]
-        self._distTo[s] = 0
         
         self.edgeTo = [None]*ewdg.V()
-              
+        
+        # s is either a single source vertex or an iterable of source vertices
         self.s = s
+        try:
+            sources = list(s)
+        except TypeError:
+            sources = [s]
+        self._is_source = [False]*ewdg.V()
+        
+        # self.settled[v] is True once v has been removed from the indexed priority queue (its shortest path is permanent)
+        self.settled = [False]*ewdg.V()
+        self._num_settled = 0
+        # tracer (see tracing/tracer.py) receives an event for every step of the algorithm. None means no tracing.
+        self.tracer = tracer
         # some way of determining the order methodology of choosing v:
         
         self.ipq = Indexed_PriorityQueue_Min(max_nodes=ewdg.V())
-        self.ipq.insert(self.s,0)
+        for source in sources:
+            if self._is_source[source] == False:
+                self._is_source[source] = True
+                self._distTo[source] = 0
+                self.ipq.insert(source,0)
         
+        # Number of targets that have not been settled yet (None: settle every reachable vertex)
+        targets_left = None
+        if targets is not None:
+            is_target = [False]*ewdg.V()
+            targets_left = 0
+            for t in targets:
+                if is_target[t] == False:
+                    is_target[t] = True
+                    targets_left += 1
+            if targets_left == 0:
+                return
 
         while self.ipq:
             # self.ipq.delMin() returns the vertex with the smallest distance value.
-            print('Indexed priority queue:')
-            print(self.ipq)
+            if tracer is not None:
+                tracer.priority_queue(self.ipq)
             v = self.ipq.delMin()
+            self.settled[v] = True
+            self._num_settled += 1
+            
+            if targets_left is not None and is_target[v]:
+                targets_left -= 1
+                if targets_left == 0:
+                    # Every target is settled, the edges coming from v don't need to be relaxed
+                    if tracer is not None:
+                        tracer.vertex_settled(v)
+                    break
             self.relax(ewdg,v)
     
     # vertex or edge relaxation
     def relax(self, ewdg, v):
-        print('The shortest path to vertex ', v, 'has been permanently determined.')
-        print("from vertex: ",v)
+        # The tracer is checked once per vertex, the loop over the edges has no tracing code in it.
+        if self.tracer is not None:
+            self._relax_traced(ewdg, v)
+            return
+        for edge in ewdg.adjacent(v):
+            w = edge.towards_vert()
+            if self._distTo[v] + edge.weight() < self._distTo[w]:
+                self.edgeTo[w] = edge
+                self._distTo[w] = self._distTo[v] + edge.weight()
+                if self.ipq.contains(w):
+                    self.ipq.change(w,self._distTo[w])
+                else:
+                    self.ipq.insert(w,self._distTo[w])
+
+    # Same as relax() but sends an event to the tracer for every step
+    def _relax_traced(self, ewdg, v):
+        tracer = self.tracer
+        tracer.vertex_settled(v)
         for edge in ewdg.adjacent(v):
-            print('Edge: ', edge)
-            v = edge.from_vert()
             w = edge.towards_vert()
-            
             if self._distTo[v] + edge.weight() < self._distTo[w]:
-                print('This edge is eligible and will be relaxed')
                 self.edgeTo[w] = edge
-                
                 self._distTo[w] = self._distTo[v] + edge.weight()
-                print("towards vertex", w)
+                tracer.relax_eligible(edge)
                 if self.ipq.contains(w):
-                    print('The vertex is already on the priority queue')
+                    tracer.pq_change(w, self._distTo[w])
                     self.ipq.change(w,self._distTo[w])
                 else:
-                    print('The vertex was not on the priority queue')
+                    tracer.pq_insert(w, self._distTo[w])
                     self.ipq.insert(w,self._distTo[w])
             else:
-                print('This edge is ineligible')
-        print('\n')
+                tracer.relax_ineligible(edge)
+        tracer.vertex_done(v)
 
             
         
     
     def distTo(self, v):
+        if self.settled[v] == False:
+            return float('inf')
         return self._distTo[v]
         
     def hasPathTo(self,v):
-        return self._distTo[v] != float('inf')
+        return self.settled[v]
+    
+    # Number of vertices that were removed from the indexed priority queue (a measure of the work done by the query)
+    def num_settled(self):
+        return self._num_settled
         
-    # Returns stack of directed edges from the source vertex s to a given vertex v.    
+    # Returns stack of directed edges from the (closest) source vertex to a given vertex v.    
+    # Returns None if v was not settled.
     def pathTo(self,v):
+        if self.hasPathTo(v) == False:
+            return None
+        if self._is_source[v]:
+            return "No edges required to reach source vertex from source vertex"
         path_stack = Stack_ResizingArray()
         directed_edge = self.edgeTo[v]
-        if v == self.s:
-            return "No edges required to reach source vertex from source vertex"
-        vert_from = directed_edge.from_vert()
-        while vert_from != self.s:
+        # The edgeTo entry of every source vertex is None
+        while directed_edge is not None:
             path_stack.push(directed_edge)
-            directed_edge = self.edgeTo[vert_from]
-            vert_from = directed_edge.from_vert()
-        path_stack.push(directed_edge)
+            directed_edge = self.edgeTo[directed_edge.from_vert()]
         return path_stack
 
 
@@ -101,15 +171,30 @@ class Shortest_Paths:
 def main():
     
     ewdg = Edge_Weighted_Digraph(filename=sys.argv[1], delimiter=sys.argv[2])
-    source_vertex = int(sys.argv[3])
-    sp = Shortest_Paths(ewdg, source_vertex)
+    # Several source vertices are separated by commas (0,5)
+    if ',' in sys.argv[3]:
+        source_vertex = [int(v) for v in sys.argv[3].split(',')]
+    else:
+        source_vertex = int(sys.argv[3])
     
+    if len(sys.argv) == 4:
+        sp = Shortest_Paths(ewdg, source_vertex, tracer=Print_Tracer())
+        for i in range(ewdg.V()):
+            print("Shortest path from ", source_vertex, " to ", i, ":")
+            print(sp.pathTo(i))
+            print("Total cost:", sp.distTo(i))
+            print("\n\n")
+        return
     
-    for i in range(ewdg.V()):
-        print("Shortest path from ", source_vertex, " to ", i, ":")
-        print(sp.pathTo(i))
-        print("Total cost:", sp.distTo(i))
+    # Target vertices: stop as soon as they are all settled
+    targets = [int(v) for v in sys.argv[4:]]
+    sp = Shortest_Paths(ewdg, source_vertex, targets=targets)
+    for t in targets:
+        print("Shortest path from ", source_vertex, " to ", t, ":")
+        print(sp.pathTo(t))
+        print("Total cost:", sp.distTo(t))
         print("\n\n")
+    print("Vertices settled:", sp.num_settled(), "of", ewdg.V())
 
         
 
@@ -0,0 +1,164 @@
+"""
+Title: sp_dijkstra_bidirectional.py
+Author: Ryan Borchardt
+
+Bidirectional Dijkstra's algorithm for a single source vertex s to a single target vertex t.
+
+Two Dijkstra searches are run at the same time:
+    1. A forward search from s on the edge-weighted digraph (distF[v] = shortest known distance from s to v)
+    2. A backward search from t on the reversed edge-weighted digraph (distB[v] = shortest known distance from v to t)
+In each step, the search whose indexed priority queue has the smaller minimum distance removes (settles) its next vertex.
+Each search explores a "ball" around its own vertex, and the two balls meet in the middle.
+On road-like graphs, two balls with half of the radius contain far fewer vertices than one ball with the full radius.
+
+Every time the distF[w] or distB[w] of a vertex w is lowered, distF[w] + distB[w] is the length of a path from s to t through w.
+mu is the length of the shortest of these paths found so far.
+
+Stopping criterion:
+    The searches stop when (minimum distance on the forward priority queue) + (minimum distance on the backward priority queue) >= mu.
+    Any path from s to t that is shorter than mu would have to go through a vertex that neither search has settled yet,
+    and every such path has a length of at least the sum of the two minimums.
+    Note that stopping when the first vertex is settled by both searches is NOT correct (the shortest path doesn't have to go through that vertex).
+
+The reversed edge-weighted digraph is built once and cached by Edge_Weighted_Digraph.reverse(), so later queries on the same digraph reuse it.
+
+Assumptions:
+1. non-negative edges
+
+Time complexity: Proportional to E*lg(V) + V*lg(V) in the worst case (same as sp_dijkstra.py), but usually only the vertices close to s or close to t are settled
+Space complexity: Proportional to V (two copies of the distTo and edgeTo arrays and the indexed priority queues)
+
+Example:
+python sp_dijkstra_bidirectional.py tinyEWD.txt ' ' 0 6
+python sp_dijkstra_bidirectional.py mediumEWD.txt ' ' 0 50
+
+"""
+
+import sys
+from chapter_1.stack.stack_resizingarray import Stack_ResizingArray
+from chapter_4.edge_weighted_digraphs.edge_weighted_digraph import Edge_Weighted_Digraph
+from chapter_4.edge_weighted_digraphs.sp_dijkstra import Shortest_Paths
+from chapter_2.priority_queue.indexed_priorityqueue_min_standard import Indexed_PriorityQueue_Min
+
+
+class Shortest_Path_Bidirectional:
+    def __init__(self, ewdg, s, t):
+        self.s = s
+        self.t = t
+        V = ewdg.V()
+
+        # forward search (from s on ewdg) and backward search (from t on the reversed ewdg)
+        self.distF = [float('inf')]*V
+        self.distB = [float('inf')]*V
+        self.edgeToF = [None]*V
+        # edgeToB[v] is an edge of the reversed digraph (pointing from the vertex closer to t towards v)
+        self.edgeToB = [None]*V
+        self._num_settled = 0
+
+        # length of the shortest path from s to t found so far, and the vertex where the two searches met on that path
+        self.mu = float('inf')
+        self.meet = None
+
+        self.distF[s] = 0
+        self.distB[t] = 0
+        if s == t:
+            self.mu = 0
+            self.meet = s
+            return
+
+        reverse_ewdg = ewdg.reverse()
+        # Used by path() to turn the edges of the backward search back into the edges of ewdg
+        self._reverse_ewdg = reverse_ewdg
+        ipqF = Indexed_PriorityQueue_Min(max_nodes=V)
+        ipqB = Indexed_PriorityQueue_Min(max_nodes=V)
+        ipqF.insert(s, 0)
+        ipqB.insert(t, 0)
+
+        while ipqF and ipqB:
+            if ipqF.min() + ipqB.min() >= self.mu:
+                break
+            self._num_settled += 1
+            if ipqF.min() <= ipqB.min():
+                v = ipqF.delMin()
+                self.relax(ewdg, v, ipqF, self.distF, self.edgeToF, self.distB)
+            else:
+                v = ipqB.delMin()
+                self.relax(reverse_ewdg, v, ipqB, self.distB, self.edgeToB, self.distF)
+
+    # Relaxes the edges coming from v for one of the two searches.
+    # other_distTo is the distTo array of the other search: it is used to update mu.
+    def relax(self, ewdg, v, ipq, distTo, edgeTo, other_distTo):
+        for edge in ewdg.adjacent(v):
+            w = edge.towards_vert()
+            if distTo[v] + edge.weight() < distTo[w]:
+                edgeTo[w] = edge
+                distTo[w] = distTo[v] + edge.weight()
+                if ipq.contains(w):
+                    ipq.change(w, distTo[w])
+                else:
+                    ipq.insert(w, distTo[w])
+
+                if distTo[w] + other_distTo[w] < self.mu:
+                    self.mu = distTo[w] + other_distTo[w]
+                    self.meet = w
+
+    def hasPath(self):
+        return self.meet is not None
+
+    # Length of the shortest path from s to t (infinity if there is no path)
+    def dist(self):
+        return self.mu
+
+    # Number of vertices settled by the two searches (a measure of the work done by the query)
+    def num_settled(self):
+        return self._num_settled
+
+    # Returns stack of directed edges from s to t (the first edge of the path is on top of the stack)
+    # Returns None if there is no path.
+    def path(self):
+        if self.hasPath() == False:
+            return None
+        if self.s == self.t:
+            return "No edges required to reach source vertex from source vertex"
+
+        # The part of the path from the meeting vertex to t (found by the backward search).
+        # Each edge of the reversed digraph is replaced by the edge of the original digraph that it reverses (the same object as in ewdg).
+        backward_edges = []
+        v = self.meet
+        while self.edgeToB[v] is not None:
+            reversed_edge = self.edgeToB[v]
+            backward_edges.append(self._reverse_ewdg.original_edge(reversed_edge))
+            v = reversed_edge.from_vert()
+
+        path_stack = Stack_ResizingArray()
+        for i in range(len(backward_edges)-1, -1, -1):
+            path_stack.push(backward_edges[i])
+
+        # The part of the path from s to the meeting vertex (found by the forward search)
+        directed_edge = self.edgeToF[self.meet]
+        while directed_edge is not None:
+            path_stack.push(directed_edge)
+            directed_edge = self.edgeToF[directed_edge.from_vert()]
+        return path_stack
+
+
+
+def main():
+    ewdg = Edge_Weighted_Digraph(filename=sys.argv[1], delimiter=sys.argv[2])
+    s = int(sys.argv[3])
+    t = int(sys.argv[4])
+
+    bidirectional = Shortest_Path_Bidirectional(ewdg, s, t)
+    print("Shortest path from ", s, " to ", t, ":")
+    print(bidirectional.path())
+    print("Total cost:", bidirectional.dist())
+    print("\n")
+
+    one_direction = Shortest_Paths(ewdg, s, targets=[t])
+    print("Total cost (sp_dijkstra.py):", one_direction.distTo(t))
+    print("Vertices settled (bidirectional):", bidirectional.num_settled())
+    print("Vertices settled (sp_dijkstra.py stopping at t):", one_direction.num_settled())
+    print("Vertices settled (sp_dijkstra.py, all vertices):", Shortest_Paths(ewdg, s).num_settled())
+
+
+if __name__== "__main__": main()
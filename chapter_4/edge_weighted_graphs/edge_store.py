@@ -0,0 +1,214 @@
+# Title: edge_store.py
+# Author: Ryan Borchardt
+
+# This implements an edge-weighted graph (undirected or directed) where the edges are kept in a structure-of-arrays edge store
+# instead of one Edge / Directed_Edge object per edge.
+
+# Edge_Weighted_Graph keeps, for every edge, an Edge object (with its own __dict__) and two _Node objects (one in each linked list).
+# Edge_Store keeps every edge as one position (the edge id) in three parallel typed arrays (Python's built-in array module):
+    # 1. self.from_array: the vertex the edge comes from (either() for undirected edges)
+    # 2. self.towards_array: the vertex the edge points towards (the other vertex for undirected edges)
+    # 3. self.weight_array: the weight of the edge
+# This takes 16 bytes per edge.
+# The adjacency lists are kept as a CSR index of edge ids (see graph_csr.py): each undirected edge id appears in the range of both of its vertices.
+# The index is built the first time adjacent() is called after edges were added (time proportional to V + E).
+
+# Edge_View is a lightweight view of one edge (it only holds a reference to the store and the edge id, using __slots__ so it has no __dict__).
+# It has the methods of both Edge (either(), other()) and Directed_Edge (from_vert(), towards_vert()), plus weight() and the 6 comparison methods.
+# adjacent(v) and edges() create the views when they are called, so the views only exist while the algorithms are using them.
+# This way MST_LazyPrim, MST_EagerPrim, MST_Kruskal and the Shortest_Paths classes (Dijkstra, acyclic, Bellman-Ford) run on an Edge_Store unchanged.
+
+# The order of each adjacency list is the same as for Edge_Weighted_Graph / Edge_Weighted_Digraph (LIFO order of Bag_LinkedList).
+
+# Space complexity: Proportional to V + E
+# Time to add an edge: 1 (amortized)
+# Time to iterate through the edges connected to v: degree(v)
+
+# Example:
+# python edge_store.py tinyEWG.txt ' '
+# python edge_store.py ../edge_weighted_digraphs/tinyEWD.txt ' ' directed
+
+
+import sys
+from array import array
+
+
+class Edge_View:
+    __slots__ = ('_store', '_id')
+
+    def __init__(self, store, edge_id):
+        self._store = store
+        self._id = edge_id
+
+    def id(self):
+        return self._id
+
+    def weight(self):
+        return self._store.weight_array[self._id]
+
+    def either(self):
+        return self._store.from_array[self._id]
+
+    def other(self, v):
+        from_vert = self._store.from_array[self._id]
+        towards_vert = self._store.towards_array[self._id]
+        if v == from_vert:
+            return towards_vert
+        elif v == towards_vert:
+            return from_vert
+        else:
+            raise Exception("Edge object does not contain inputted vertex.")
+
+    def from_vert(self):
+        return self._store.from_array[self._id]
+
+    def towards_vert(self):
+        return self._store.towards_array[self._id]
+
+    # Same total order as Edge and Directed_Edge (by weight)
+    def __eq__(self, other):
+        return self.weight() == other.weight()
+
+    def __ne__(self, other):
+        return self.weight() != other.weight()
+
+    def __lt__(self, other):
+        return self.weight() < other.weight()
+
+    def __le__(self, other):
+        return self.weight() <= other.weight()
+
+    def __gt__(self, other):
+        return self.weight() > other.weight()
+
+    def __ge__(self, other):
+        return self.weight() >= other.weight()
+
+    def __str__(self):
+        if self._store.directed:
+            return 'Directed edge coming from vertex ' + str(self.from_vert()) + ' to vertex ' + str(self.towards_vert()) + ' with a weight of: ' + str(self.weight())
+        return 'Edge connecting vertices: ' + str(self.from_vert()) + ' , ' + str(self.towards_vert()) + ' with a weight of: ' + str(self.weight())
+
+
+class Edge_Store:
+    def __init__(self, V=None, filename=None, delimiter=None, directed=False):
+        self.directed = directed
+        self.from_array = array('i')
+        self.towards_array = array('i')
+        self.weight_array = array('d')
+
+        # CSR index of edge ids: the ids of the edges in the adjacency list of v are in self._edge_ids[self._offsets[v]:self._offsets[v+1]]
+        self._offsets = None
+        self._edge_ids = None
+
+        if V is not None:
+            self._V = V
+
+        if filename is not None:
+            file_object = open(filename, 'r')
+            self._V = int(file_object.readline())
+            # consuming the line that contains the # of edges
+            file_object.readline()
+            for line in file_object:
+                line = line.strip().split()
+                if len(line) < 3:
+                    continue
+                self.addEdge(int(line[0]), int(line[1]), float(line[2]))
+            file_object.close()
+
+    def V(self):
+        return self._V
+
+    def E(self):
+        return len(self.weight_array)
+
+    # Adds the edge v-w (or v->w if directed) and returns its edge id
+    def addEdge(self, v, w, weight):
+        self.from_array.append(v)
+        self.towards_array.append(w)
+        self.weight_array.append(weight)
+        # The adjacency index is rebuilt the next time it is needed
+        self._offsets = None
+        return len(self.weight_array) - 1
+
+    def edge(self, edge_id):
+        return Edge_View(self, edge_id)
+
+    # Builds the CSR index of edge ids.
+    # Each range is filled from its end towards its beginning so that the order matches the LIFO order of Bag_LinkedList.
+    def _build_index(self):
+        V = self._V
+        E = len(self.weight_array)
+        degree = [0]*V
+        for v in self.from_array:
+            degree[v] += 1
+        if not self.directed:
+            for w in self.towards_array:
+                degree[w] += 1
+
+        offsets = array('q', [0])*(V+1)
+        for v in range(V):
+            offsets[v+1] = offsets[v] + degree[v]
+
+        edge_ids = array('i', [0])*offsets[V]
+        next_position = offsets[1:]
+        for edge_id in range(E):
+            v = self.from_array[edge_id]
+            next_position[v] -= 1
+            edge_ids[next_position[v]] = edge_id
+            if not self.directed:
+                w = self.towards_array[edge_id]
+                next_position[w] -= 1
+                edge_ids[next_position[w]] = edge_id
+
+        self._offsets = offsets
+        self._edge_ids = edge_ids
+
+    # Returns the ids of the edges connected to v (or coming from v if directed)
+    def adjacent_ids(self, v):
+        if self._offsets is None:
+            self._build_index()
+        return self._edge_ids[self._offsets[v]:self._offsets[v+1]]
+
+    # Returns an iterable of the edges connected to v (or coming from v if directed) as Edge_View objects
+    def adjacent(self, v):
+        return [Edge_View(self, edge_id) for edge_id in self.adjacent_ids(v)]
+
+    # returns iterable of all edges (each edge once)
+    def edges(self):
+        edge_list = []
+        for v in range(self._V):
+            for edge_id in self.adjacent_ids(v):
+                if self.directed or self.from_array[edge_id] == v:
+                    # A self-loop appears twice in the range of v, it is only returned once
+                    if not self.directed and self.towards_array[edge_id] == v and edge_list and edge_list[-1].id() == edge_id:
+                        continue
+                    edge_list.append(Edge_View(self, edge_id))
+        return edge_list
+
+    def __str__(self):
+        string = ""
+        for i in range(self._V):
+            if self.directed:
+                string = string + 'Edges coming from vertex ' + str(i) + ':' + '\n'
+            else:
+                string = string + 'Edges connected to vertex ' + str(i) + ':' + '\n'
+            for edge in self.adjacent(i):
+                string = string + str(edge) + '\n'
+            string = string + '\n'
+        return string
+
+
+
+def main():
+    directed = len(sys.argv) > 3 and sys.argv[3] == 'directed'
+    store = Edge_Store(filename=sys.argv[1], delimiter=sys.argv[2], directed=directed)
+    print(store.V())
+    print(store.E())
+    print(store)
+
+    for edge in store.edges():
+        print(edge)
+
+
+if __name__=="__main__": main()
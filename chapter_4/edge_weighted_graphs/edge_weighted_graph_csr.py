@@ -0,0 +1,157 @@
+# Title: edge_weighted_graph_csr.py
+# Author: Ryan Borchardt
+
+# This implements a frozen (read-only) edge-weighted (undirected) graph using the compressed sparse row (CSR) representation.
+# The implementation is very similar to graph_csr.py except that a third typed array holds the weight of each edge endpoint:
+    # 1. self.offsets (length V+1): the edges connected to vertex v are stored at positions self.offsets[v] to self.offsets[v+1]-1
+    # 2. self.targets (length 2E): the other vertex of each edge (each edge v-w appears twice: once in v's range and once in w's range)
+    # 3. self.weights (length 2E): the weight of each edge
+
+# Edge_Weighted_Graph keeps an Edge object and two _Node objects in memory for every edge.
+# The CSR graph keeps 24 bytes per edge and creates the Edge objects when adjacent(v) or edges() is called.
+# This way MST_LazyPrim, MST_EagerPrim and MST_Kruskal run on it unchanged.
+
+# Each Edge object returned by adjacent(v) is built from v's point of view: edge.either() is v and edge.other(v) is the neighbor.
+# edges() only returns each edge once: from the range of its smaller vertex (a self-loop v-v appears twice in v's range so every other one is skipped).
+
+# Time complexity: Proportional to V + E to construct
+# Space complexity: Proportional to V + E
+
+# Example:
+# python edge_weighted_graph_csr.py tinyEWG.txt ' '
+
+
+import sys
+from array import array
+
+from chapter_4.edge_weighted_graphs.edge import Edge
+from chapter_4.edge_weighted_graphs.edge_weighted_graph import Edge_Weighted_Graph
+
+
+# Builds the offsets, targets and weights arrays from a list of edges.
+# Each range is filled from its end towards its beginning so that the order matches the LIFO order of Bag_LinkedList.
+def build_csr_arrays(V, from_list, towards_list, weight_list):
+    degree = [0]*V
+    for v in from_list:
+        degree[v] += 1
+    for w in towards_list:
+        degree[w] += 1
+
+    offsets = array('q', [0])*(V+1)
+    for v in range(V):
+        offsets[v+1] = offsets[v] + degree[v]
+
+    targets = array('i', [0])*offsets[V]
+    weights = array('d', [0.0])*offsets[V]
+    next_position = offsets[1:]
+    for i in range(len(from_list)):
+        v = from_list[i]
+        w = towards_list[i]
+        next_position[v] -= 1
+        targets[next_position[v]] = w
+        weights[next_position[v]] = weight_list[i]
+        next_position[w] -= 1
+        targets[next_position[w]] = v
+        weights[next_position[w]] = weight_list[i]
+    return offsets, targets, weights
+
+
+class Edge_Weighted_Graph_CSR:
+    def __init__(self, ewg=None, filename=None, delimiter=None, offsets=None, targets=None, weights=None):
+        if ewg is not None:
+            self._V = ewg.V()
+            self.offsets = array('q', [0])
+            self.targets = array('i')
+            self.weights = array('d')
+            for v in range(self._V):
+                for edge in ewg.adjacent(v):
+                    self.targets.append(edge.other(v))
+                    self.weights.append(edge.weight())
+                self.offsets.append(len(self.targets))
+        elif filename is not None:
+            file_object = open(filename, 'r')
+            self._V = int(file_object.readline())
+            # consuming the line that contains the # of edges
+            file_object.readline()
+
+            from_list = []
+            towards_list = []
+            weight_list = []
+            for line in file_object:
+                line = line.strip().split()
+                if len(line) < 3:
+                    continue
+                from_list.append(int(line[0]))
+                towards_list.append(int(line[1]))
+                weight_list.append(float(line[2]))
+            file_object.close()
+
+            self.offsets, self.targets, self.weights = build_csr_arrays(self._V, from_list, towards_list, weight_list)
+        else:
+            self.offsets = offsets
+            self.targets = targets
+            self.weights = weights
+            self._V = len(offsets) - 1
+        self._E = len(self.targets) // 2
+
+    def V(self):
+        return self._V
+
+    def E(self):
+        return self._E
+
+    # Returns an iterable of edges connected to a given vertex, v (as a list of Edge objects)
+    def adjacent(self, v):
+        targets = self.targets
+        weights = self.weights
+        return [Edge(v, targets[i], weights[i]) for i in range(self.offsets[v], self.offsets[v+1])]
+
+    def degree(self, v):
+        return self.offsets[v+1] - self.offsets[v]
+
+    # returns iterable of all edges (each edge only once)
+    def edges(self):
+        edge_list = []
+        for v in range(self._V):
+            self_loop_count = 0
+            for i in range(self.offsets[v], self.offsets[v+1]):
+                w = self.targets[i]
+                if w > v:
+                    edge_list.append(Edge(v, w, self.weights[i]))
+                elif w == v:
+                    if self_loop_count % 2 == 0:
+                        edge_list.append(Edge(v, w, self.weights[i]))
+                    self_loop_count += 1
+        return edge_list
+
+    def __str__(self):
+        string = ""
+        for i in range(self._V):
+            string = string + 'Edges connected to vertex ' + str(i) + ':' + '\n'
+            for edge in self.adjacent(i):
+                string = string + str(edge) + '\n'
+            string = string + '\n'
+        return string
+
+
+
+def main():
+    ewg_csr = Edge_Weighted_Graph_CSR(filename=sys.argv[1], delimiter=sys.argv[2])
+    print(ewg_csr.V())
+    print(ewg_csr.E())
+    print(ewg_csr)
+
+    for edge in ewg_csr.edges():
+        print(edge)
+
+    # Building the CSR graph from an existing Edge_Weighted_Graph object gives the same ranges
+    ewg = Edge_Weighted_Graph(filename=sys.argv[1], delimiter=sys.argv[2])
+    same = True
+    for v in range(ewg.V()):
+        csr_edges = [(e.other(v), e.weight()) for e in ewg_csr.adjacent(v)]
+        bag_edges = [(e.other(v), e.weight()) for e in ewg.adjacent(v)]
+        same = same and csr_edges == bag_edges
+    print('Same as Edge_Weighted_Graph:', same)
+
+
+if __name__=="__main__": main()
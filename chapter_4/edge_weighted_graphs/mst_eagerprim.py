@@ -31,11 +31,14 @@ from chapter_4.edge_weighted_graphs.edge_weighted_graph import Edge_Weighted_Gra
 #from algorithms_python.chapter_1.queue.queue_linkedlist import Queue_LinkedList
 # Created this class specifically for MST
 from chapter_2.priority_queue.indexed_priorityqueue_min_standard import Indexed_PriorityQueue_Min
+from tracing.tracer import Print_Tracer
 
 
 class MST_EagerPrim:
-    def __init__(self, ewg):
+    def __init__(self, ewg, tracer=None):
         
+        # tracer (see tracing/tracer.py) receives an event for every step of the algorithm. None means no tracing.
+        self.tracer = tracer
         self.edgeTo = [None]*ewg.V()
         self.distTo = [float('inf')]*ewg.V()
         
@@ -49,30 +52,37 @@ class MST_EagerPrim:
         
         counter = 1
         while self.priority_queue.isEmpty() == False:
-            print('\n\n\n','Iteration: ', counter)
-            print('current indexed priority queue:')
-            print(self.priority_queue)
+            if tracer is not None:
+                tracer.mst_iteration(counter, self.priority_queue)
             vertex = self.priority_queue.delMin()
             self.visit(ewg, vertex)
             counter+= 1
     
     def visit(self, ewg, vertex):
-        print('Vertex ', vertex, ' has been added to the MST (and removed from the indexed priority queue).')
-        # Remove this vertex (index) from the priority queue:
-        
-        
+        # The tracer is checked once per vertex, the loop over the edges has no tracing code in it.
+        if self.tracer is not None:
+            self._visit_traced(ewg, vertex)
+            return
         for edge in ewg.adjacent(vertex):
             towards_vert = edge.other(vertex)
-            
-            
             if (edge.weight() < self.distTo[towards_vert]) and (self.priority_queue.contains(towards_vert)):
-                print('Edge from ', vertex, ' to ', towards_vert, 'is eligible.')
                 self.edgeTo[towards_vert] = edge
                 self.distTo[towards_vert] = edge.weight()
                 self.priority_queue.change(towards_vert, edge.weight())
-            
+
+    # Same as visit() but sends an event to the tracer for every step
+    def _visit_traced(self, ewg, vertex):
+        tracer = self.tracer
+        tracer.mst_vertex_added(vertex)
+        for edge in ewg.adjacent(vertex):
+            towards_vert = edge.other(vertex)
+            if (edge.weight() < self.distTo[towards_vert]) and (self.priority_queue.contains(towards_vert)):
+                tracer.mst_edge_eligible(vertex, towards_vert)
+                self.edgeTo[towards_vert] = edge
+                self.distTo[towards_vert] = edge.weight()
+                self.priority_queue.change(towards_vert, edge.weight())
             else:
-                print('Edge from ', vertex, ' to ', towards_vert, 'is NOT eligible.') 
+                tracer.mst_edge_ineligible(vertex, towards_vert)
                 
             
         
@@ -91,7 +101,7 @@ class MST_EagerPrim:
 
 def main():
     ewg = Edge_Weighted_Graph(filename=sys.argv[1], delimiter=sys.argv[2])
-    mst = MST_EagerPrim(ewg)
+    mst = MST_EagerPrim(ewg, tracer=Print_Tracer())
     
     print('Edges in MST:')
     for edge in mst.edges():
@@ -0,0 +1,187 @@
+"""
+Title: graph_cache.py
+Author: Ryan Borchardt
+
+A binary on-disk cache for the graph files so that a new process can start answering queries without parsing the text file.
+
+The first time a graph file (for example mediumEWD.txt) is loaded as a given kind of graph, the CSR arrays (see graph_csr.py etc.) are built
+with the bulk loader (bulk_loader.py) and written next to the text file (mediumEWD.txt.ewd.csrcache).
+Every later load opens the cache file with mmap and uses the arrays in the file directly:
+    memoryview(mmap).cast() gives a typed view of each array without reading or copying the file.
+    Only the pages that the queries actually touch are read from disk (by the operating system, on demand).
+
+The cache file stores the size and modification time of the text file it was built from.
+If the text file is changed (its size or modification time is different), the cache file is rebuilt.
+
+Binary format (all values in the native byte order of the machine, every array starts at a multiple of 8 bytes):
+    Header (64 bytes):
+        magic (8 bytes): b'ALGCSR01'
+        kind (int64): 0 = Graph, 1 = Digraph, 2 = Edge_Weighted_Graph, 3 = Edge_Weighted_Digraph
+        V (int64)
+        number of targets (int64): 2E for undirected graphs, E for digraphs
+        size of the text file (int64)
+        modification time of the text file in nanoseconds (int64)
+        unused (16 bytes)
+    offsets: V+1 int64 values
+    targets: int32 values (followed by 4 bytes of padding if there are an odd number of targets)
+    weights: float64 values (only for the edge-weighted kinds)
+
+Time complexity:
+    Cold start (no cache file): Same as the bulk loader + writing the arrays to disk
+    Warm start: Proportional to 1 (independent of V and E) to open, each adjacent(v) call then reads degree(v) values from the mapped file
+
+Example:
+python graph_cache.py edge_weighted_digraphs/mediumEWD.txt ' ' ewd
+python graph_cache.py edge_weighted_graphs/10000EWG.txt ' ' ewg
+"""
+
+import mmap
+import os
+import struct
+import sys
+import time
+
+from chapter_4.undirected_graphs.graph_csr import Graph_CSR
+from chapter_4.directed_graphs.digraph_csr import Digraph_CSR
+from chapter_4.edge_weighted_graphs.edge_weighted_graph_csr import Edge_Weighted_Graph_CSR
+from chapter_4.edge_weighted_digraphs.edge_weighted_digraph_csr import Edge_Weighted_Digraph_CSR
+from chapter_4 import bulk_loader
+
+
+MAGIC = b'ALGCSR01'
+HEADER_FORMAT = '=8s5q16x'
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+# kind: (number stored in the header, bulk loader, CSR class, is weighted)
+KINDS = {
+    'graph': (0, bulk_loader.load_graph_csr, Graph_CSR, False),
+    'digraph': (1, bulk_loader.load_digraph_csr, Digraph_CSR, False),
+    'ewg': (2, bulk_loader.load_edge_weighted_graph_csr, Edge_Weighted_Graph_CSR, True),
+    'ewd': (3, bulk_loader.load_edge_weighted_digraph_csr, Edge_Weighted_Digraph_CSR, True),
+}
+
+
+def cache_filename(filename, kind):
+    return filename + '.' + kind + '.csrcache'
+
+
+# Rounds up to the next multiple of 8 bytes
+def _aligned(num_bytes):
+    return (num_bytes + 7) // 8 * 8
+
+
+# Writes the CSR arrays of csr_graph to a cache file.
+# The file is written under a temporary name first and then renamed, so a process reading the cache never sees a partially written file.
+# If the write fails (for example the disk is full), the temporary file is removed before the exception is raised again.
+def write_cache(csr_graph, kind, cache_path, source_size, source_mtime_ns):
+    kind_number, _, _, weighted = KINDS[kind]
+    temporary_path = cache_path + '.' + str(os.getpid()) + '.tmp'
+    try:
+        with open(temporary_path, 'wb') as file_object:
+            file_object.write(struct.pack(HEADER_FORMAT, MAGIC, kind_number, csr_graph.V(), len(csr_graph.targets), source_size, source_mtime_ns))
+            file_object.write(bytes(csr_graph.offsets))
+            file_object.write(bytes(csr_graph.targets))
+            targets_bytes = len(csr_graph.targets) * 4
+            file_object.write(b'\x00' * (_aligned(targets_bytes) - targets_bytes))
+            if weighted:
+                file_object.write(bytes(csr_graph.weights))
+        os.replace(temporary_path, cache_path)
+    except BaseException:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        raise
+
+
+# Opens a cache file with mmap and returns the CSR graph that uses the mapped arrays.
+# Returns None if the cache file is missing, is for a different kind of graph, is out of date, or is shorter than its header says (truncated).
+def open_cache(kind, cache_path, source_size, source_mtime_ns):
+    kind_number, _, csr_class, weighted = KINDS[kind]
+    if not os.path.exists(cache_path):
+        return None
+
+    file_object = open(cache_path, 'rb')
+    try:
+        mapped_file = mmap.mmap(file_object.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError:
+        # an empty file can't be mapped
+        file_object.close()
+        return None
+    # The mapping stays valid after the file object is closed
+    file_object.close()
+
+    if len(mapped_file) < HEADER_SIZE:
+        mapped_file.close()
+        return None
+    magic, cached_kind, V, num_targets, cached_size, cached_mtime_ns = struct.unpack_from(HEADER_FORMAT, mapped_file, 0)
+    if magic != MAGIC or cached_kind != kind_number or cached_size != source_size or cached_mtime_ns != source_mtime_ns:
+        mapped_file.close()
+        return None
+    if V < 0 or num_targets < 0:
+        mapped_file.close()
+        return None
+    expected_size = HEADER_SIZE + 8*(V+1) + _aligned(4*num_targets)
+    if weighted:
+        expected_size += 8*num_targets
+    if len(mapped_file) < expected_size:
+        mapped_file.close()
+        return None
+
+    view = memoryview(mapped_file)
+    start = HEADER_SIZE
+    offsets = view[start:start + 8*(V+1)].cast('q')
+    start = start + 8*(V+1)
+    targets = view[start:start + 4*num_targets].cast('i')
+    start = start + _aligned(4*num_targets)
+    if not weighted:
+        return csr_class(offsets=offsets, targets=targets)
+    weights = view[start:start + 8*num_targets].cast('d')
+    return csr_class(offsets=offsets, targets=targets, weights=weights)
+
+
+# Returns the CSR graph for a graph file, using (and if needed, writing) the cache file next to it.
+# kind is one of 'graph', 'digraph', 'ewg', 'ewd'
+def load_cached(filename, delimiter=None, kind='ewd'):
+    source_stat = os.stat(filename)
+    cache_path = cache_filename(filename, kind)
+
+    csr_graph = open_cache(kind, cache_path, source_stat.st_size, source_stat.st_mtime_ns)
+    if csr_graph is not None:
+        return csr_graph
+
+    csr_graph = KINDS[kind][1](filename, delimiter)
+    try:
+        write_cache(csr_graph, kind, cache_path, source_stat.st_size, source_stat.st_mtime_ns)
+    except OSError:
+        # If the cache can't be written (for example a read-only directory), the graph is still returned
+        return csr_graph
+    return open_cache(kind, cache_path, source_stat.st_size, source_stat.st_mtime_ns)
+
+
+
+def main():
+    filename = sys.argv[1]
+    delimiter = sys.argv[2]
+    kind = sys.argv[3]
+
+    cache_path = cache_filename(filename, kind)
+    if os.path.exists(cache_path):
+        os.remove(cache_path)
+
+    start = time.perf_counter()
+    cold_graph = load_cached(filename, delimiter, kind)
+    cold_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    warm_graph = load_cached(filename, delimiter, kind)
+    warm_time = time.perf_counter() - start
+
+    print(warm_graph.V(), 'vertices,', warm_graph.E(), 'edges.')
+    print('Cache file:', cache_path, '(' + str(os.path.getsize(cache_path)), 'bytes)')
+    print('Cold start (parse + write cache):', round(cold_time, 6), 'seconds')
+    print('Warm start (mmap cache):         ', round(warm_time, 6), 'seconds')
+    print('Edges from vertex 0:')
+    for item in warm_graph.adjacent(0):
+        print(item)
+
+
+if __name__=="__main__": main()
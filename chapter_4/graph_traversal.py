@@ -0,0 +1,249 @@
+"""
+Title: graph_traversal.py
+Author: Ryan Borchardt
+
+One iterative depth first search / breadth first search engine for every graph that has V() and adjacent(v)
+(Graph_Array_AdjacencyLists, Graph_CSR, Digraph, Digraph_CSR, the cached graphs of graph_cache.py etc.).
+
+dfs_recursive.py, paths_dfs_recursive.py, cycle.py, biparite.py, connected_components.py, directed_dfs.py, directed_cycle.py,
+directed_dfs_orderings.py and scc_kosaraju.py each had their own recursive dfs() method and their own marked array.
+A recursive dfs() uses one Python call per vertex on the current path, so a graph with a path longer than the recursion limit (~1000 vertices)
+crashed them with a RecursionError. Now each of them is a Graph_Visitor: it only says what to do at each event of the search,
+and Graph_Traversal does the search (one loop for all of them).
+
+Events (the instance methods of Graph_Visitor, they do nothing in Graph_Visitor):
+    pre_visit(v): v is marked (the start of the dfs() call of v / v is put on the queue of the BFS)
+    post_visit(v): every edge from v has been examined (the end of the dfs() call of v)
+    tree_edge(v, w): w is marked for the first time through the edge v->w (called before pre_visit(w))
+    back_edge(v, w): w is already marked and is still on the DFS stack (w is an ancestor of v, or v itself)
+    cross_edge(v, w): w is already marked and is finished (the forward and cross edges of a digraph;
+                      in an undirected graph, the edge v-w seen again from v after it was a back edge from w).
+                      In the BFS, every edge to a vertex that is already marked is a cross_edge.
+
+The depth first search:
+    The call stack of the recursive version is an explicit list of (vertex, iterator over its adjacency list).
+    The vertex on top of the stack takes the next vertex w from its iterator: if w is not marked, w is pushed (the recursive call)
+    and the vertex below continues from the same place in its iterator once w is finished.
+    So the events happen in exactly the same order as in the recursive dfs() methods (same preorder, postorder, paths etc.).
+    Bag_LinkedList's iterator has no __iter__() method, so the loop uses next(iterator, None) instead of a for loop.
+
+The events that a visitor doesn't override are never called (this is checked once in the constructor), so a visitor
+that only needs pre_visit() doesn't pay for a Python call on every edge.
+stop() ends the current search (for example once Directed_Cycle has found a cycle). The vertices that were still on the stack
+stay marked but are not post-visited.
+
+The marked array is shared by all of the searches of a Graph_Traversal object, so the clients that search from every vertex
+(connected components, cycles, orderings etc.) only call dfs(v) for the vertices that are not marked yet.
+
+Time complexity: Proportional to V + E (each vertex is marked once, each edge is examined once, twice in an undirected graph)
+Space complexity: Proportional to V (the marked and on stack arrays and the stack or queue)
+
+Example:
+python graph_traversal.py undirected_graphs/tinyCG.txt ' ' 0
+python graph_traversal.py directed_graphs/tinyDG.txt ' ' 0 directed
+Deep graph (a directed path of N vertices, far past the recursion limit):
+python graph_traversal.py --path 1000000
+"""
+
+import sys
+import time
+
+from chapter_4.undirected_graphs.graph_array_adjacencylists import Graph_Array_AdjacencyLists
+from chapter_4.directed_graphs.digraph import Digraph
+
+
+class Graph_Visitor:
+    # The names of all of the events
+    EVENTS = ('pre_visit', 'post_visit', 'tree_edge', 'back_edge', 'cross_edge')
+
+    def pre_visit(self, v):
+        pass
+
+    def post_visit(self, v):
+        pass
+
+    def tree_edge(self, v, w):
+        pass
+
+    def back_edge(self, v, w):
+        pass
+
+    def cross_edge(self, v, w):
+        pass
+
+
+class Graph_Traversal:
+    def __init__(self, graph, visitor=None):
+        self._graph = graph
+        self.marked_array = [False]*graph.V()
+        self.on_stack_array = [False]*graph.V()
+        self._stopped = False
+
+        if visitor is None:
+            visitor = Graph_Visitor()
+        self.visitor = visitor
+        self._pre_visit, self._post_visit, self._tree_edge, self._back_edge, self._cross_edge = \
+            [self._event(visitor, name) for name in Graph_Visitor.EVENTS]
+
+    # Returns the bound method of the event, or None if the visitor doesn't override it
+    @staticmethod
+    def _event(visitor, name):
+        method = getattr(type(visitor), name, None)
+        if method is None or method is getattr(Graph_Visitor, name):
+            return None
+        return getattr(visitor, name)
+
+    def marked(self, v):
+        return self.marked_array[v]
+
+    # Ends the current search (can be called from any event)
+    def stop(self):
+        self._stopped = True
+
+    # Depth first search from s (nothing happens if s is already marked)
+    def dfs(self, s):
+        marked = self.marked_array
+        if marked[s]:
+            return
+        on_stack = self.on_stack_array
+        adjacent = self._graph.adjacent
+        pre_visit = self._pre_visit
+        post_visit = self._post_visit
+        tree_edge = self._tree_edge
+        back_edge = self._back_edge
+        cross_edge = self._cross_edge
+        self._stopped = False
+
+        marked[s] = True
+        on_stack[s] = True
+        if pre_visit is not None:
+            pre_visit(s)
+        stack = [(s, iter(adjacent(s)))]
+        while len(stack) > 0 and not self._stopped:
+            v, neighbours = stack[-1]
+            w = next(neighbours, None)
+            while w is not None:
+                if not marked[w]:
+                    # Tree edge: the recursive call dfs(w) (the iterator of v continues from here once w is finished)
+                    if tree_edge is not None:
+                        tree_edge(v, w)
+                    marked[w] = True
+                    on_stack[w] = True
+                    if pre_visit is not None:
+                        pre_visit(w)
+                    stack.append((w, iter(adjacent(w))))
+                    break
+                if on_stack[w]:
+                    if back_edge is not None:
+                        back_edge(v, w)
+                        if self._stopped:
+                            break
+                elif cross_edge is not None:
+                    cross_edge(v, w)
+                    if self._stopped:
+                        break
+                w = next(neighbours, None)
+            else:
+                # Every edge from v has been examined: the dfs() call of v returns
+                stack.pop()
+                on_stack[v] = False
+                if post_visit is not None:
+                    post_visit(v)
+
+        # After stop(): the vertices that were still on the stack are no longer on it (for the next searches)
+        for v, neighbours in stack:
+            on_stack[v] = False
+
+    # Breadth first search from s (nothing happens if s is already marked)
+    def bfs(self, s):
+        marked = self.marked_array
+        if marked[s]:
+            return
+        adjacent = self._graph.adjacent
+        pre_visit = self._pre_visit
+        post_visit = self._post_visit
+        tree_edge = self._tree_edge
+        cross_edge = self._cross_edge
+        self._stopped = False
+
+        marked[s] = True
+        if pre_visit is not None:
+            pre_visit(s)
+        # The queue is a list and the index of its first vertex (every vertex is added once)
+        queue = [s]
+        first = 0
+        while first < len(queue) and not self._stopped:
+            v = queue[first]
+            first += 1
+            for w in adjacent(v):
+                if not marked[w]:
+                    if tree_edge is not None:
+                        tree_edge(v, w)
+                    marked[w] = True
+                    if pre_visit is not None:
+                        pre_visit(w)
+                    queue.append(w)
+                elif cross_edge is not None:
+                    cross_edge(v, w)
+                if self._stopped:
+                    return
+            if post_visit is not None:
+                post_visit(v)
+
+
+
+# Prints every event (used by the test client)
+class Print_Visitor(Graph_Visitor):
+    def pre_visit(self, v):
+        print('pre_visit', v)
+
+    def post_visit(self, v):
+        print('post_visit', v)
+
+    def tree_edge(self, v, w):
+        print('tree_edge', v, '->', w)
+
+    def back_edge(self, v, w):
+        print('back_edge', v, '->', w)
+
+    def cross_edge(self, v, w):
+        print('cross_edge', v, '->', w)
+
+
+# Counts the vertices that are post-visited (used for the deep graph check)
+class Post_Count_Visitor(Graph_Visitor):
+    def __init__(self):
+        self.count = 0
+
+    def post_visit(self, v):
+        self.count += 1
+
+
+def deep_path(N):
+    digraph = Digraph(V=N)
+    for v in range(N-1):
+        digraph.addEdge(v, v+1)
+    start = time.perf_counter()
+    visitor = Post_Count_Visitor()
+    Graph_Traversal(digraph, visitor).dfs(0)
+    print('Depth first search of a path of', N, 'vertices:', visitor.count, 'vertices post-visited in',
+          round(time.perf_counter() - start, 3), 'seconds (recursion limit:', sys.getrecursionlimit(), ')')
+
+
+def main():
+    if sys.argv[1] == '--path':
+        deep_path(int(sys.argv[2]))
+        return
+    if len(sys.argv) > 4 and sys.argv[4] == 'directed':
+        graph = Digraph(filename=sys.argv[1], delimiter=sys.argv[2])
+    else:
+        graph = Graph_Array_AdjacencyLists(filename=sys.argv[1], delimiter=sys.argv[2])
+    s = int(sys.argv[3])
+
+    print('Depth first search from', s)
+    Graph_Traversal(graph, Print_Visitor()).dfs(s)
+    print('\nBreadth first search from', s)
+    Graph_Traversal(graph, Print_Visitor()).bfs(s)
+
+
+if __name__=="__main__": main()
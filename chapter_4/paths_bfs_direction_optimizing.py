@@ -0,0 +1,264 @@
+"""
+Title: paths_bfs_direction_optimizing.py
+Author: Ryan Borchardt
+
+Shortest paths (fewest edges) from a source vertex with a direction-optimizing breadth first search (Beamer, Asanovic and Patterson).
+Same API as Paths_bfs (paths_bfs.py) and Paths_BFS_Directed (paths_bfs_directed.py): hasPathTo(v) and pathTo(v), for undirected graphs and digraphs.
+
+Paths_bfs and Paths_BFS_Directed expand the frontier top-down: every vertex that is dequeued looks at all of its edges.
+On a small-world graph such as movies.txt (a performer is a few movies away from almost everyone), the middle levels of the search
+have a frontier with most of the edges of the graph, and almost all of those edges point to vertices that are already marked.
+A bottom-up step instead looks at the edges of the vertices that are NOT marked yet and checks whether they come from the frontier.
+When the frontier is large and few vertices are left, that is far fewer edges.
+
+The search is level by level (one NumPy step per level) over a compact copy of the adjacency lists that it builds itself (BFS_Arrays):
+    offsets/targets: the vertices adjacent to v are targets[offsets[v]:offsets[v+1]] (in the same order as graph.adjacent(v))
+    rev_offsets/rev_sources/rev_arcs: the edges pointing towards w (their source vertex and their index in targets)
+    (for an undirected graph, each edge v-w is the two directed edges v->w and w->v)
+The frontier is kept as an array of vertices in queue order and, for the bottom-up steps, as a bitmap (a NumPy bool array, one byte per vertex).
+
+    Top-down step: all of the edges of the frontier are gathered in queue order (the order Paths_bfs dequeues and scans them).
+        For every vertex that isn't marked, the first of these edges that points to it is its edge on the path (np.unique with return_index),
+        and the new frontier is ordered by these first edges: exactly the parents and queue order of the queue-based search.
+    Bottom-up step: the edges pointing towards every unmarked vertex are gathered, and the bitmap tells which ones come from the frontier.
+        To keep the paths identical to the top-down search, each vertex takes the frontier edge that comes first in the top-down order
+        (position of its source in the frontier's edge sequence + its index in the source's range), so all of its edges are looked at
+        (there is no early exit as in the paper).
+
+Switching (Beamer's heuristic):
+    m_f = number of edges from the frontier (cost of a top-down step), m_u = number of edges towards unmarked vertices (cost of a bottom-up step)
+    Top-down -> bottom-up when m_f * alpha > m_u, bottom-up -> top-down when the frontier has fewer than V/beta vertices.
+    The paper uses alpha = 14 because its bottom-up step stops at the first frontier edge. Here a bottom-up step looks at all m_u edges,
+    so the default alpha = 1 switches when the bottom-up step looks at fewer edges. alpha = 0 never switches (top-down only).
+
+levels() reports for every level: the direction of the step, the number of vertices in the frontier and the number of edges examined.
+
+Time complexity:
+    BFS_Arrays: Proportional to V + E (building the arrays from adjacent(v)) + E*lg(E) (the sort of the reverse arrays, done by NumPy)
+    Search: Proportional to the edges examined (at most V + E for each direction) + their sorts (done by NumPy)
+Space complexity: Proportional to V + E
+
+Example:
+python paths_bfs_direction_optimizing.py undirected_graphs/movies.txt '/' 'Bacon, Kevin' symbol
+python paths_bfs_direction_optimizing.py undirected_graphs/tinyCG.txt ' ' 0
+python paths_bfs_direction_optimizing.py directed_graphs/tinyDG.txt ' ' 7 digraph
+"""
+
+import sys
+import time
+from array import array
+
+import numpy as np
+
+from chapter_1.stack.stack_resizingarray import Stack_ResizingArray
+from chapter_4.undirected_graphs.graph_array_adjacencylists import Graph_Array_AdjacencyLists
+from chapter_4.undirected_graphs.symbol_graph import Symbol_Graph
+from chapter_4.undirected_graphs.paths_bfs import Paths_bfs
+from chapter_4.directed_graphs.digraph import Digraph
+from chapter_4.directed_graphs.paths_bfs_directed import Paths_BFS_Directed
+
+
+# The compact adjacency arrays of a graph (can be shared by the searches from different source vertices)
+class BFS_Arrays:
+    def __init__(self, graph):
+        V = graph.V()
+        offsets = array('q', [0])
+        targets = array('i')
+        for v in range(V):
+            targets.extend(graph.adjacent(v))
+            offsets.append(len(targets))
+        self.V = V
+        self.offsets = np.array(offsets, dtype=np.int64)
+        self.targets = np.array(targets, dtype=np.int64)
+        self.outdegree = np.diff(self.offsets)
+
+        sources = np.repeat(np.arange(V, dtype=np.int64), self.outdegree)
+        self.rev_arcs = np.argsort(self.targets, kind='stable')
+        self.rev_sources = sources[self.rev_arcs]
+        self.indegree = np.bincount(self.targets, minlength=V).astype(np.int64)
+        self.rev_offsets = np.zeros(V+1, dtype=np.int64)
+        np.cumsum(self.indegree, out=self.rev_offsets[1:])
+
+
+# Returns the indices of the ranges [starts[i], starts[i] + lengths[i]) back-to-back, and the start of each range in the result
+def _gather(starts, lengths):
+    total = int(lengths.sum())
+    first = np.zeros(len(lengths), dtype=np.int64)
+    np.cumsum(lengths[:-1], out=first[1:])
+    return np.repeat(starts - first, lengths) + np.arange(total, dtype=np.int64), first
+
+
+class Paths_BFS_Direction_Optimizing:
+    def __init__(self, graph, s, alpha=1.0, beta=24.0, arrays=None):
+        if arrays is None:
+            arrays = BFS_Arrays(graph)
+        self.arrays = arrays
+        self.s = s
+        V = arrays.V
+        self.parent = np.full(V, -1, dtype=np.int64)
+        self.dist = np.full(V, -1, dtype=np.int64)
+        # (level, 'top-down' or 'bottom-up', frontier size, edges examined) for every level
+        self.level_list = []
+
+        self._bfs(s, alpha, beta)
+
+    def _bfs(self, s, alpha, beta):
+        arrays = self.arrays
+        V = arrays.V
+        visited = np.zeros(V, dtype=bool)
+        in_frontier = np.zeros(V, dtype=bool)
+        # position[u] + (index of an edge of u in targets) = position of that edge in the top-down order of the frontier's edges
+        position = np.zeros(V, dtype=np.int64)
+
+        visited[s] = True
+        self.dist[s] = 0
+        frontier = np.array([s], dtype=np.int64)
+        m_u = len(arrays.targets) - int(arrays.indegree[s])
+        bottom_up = False
+        unvisited = None
+        level = 0
+        while len(frontier) > 0:
+            m_f = int(arrays.outdegree[frontier].sum())
+            if not bottom_up and m_f*alpha > m_u:
+                bottom_up = True
+                unvisited = np.flatnonzero(~visited)
+            elif bottom_up and len(frontier)*beta < V:
+                bottom_up = False
+
+            if bottom_up:
+                next_frontier, parents, examined = self._bottom_up(frontier, unvisited, in_frontier, position)
+            else:
+                next_frontier, parents, examined = self._top_down(frontier, visited)
+            self.level_list.append((level, 'bottom-up' if bottom_up else 'top-down', len(frontier), examined))
+
+            visited[next_frontier] = True
+            self.parent[next_frontier] = parents
+            self.dist[next_frontier] = level + 1
+            m_u -= int(arrays.indegree[next_frontier].sum())
+            if bottom_up:
+                unvisited = unvisited[~visited[unvisited]]
+            frontier = next_frontier
+            level += 1
+
+    def _top_down(self, frontier, visited):
+        arrays = self.arrays
+        degrees = arrays.outdegree[frontier]
+        arcs, first = _gather(arrays.offsets[frontier], degrees)
+        towards = arrays.targets[arcs]
+        new = ~visited[towards]
+        towards = towards[new]
+        parents = np.repeat(frontier, degrees)[new]
+        # The first edge (in queue order) that reaches each vertex
+        _, first_seen = np.unique(towards, return_index=True)
+        first_seen.sort()
+        return towards[first_seen], parents[first_seen], len(arcs)
+
+    def _bottom_up(self, frontier, unvisited, in_frontier, position):
+        arrays = self.arrays
+        degrees = arrays.outdegree[frontier]
+        first = np.zeros(len(frontier), dtype=np.int64)
+        np.cumsum(degrees[:-1], out=first[1:])
+        in_frontier[frontier] = True
+        position[frontier] = first - arrays.offsets[frontier]
+
+        in_degrees = arrays.indegree[unvisited]
+        rev, _ = _gather(arrays.rev_offsets[unvisited], in_degrees)
+        sources = arrays.rev_sources[rev]
+        hit = in_frontier[sources]
+        owners = np.repeat(unvisited, in_degrees)[hit]
+        sources = sources[hit]
+        keys = position[sources] + arrays.rev_arcs[rev[hit]]
+        in_frontier[frontier] = False
+
+        # Sorted by top-down order, the first edge of each owner is its edge on the path (and the owners come out in queue order)
+        order = np.argsort(keys)
+        owners = owners[order]
+        _, first_seen = np.unique(owners, return_index=True)
+        first_seen.sort()
+        return owners[first_seen], sources[order][first_seen], len(rev)
+
+    def hasPathTo(self, v):
+        return bool(self.dist[v] >= 0)
+
+    def pathTo(self, v):
+        if not self.hasPathTo(v): return None
+        stack = Stack_ResizingArray()
+        x = v
+        while x != self.s:
+            stack.push(x)
+            x = int(self.parent[x])
+        stack.push(self.s)
+        return stack
+
+    # Number of edges on the shortest path from s to v (-1 if there is no path)
+    def distTo(self, v):
+        return int(self.dist[v])
+
+    # Returns a list of (level, direction, frontier size, edges examined)
+    def levels(self):
+        return self.level_list
+
+    def edges_examined(self):
+        return sum(examined for level, direction, size, examined in self.level_list)
+
+    def __str__(self):
+        string = "Level: direction, frontier size, edges examined \n"
+        for level, direction, size, examined in self.level_list:
+            string = string + str(level) + ": " + direction + ", " + str(size) + ", " + str(examined) + "\n"
+        string = string + "Total edges examined: " + str(self.edges_examined())
+        return string
+
+
+
+def main():
+    filename = sys.argv[1]
+    delimiter = sys.argv[2]
+    kind = sys.argv[4] if len(sys.argv) > 4 else 'graph'
+    names = None
+    if kind == 'symbol':
+        sg = Symbol_Graph(filename=filename, delimiter=delimiter)
+        graph = sg.G()
+        s = sg.index(sys.argv[3])
+        names = sg
+    elif kind == 'digraph':
+        graph = Digraph(filename=filename, delimiter=delimiter)
+        s = int(sys.argv[3])
+    else:
+        graph = Graph_Array_AdjacencyLists(filename=filename, delimiter=delimiter)
+        s = int(sys.argv[3])
+
+    start = time.perf_counter()
+    arrays = BFS_Arrays(graph)
+    print('BFS_Arrays:', round(time.perf_counter() - start, 4), 'seconds')
+
+    start = time.perf_counter()
+    top_down = Paths_BFS_Direction_Optimizing(graph, s, alpha=0, arrays=arrays)
+    print('\nTop-down only:', round(time.perf_counter() - start, 4), 'seconds')
+    print(top_down)
+
+    start = time.perf_counter()
+    paths = Paths_BFS_Direction_Optimizing(graph, s, arrays=arrays)
+    print('\nDirection-optimizing:', round(time.perf_counter() - start, 4), 'seconds')
+    print(paths)
+
+    start = time.perf_counter()
+    if kind == 'digraph':
+        queue_paths = Paths_BFS_Directed(graph, s)
+    else:
+        queue_paths = Paths_bfs(graph, s)
+    print('\nQueue-based BFS (' + type(queue_paths).__name__ + '):', round(time.perf_counter() - start, 4), 'seconds')
+
+    different = 0
+    for v in range(graph.V()):
+        if paths.hasPathTo(v) != queue_paths.hasPathTo(v):
+            different += 1
+        elif paths.hasPathTo(v) and list(paths.pathTo(v)) != list(queue_paths.pathTo(v)):
+            different += 1
+    print('Vertices with a different path:', different)
+
+    if names is None:
+        for v in range(min(graph.V(), 10)):
+            print(s, "to", v, ":", paths.pathTo(v))
+
+
+if __name__=="__main__": main()
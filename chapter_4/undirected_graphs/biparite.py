@@ -2,6 +2,9 @@
 # Author: Ryan Borchardt
 
 # This implementation utilizes depth first search.
+# Biparite is a visitor of the iterative depth first search engine (see graph_traversal.py):
+    # tree_edge(v, vertex): vertex gets the other color than v.
+    # back_edge/cross_edge(v, vertex): vertex has already been marked. If it has the same color as v, the graph is not biparite.
 
 # This class extends the functionality of undirected graphs to be able to:
 # 1. Determine if a graph is biparite.
@@ -17,27 +20,29 @@
 
 import sys
 from chapter_4.undirected_graphs.graph_array_adjacencylists import Graph_Array_AdjacencyLists
+from chapter_4.graph_traversal import Graph_Visitor, Graph_Traversal
 
-class Biparite:
+class Biparite(Graph_Visitor):
     def __init__(self, graph):
-        self._marked_array = [False]*graph.V()
         self._biparite_array = [False]*graph.V()
         self._biparite = True
+        traversal = Graph_Traversal(graph, self)
+        self._marked_array = traversal.marked_array
         # For each component in the graph, determine if it is not biparite:
         for i in range(graph.V()):
             if not self._marked_array[i]:
-                self._dfs(graph, i)
+                traversal.dfs(i)
         
-    def _dfs(self, graph, v):
-        self._marked_array[v] = True
-
-        adjacent_list = graph.adj[v] 
-        for vertex in adjacent_list:
-            if (self._marked_array[vertex]) and (self._biparite_array[vertex] == self._biparite_array[v]):
-                self._biparite = False
-            elif not self._marked_array[vertex]:
-                self._biparite_array[vertex] = not self._biparite_array[v] 
-                self._dfs(graph, vertex)
+    def tree_edge(self, v, vertex):
+        self._biparite_array[vertex] = not self._biparite_array[v]
+    
+    def back_edge(self, v, vertex):
+        if self._biparite_array[vertex] == self._biparite_array[v]:
+            self._biparite = False
+    
+    def cross_edge(self, v, vertex):
+        if self._biparite_array[vertex] == self._biparite_array[v]:
+            self._biparite = False
         
 
     
@@ -8,6 +8,9 @@
 # 2. Determine which component a vertex is part of.
 # 3. Determine the number of components in the graph.
 
+# CC is a visitor of the iterative depth first search engine (see graph_traversal.py):
+# each vertex gets the id of the component that is being searched when it is marked (pre_visit).
+
 # Time complexity: Proportional to V + E 
 # Space complexity: Proportional to V
 
@@ -17,24 +20,21 @@
 
 import sys
 from chapter_4.undirected_graphs.graph_array_adjacencylists import Graph_Array_AdjacencyLists
-class CC:
+from chapter_4.graph_traversal import Graph_Visitor, Graph_Traversal
+class CC(Graph_Visitor):
     def __init__(self, graph):
-        self._marked_array = [False]*graph.V()
         self._id = [None]*graph.V()
         self._count = 0
+        traversal = Graph_Traversal(graph, self)
+        self._marked_array = traversal.marked_array
         # For each vertex, determine all of the other verticies that are connected to it.
         for i in range(graph.V()):
             if not self._marked_array[i]:
-                self._dfs(graph, i)
+                traversal.dfs(i)
                 self._count += 1
         
-    def _dfs(self, graph, v):
-        self._marked_array[v] = True
+    def pre_visit(self, v):
         self._id[v] = self._count
-        adjacent_list = graph.adj[v] 
-        for vertex in adjacent_list:
-            if not self._marked_array[vertex]:
-                self._dfs(graph, vertex)
         
 
     
@@ -2,6 +2,9 @@
 # Author: Ryan Borchardt
 
 # This implementation utilizes depth first search. dfs automatically stores the previous vertex as v.
+# Cycle is a visitor of the iterative depth first search engine (see graph_traversal.py):
+    # tree_edge(v, neighbor): neighbor is reached from v, so v is its calling vertex.
+    # back_edge/cross_edge(v, neighbor): neighbor has already been marked. If it is NOT the calling vertex of v, the graph has a cycle.
 
 # This class extends the functionality of undirected graphs to be able to:
 # 1. Determine if a graph contains a cycle or if it is acyclic.
@@ -14,26 +17,31 @@
 
 import sys
 from chapter_4.undirected_graphs.graph_array_adjacencylists import Graph_Array_AdjacencyLists
+from chapter_4.graph_traversal import Graph_Visitor, Graph_Traversal
 
-class Cycle:
+class Cycle(Graph_Visitor):
     def __init__(self, graph):
-        self._marked_array = [False]*graph.V()
+        self._calling_vert = [None]*graph.V()
         self._cycle = False
+        traversal = Graph_Traversal(graph, self)
+        self._marked_array = traversal.marked_array
         # For each component in the graph, determine if there exists a cycle
         for i in range(graph.V()):
              if not self._marked_array[i]:
-                self._dfs(graph, i, i)
+                self._calling_vert[i] = i
+                traversal.dfs(i)
         
-    def _dfs(self, graph, v, calling_vert):
-        self._marked_array[v] = True
-
-        adjacent_list = graph.adj[v] 
-        for neighbor in adjacent_list:
-            if not self._marked_array[neighbor]:
-                self._dfs(graph, neighbor, v)
-            # If neighbor has already been marked and it is NOT the calling vertex, we know we have found a cycle in the graph:
-            elif neighbor != calling_vert:
-                self._cycle = True
+    def tree_edge(self, v, neighbor):
+        self._calling_vert[neighbor] = v
+    
+    # If neighbor has already been marked and it is NOT the calling vertex, we know we have found a cycle in the graph:
+    def back_edge(self, v, neighbor):
+        if neighbor != self._calling_vert[v]:
+            self._cycle = True
+    
+    def cross_edge(self, v, neighbor):
+        if neighbor != self._calling_vert[v]:
+            self._cycle = True
         
 
     
@@ -26,7 +26,11 @@ This class can be directly used to determine for a given vertex (s):
             You should implement DFS as a separate data strucutre or as a separate function.
         Etc.
     
-I have decided to implement depth first search using the same way that it is done in Sedgewick and Wayne's Algorithms (DFS as a separate data structure implemented recursively).
+I have decided to implement depth first search using the same way that it is done in Sedgewick and Wayne's Algorithms (DFS as a separate data structure).
+The search itself was implemented recursively (the call stack keeps track of where each vertex is in its adjacency list),
+which crashes with a RecursionError on graphs with paths longer than Python's recursion limit.
+DFS_Recursive is now a visitor (see graph_traversal.py): the iterative engine Graph_Traversal does the search in the same order as the recursive version
+(same "dfs( w )" and "is already marked." lines) and DFS_Recursive only counts the vertices (pre_visit) and prints the edges (tree_edge, back_edge, cross_edge).
 I implemented depth first seach as a separate data structure implemented iteratively in dfs_iterative.py
     I did this to explicitly show the usage of a stack to implement dfs (the recursive version uses the call stack).
 
@@ -34,8 +38,8 @@ Time complexity: Proportional to V + E
 Space complexity: Proportional to V (the marked array has length V)
 
 It takes time proportional to V+E b/c:
-    1. the line 'self.marked_array[v] =True' is executed V times
-    2. the line 'if self.marked_array[neighbor_vertex] == True' is evaluated 2*E times (E times it is True, E times it is False)
+    1. each vertex is marked (and pre-visited) once: V times
+    2. each neighbor_vertex is checked to see if it's marked 2*E times (E times it is True, E times it is False)
 
 
 After the data structure has been instantiated, marked() and count() take constant time.
@@ -47,26 +51,32 @@ After the data structure has been instantiated, marked() and count() take consta
 
 import sys
 from chapter_4.undirected_graphs.graph_array_adjacencylists import Graph_Array_AdjacencyLists
+from chapter_4.graph_traversal import Graph_Visitor, Graph_Traversal
 
 
-class DFS_Recursive:
+class DFS_Recursive(Graph_Visitor):
     def __init__(self, graph, s):
-        self.marked_array = [False]*graph.V()
         self.count_connected = 0
+        self._traversal = Graph_Traversal(graph, self)
+        self.marked_array = self._traversal.marked_array
         
         self.dfs(graph, s)
     
     def dfs(self, graph, v):
-        self.marked_array[v] = True
+        self._traversal.dfs(v)
+    
+    # The events of the depth first search (see graph_traversal.py):
+    def pre_visit(self, v):
         self.count_connected += 1
-        bag_ll = graph.adj[v]
-        # I implemented the bag_linkedlist data structure to be iterable (each iteration returns the item instance variable which in this case corresponds to the vertex).
-        for neighbor_vertex in bag_ll:
-            if self.marked_array[neighbor_vertex]: 
-                print(neighbor_vertex,'is already marked.')
-            else:
-                print("dfs(",neighbor_vertex,")")
-                self.dfs(graph, neighbor_vertex)
+    
+    def tree_edge(self, v, neighbor_vertex):
+        print("dfs(",neighbor_vertex,")")
+    
+    def back_edge(self, v, neighbor_vertex):
+        print(neighbor_vertex,'is already marked.')
+    
+    def cross_edge(self, v, neighbor_vertex):
+        print(neighbor_vertex,'is already marked.')
 
     # Is v connected to s?
     def marked(self, v):
@@ -0,0 +1,154 @@
+# Title: graph_csr.py
+# Author: Ryan Borchardt
+
+# I am implementing a frozen (read-only) version of the undirected graph using the compressed sparse row (CSR) representation.
+# This implementation is for: unweighted, undirected graphs that allows for self-loops and parallel edges (same as Graph_Array_AdjacencyLists).
+
+# Graph_Array_AdjacencyLists stores each edge endpoint as its own _Node object in a Bag_LinkedList (one Python object + one reference per endpoint).
+# The CSR representation instead packs all of the adjacency lists back-to-back into two typed arrays (Python's built-in array module):
+    # 1. self.offsets (length V+1): the neighbors of vertex v are stored in self.targets[self.offsets[v]:self.offsets[v+1]]
+    # 2. self.targets (length 2E): the packed neighbor array (each undirected edge v-w appears twice: w in v's range and v in w's range)
+# A typed array stores its items as raw machine values (8 bytes per offset, 4 bytes per neighbor) rather than as references to Python objects.
+
+# The order of each adjacency range is the same order that Bag_LinkedList would iterate through the neighbors (LIFO: the last edge read from the file comes first).
+# This way the clients (Paths_bfs, CC, Cycle, etc.) visit the vertices in exactly the same order as they do for Graph_Array_AdjacencyLists.
+
+# The CSR graph is frozen: there is no addEdge(). It is built all at once from:
+    # 1. An existing graph object (anything that provides V() and adjacent(v), for example Graph_Array_AdjacencyLists)
+    # 2. A file in the tinyG.txt format
+    # 3. Prebuilt offsets and targets arrays (used by the bulk loader and the binary graph cache)
+
+# The clients in undirected_graphs access the adjacency lists with graph.adj[v] (rather than graph.adjacent(v)).
+# self.adj is a small indexable object so that graph.adj[v] still works on the CSR graph.
+
+# Constructing the graph:
+    # Time complexity: Proportional to V + E
+        # 1. Count the degree of each vertex (time proportional to E)
+        # 2. Running sum of the degrees to build self.offsets (time proportional to V)
+        # 3. Place each endpoint at its position in self.targets (time proportional to 2E)
+    # Space complexity: Proportional to V + E (but with a much smaller constant than Graph_Array_AdjacencyLists)
+
+# Space required: E + V
+# Time to check whether w is adjacent to v: degree(v)
+# Time to iterate through verticies adjacent to v: degree(v)
+
+# Example:
+# python graph_csr.py tinyG.txt ' '
+
+import sys
+from array import array
+
+from chapter_4.undirected_graphs.graph_array_adjacencylists import Graph_Array_AdjacencyLists
+
+
+# Builds the offsets and targets arrays from a list of edges (v-w for each v, w in zip(from_list, towards_list))
+# Each range is filled from its end towards its beginning so that the order matches the LIFO order of Bag_LinkedList.
+def build_csr_arrays(V, from_list, towards_list):
+    degree = [0]*V
+    for v in from_list:
+        degree[v] += 1
+    for w in towards_list:
+        degree[w] += 1
+
+    offsets = array('q', [0])*(V+1)
+    for v in range(V):
+        offsets[v+1] = offsets[v] + degree[v]
+
+    targets = array('i', [0])*offsets[V]
+    # next_position[v] is the position (in targets) that the next endpoint for v is placed in (one before the previously placed endpoint)
+    next_position = offsets[1:]
+    for i in range(len(from_list)):
+        v = from_list[i]
+        w = towards_list[i]
+        next_position[v] -= 1
+        targets[next_position[v]] = w
+        next_position[w] -= 1
+        targets[next_position[w]] = v
+    return offsets, targets
+
+
+class Graph_CSR:
+    def __init__(self, graph=None, filename=None, delimiter=None, offsets=None, targets=None):
+        if graph is not None:
+            self._build_from_graph(graph)
+        elif filename is not None:
+            self._build_from_file(filename, delimiter)
+        else:
+            self.offsets = offsets
+            self.targets = targets
+            self._V = len(offsets) - 1
+        self._E = len(self.targets) // 2
+        self.adj = Graph_CSR._Adjacency(self)
+
+    # Allows for graph.adj[v] (the clients in undirected_graphs use this instead of graph.adjacent(v))
+    class _Adjacency:
+        def __init__(self, graph):
+            self.graph = graph
+
+        def __getitem__(self, v):
+            return self.graph.adjacent(v)
+
+        def __len__(self):
+            return self.graph.V()
+
+    def _build_from_graph(self, graph):
+        self._V = graph.V()
+        self.offsets = array('q', [0])
+        self.targets = array('i')
+        for v in range(self._V):
+            self.targets.extend(graph.adjacent(v))
+            self.offsets.append(len(self.targets))
+
+    def _build_from_file(self, filename, delimiter):
+        file_object = open(filename, 'r')
+        self._V = int(file_object.readline())
+        # consuming the line that contains the # of edges (E is determined from the number of edge lines)
+        file_object.readline()
+
+        from_list = []
+        towards_list = []
+        for line_string in file_object:
+            line_list = line_string.strip().split(delimiter)
+            if len(line_list) < 2:
+                continue
+            from_list.append(int(line_list[0]))
+            towards_list.append(int(line_list[1]))
+        file_object.close()
+
+        self.offsets, self.targets = build_csr_arrays(self._V, from_list, towards_list)
+
+    def V(self):
+        return self._V
+
+    def E(self):
+        return self._E
+
+    # Returns an iterable for the verticies adjacent to v (a slice of the packed neighbor array)
+    def adjacent(self, v):
+        return self.targets[self.offsets[v]:self.offsets[v+1]]
+
+    def degree(self, v):
+        return self.offsets[v+1] - self.offsets[v]
+
+    def __str__(self):
+        returned_string = str(self._V) + ' verticies, ' + str(self._E) + ' edges.' + '\n'
+        for v in range(self._V):
+            returned_string = returned_string + 'Adjacency range at index ' + str(v) + ': ' + str(list(self.adjacent(v))) + '\n'
+        return returned_string
+
+
+def main():
+    filename = sys.argv[1]
+    delimiter = sys.argv[2]
+
+    csr_graph = Graph_CSR(filename=filename, delimiter=delimiter)
+    print(csr_graph)
+
+    # Building the CSR graph from an existing Graph_Array_AdjacencyLists object gives the same adjacency ranges
+    graph = Graph_Array_AdjacencyLists(filename=filename, delimiter=delimiter)
+    csr_from_graph = Graph_CSR(graph=graph)
+    for v in range(graph.V()):
+        print(v, list(csr_graph.adjacent(v)) == list(graph.adjacent(v)) == list(csr_from_graph.adjacent(v)))
+
+
+if __name__=="__main__": main()
@@ -8,6 +8,10 @@
 # 2. Determine a path between two connected vertices.  
 
 
+# Paths_dfs is a visitor of the iterative depth first search engine (see graph_traversal.py):
+# the engine marks the vertices and Paths_dfs only records the edge that each vertex was reached from (tree_edge).
+# The paths are the same as the ones of the recursive version, without its recursion limit.
+
 # Time complexity: Proportional to V + E (see explanation in dfs_recursive.py)
 # Space complexity: Proportional to V
 
@@ -20,23 +24,23 @@
 import sys
 from chapter_4.undirected_graphs.graph_array_adjacencylists import Graph_Array_AdjacencyLists
 from chapter_1.stack.stack_resizingarray import Stack_ResizingArray
+from chapter_4.graph_traversal import Graph_Visitor, Graph_Traversal
 
-class Paths_dfs:
+class Paths_dfs(Graph_Visitor):
     def __init__(self, graph, s):
         self.path_array = [None]*graph.V()
-        self.marked_array = [False]*graph.V()
         self.s = s
+        self._traversal = Graph_Traversal(graph, self)
+        self.marked_array = self._traversal.marked_array
         
         self.dfs(graph, s)
     
     def dfs(self, graph, v):
-        self.marked_array[v] = True
-        bag_ll = graph.adj[v]
-        # I implemented the bag_linkedlist data structure to be iterable (each iteration returns the item instance variable which in this case corresponds to the vertex).
-        for neighbor_vertex in bag_ll:
-            if not self.marked_array[neighbor_vertex]:
-                self.path_array[neighbor_vertex] = v
-                self.dfs(graph, neighbor_vertex)
+        self._traversal.dfs(v)
+    
+    # neighbor_vertex is reached for the first time from v
+    def tree_edge(self, v, neighbor_vertex):
+        self.path_array[neighbor_vertex] = v
     
     def hasPathTo(self, v):
         return self.marked_array[v]
@@ -0,0 +1,256 @@
+"""
+Title: tracer.py
+Author: Ryan Borchardt
+
+A shared tracing (event) interface for the algorithms that used to print() every step of their work:
+    Shortest_Paths in sp_dijkstra.py, sp_bellmanford.py and sp_acyclic.py, Longest_Paths in lp_acyclic.py, MST_EagerPrim and quicksort.
+
+The print() statements were very useful for understanding how the algorithms work, but they made the algorithms unusable on larger inputs
+(on mediumEWD.txt, printing takes more time than Dijkstra's algorithm itself).
+
+Each of these algorithms now takes an optional tracer argument:
+    1. tracer=None (the default): nothing is traced. The algorithm checks once per vertex (or once per partition/exchange in quicksort) whether
+       a tracer is attached, and the per-edge loops are the plain algorithm with no tracing code in them.
+    2. tracer=Print_Tracer(): prints the same step-by-step explanation that the algorithms used to print (the test clients in main() use this).
+    3. tracer=Counting_Tracer(): counts how many times each event happens (useful for benchmarks: # of relaxations, # of exchanges etc.).
+
+The events are the instance methods of Tracer (they do nothing in Tracer). A new kind of tracer only needs to override the events it cares about.
+
+Example:
+python tracer.py
+"""
+
+
+class Tracer:
+    # The names of all of the events (used by Counting_Tracer)
+    EVENTS = ('priority_queue', 'topological_order', 'vertex_settled', 'vertex_examined', 'vertex_dequeued', 'vertex_done',
+              'relax_eligible', 'relax_ineligible', 'pq_insert', 'pq_change', 'enqueue', 'already_on_queue',
+              'pass_started', 'negative_cycle_found', 'queue_empty',
+              'mst_iteration', 'mst_vertex_added', 'mst_edge_eligible', 'mst_edge_ineligible',
+              'shuffled', 'partition', 'exchange', 'partition_done', 'sort_skipped')
+
+    # ---- Shortest paths (sp_dijkstra.py, sp_bellmanford.py, sp_acyclic.py) and longest paths (lp_acyclic.py) ----
+
+    # The current state of the indexed priority queue (before the vertex with the smallest distance is removed)
+    def priority_queue(self, pq):
+        pass
+
+    # The order in which the vertices will be relaxed (the topological order)
+    def topological_order(self, order):
+        pass
+
+    # Vertex v was removed from the priority queue / topological order: its shortest (or longest) path is final
+    def vertex_settled(self, v, path='shortest'):
+        pass
+
+    # Vertex v was pulled from the topological order: all of the paths from s to v have been examined
+    def vertex_examined(self, s, v):
+        pass
+
+    # Vertex v was removed from the queue (Bellman-Ford)
+    def vertex_dequeued(self, v):
+        pass
+
+    # All of the edges coming from v have been relaxed
+    def vertex_done(self, v):
+        pass
+
+    # The edge is eligible and has been relaxed
+    def relax_eligible(self, edge):
+        pass
+
+    # The edge is not eligible
+    def relax_ineligible(self, edge):
+        pass
+
+    # w was inserted into / had its key changed in the indexed priority queue
+    def pq_insert(self, w, key):
+        pass
+
+    def pq_change(self, w, key):
+        pass
+
+    # w was added to the queue / was already on the queue (Bellman-Ford)
+    def enqueue(self, w):
+        pass
+
+    def already_on_queue(self, w):
+        pass
+
+    # A new pass of Bellman-Ford started
+    def pass_started(self, pass_count):
+        pass
+
+    def negative_cycle_found(self):
+        pass
+
+    def queue_empty(self):
+        pass
+
+    # ---- Minimum spanning tree (mst_eagerprim.py) ----
+
+    def mst_iteration(self, counter, pq):
+        pass
+
+    def mst_vertex_added(self, v):
+        pass
+
+    # The edge v-w is eligible: the key of w is changed on the indexed priority queue
+    def mst_edge_eligible(self, v, w):
+        pass
+
+    def mst_edge_ineligible(self, v, w):
+        pass
+
+    # ---- Quicksort (quicksort.py) ----
+
+    def shuffled(self, a):
+        pass
+
+    # The subarray a[lo..hi] is about to be partitioned on the partitioning element v
+    def partition(self, a, lo, hi, v):
+        pass
+
+    # a[i] and a[j] were exchanged
+    def exchange(self, a, i, j):
+        pass
+
+    # The partitioning element v (previously at a[lo]) was exchanged into its final position j
+    def partition_done(self, a, lo, j, v):
+        pass
+
+    def sort_skipped(self, lo, hi):
+        pass
+
+
+# Prints the same step-by-step explanation that the algorithms printed before the tracer was added.
+class Print_Tracer(Tracer):
+    def priority_queue(self, pq):
+        print('Indexed priority queue:')
+        print(pq)
+
+    def topological_order(self, order):
+        print(order)
+
+    def vertex_settled(self, v, path='shortest'):
+        print('The', path, 'path to vertex ', v, 'has been permanently determined.')
+        print("from vertex: ", v)
+
+    def vertex_examined(self, s, v):
+        print('All the paths from source vertex ', s, ' to vertex ', v, ' have been examined and the shortest path has been permanently determined.')
+        print("from vertex: ", v)
+
+    def vertex_dequeued(self, v):
+        print("from vertex: ", v, " (removed from queue)")
+
+    def vertex_done(self, v):
+        print('\n')
+
+    def relax_eligible(self, edge):
+        print('Edge: ', edge)
+        print('This edge is eligible and will be relaxed')
+        print("towards vertex", edge.towards_vert())
+
+    def relax_ineligible(self, edge):
+        print('Edge: ', edge)
+        print('This edge is ineligible')
+
+    def pq_insert(self, w, key):
+        print('The vertex was not on the priority queue')
+
+    def pq_change(self, w, key):
+        print('The vertex is already on the priority queue')
+
+    def enqueue(self, w):
+        print('The vertex ', w, ' was not already on the queue. Added to queue.')
+
+    def already_on_queue(self, w):
+        print('The vertex ', w, ' is already on the queue')
+
+    def pass_started(self, pass_count):
+        if pass_count > 1:
+            print('\n')
+        print('Pass: ', pass_count)
+
+    def negative_cycle_found(self):
+        print('\n\n Negative cycle is reachable from s. Shortest paths cannot be computed.')
+        print('--------------------------------------------------------------------------------- \n\n')
+
+    def queue_empty(self):
+        print('Queue is empty. Shortest paths for all reachable vertices from s have been found.')
+        print('--------------------------------------------------------------------------------- \n\n')
+
+    def mst_iteration(self, counter, pq):
+        print('\n\n\n', 'Iteration: ', counter)
+        print('current indexed priority queue:')
+        print(pq)
+
+    def mst_vertex_added(self, v):
+        print('Vertex ', v, ' has been added to the MST (and removed from the indexed priority queue).')
+
+    def mst_edge_eligible(self, v, w):
+        print('Edge from ', v, ' to ', w, 'is eligible.')
+
+    def mst_edge_ineligible(self, v, w):
+        print('Edge from ', v, ' to ', w, 'is NOT eligible.')
+
+    def shuffled(self, a):
+        print('Shuffled array with seed(1):', a)
+        print('\n')
+
+    def partition(self, a, lo, hi, v):
+        print('Bounds of subarray being partitioned from lo to hi:', lo, 'to ', hi)
+        print('Partitioning element:', v)
+
+    def exchange(self, a, i, j):
+        print('Exchanged: a[', i, '] with a[', j, '].')
+
+    def partition_done(self, a, lo, j, v):
+        # a[lo] now holds the item that was at a[j] before the exchange
+        print('Exchanged the partitioning element', v, 'at index:', lo, 'with a[j]', a[lo], 'at index:', j)
+        print('Final index position:', j, 'for the partitioning element:', v)
+        print(a)
+        print('Returned j value:', j)
+        print('\n')
+
+    def sort_skipped(self, lo, hi):
+        print('_sort returned without partitioning b/c hi <= lo:', hi, '<=', lo, '\n')
+
+
+# Counts the number of times each event happens.
+# self.counts is a dictionary (event name: count). Events that never happened are not in the dictionary.
+class Counting_Tracer(Tracer):
+    def __init__(self):
+        self.counts = {}
+
+    def count(self, event):
+        return self.counts.get(event, 0)
+
+    def __str__(self):
+        string = ''
+        for event in Tracer.EVENTS:
+            if event in self.counts:
+                string = string + event + ': ' + str(self.counts[event]) + '\n'
+        return string
+
+
+# Each event of Counting_Tracer increments the count of that event
+def _counting_event(event):
+    def counting_event(self, *args, **kwargs):
+        self.counts[event] = self.counts.get(event, 0) + 1
+    return counting_event
+
+for _event in Tracer.EVENTS:
+    setattr(Counting_Tracer, _event, _counting_event(_event))
+
+
+
+def main():
+    tracer = Counting_Tracer()
+    tracer.relax_eligible(None)
+    tracer.relax_eligible(None)
+    tracer.relax_ineligible(None)
+    print(tracer)
+
+
+if __name__=="__main__": main()